@@ -0,0 +1,84 @@
+"""
+Verificação de paridade e tempo de categorize_batch com categorize_article.
+
+Limpa os artigos de data/raw, extrai as palavras-chave de cada um e compara
+as categorias (inclusive a ordem) das duas implementações, com as
+palavras-chave em listas e em arrays numpy (como lidas de uma coluna de
+listas do Parquet). Sai com código 1 se algum artigo divergir.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/categorizer_parity.py
+    python benchmarks/categorizer_parity.py --input data/raw --repeat 5
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from src.processors.text_processor import TextProcessor
+from src.processors.categorizer import categorize_article, categorize_batch
+from src.utils.helpers import iter_articles
+
+# Casos em que só as palavras-chave definem as categorias, em ordem diferente da do dicionário
+KEYWORD_ONLY_CASES = [
+    ('texto sem termos de categoria', ['legisla', 'diari']),
+    ('texto sem termos de categoria', ['diari', 'legisla']),
+]
+
+def parse_arguments():
+    """Analisa os argumentos da linha de comando"""
+    parser = argparse.ArgumentParser(description='Paridade de categorize_batch com categorize_article')
+
+    parser.add_argument('--input', type=str, default='data/raw',
+                        help='Diretório com os artigos coletados')
+
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Número de repetições na medida de tempo')
+
+    return parser.parse_args()
+
+def main():
+    """Função principal da verificação"""
+    args = parse_arguments()
+    text_processor = TextProcessor()
+
+    texts, keywords = [], []
+    for article in iter_articles(args.input):
+        text = text_processor.clean_text(article.get('content') or article.get('abstract') or article.get('title'))
+        texts.append(text)
+        keywords.append(text_processor.extract_keywords(text))
+    for text, case_keywords in KEYWORD_ONLY_CASES:
+        texts.append(text)
+        keywords.append(case_keywords)
+
+    expected = [categorize_article(text, doc_keywords) for text, doc_keywords in zip(texts, keywords)]
+
+    mismatches = 0
+    for name, batch_keywords in (('listas', keywords),
+                                 ('arrays', [np.array(doc_keywords, dtype=object) for doc_keywords in keywords])):
+        for text, single, batch in zip(texts, expected, categorize_batch(texts, batch_keywords)):
+            if single != batch:
+                mismatches += 1
+                print(f"Diferença ({name}): {text[:60]!r}: {single} != {batch}")
+
+    timings = {}
+    for name, categorize in (
+        ('categorize_article', lambda: [categorize_article(t, k) for t, k in zip(texts, keywords)]),
+        ('categorize_batch', lambda: categorize_batch(texts, keywords)),
+    ):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            categorize()
+        timings[name] = (time.perf_counter() - start) / args.repeat
+
+    print(f"{len(texts)} textos, {mismatches} com categorias diferentes")
+    for name, elapsed in timings.items():
+        print(f"{name:<20} {elapsed * 1000:8.1f} ms")
+
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == '__main__':
+    main()
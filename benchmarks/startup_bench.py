@@ -0,0 +1,134 @@
+"""
+Benchmark de inicialização de scraper.py e report.py.
+
+Mede, em subprocessos novos:
+  - o tempo de `--help` de cada script e os módulos mais caros segundo
+    `python -X importtime`;
+  - o tempo até a primeira requisição de rede de uma coleta de uma única
+    fonte (a conexão é interceptada, então nada é enviado de fato).
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/startup_bench.py
+    python benchmarks/startup_bench.py --source infrafm --runs 5 --max-seconds 1.0
+
+Sai com código 1 se alguma medida passar de --max-seconds.
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Marcador impresso pelo subprocesso na primeira tentativa de conexão
+FIRST_REQUEST_MARKER = 'PRIMEIRA_REQUISICAO'
+
+# Intercepta a resolução de nomes e a conexão antes de executar scraper.main()
+FIRST_REQUEST_SNIPPET = f"""
+import os, sys, socket
+
+def _first_request(*args, **kwargs):
+    print({FIRST_REQUEST_MARKER!r}, flush=True)
+    os._exit(0)
+
+socket.getaddrinfo = _first_request
+socket.socket.connect = _first_request
+sys.argv = ['scraper.py', '--sources', {{source!r}}, '--limit', '1', '--log-level', 'ERROR']
+sys.path.insert(0, {ROOT!r})
+import scraper
+scraper.main()
+"""
+
+def parse_arguments():
+    """Analisa os argumentos da linha de comando"""
+    parser = argparse.ArgumentParser(description='Benchmark de inicialização dos scripts')
+
+    parser.add_argument('--runs', type=int, default=3,
+                        help='Número de execuções de cada medida (usa-se a mediana)')
+
+    parser.add_argument('--source', choices=['abrafac', 'infrafm', 'ifma', 'google_scholar'], default='abrafac',
+                        help='Fonte usada na medida de tempo até a primeira requisição')
+
+    parser.add_argument('--max-seconds', type=float, default=1.0,
+                        help='Tempo máximo aceito para cada medida')
+
+    parser.add_argument('--top', type=int, default=10,
+                        help='Número de módulos mais caros listados')
+
+    return parser.parse_args()
+
+def time_command(command, marker=None):
+    """
+    Executa um comando e mede o tempo até o fim (ou até o marcador na saída).
+
+    Returns:
+        float: Tempo decorrido em segundos
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    if marker is None:
+        process.communicate()
+        return time.perf_counter() - start
+
+    for line in process.stdout:
+        if marker in line:
+            elapsed = time.perf_counter() - start
+            break
+    else:
+        elapsed = float('nan')
+    process.wait()
+    return elapsed
+
+def slowest_imports(script, top):
+    """
+    Lista os módulos com maior tempo cumulativo de importação em `script --help`.
+
+    Returns:
+        list: Tuplas (microssegundos cumulativos, módulo)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', script, '--help'],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        # Formato: "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        imports.append((int(cumulative), module.rstrip()))
+
+    # Apenas módulos de primeiro nível (sem indentação) somam no total
+    top_level = [(cumulative, module.strip()) for cumulative, module in imports if not module.startswith('  ')]
+    return sorted(top_level, reverse=True)[:top]
+
+def main():
+    """Função principal do benchmark"""
+    args = parse_arguments()
+    failed = False
+
+    measures = {
+        'scraper.py --help': ([sys.executable, 'scraper.py', '--help'], None),
+        'report.py --help': ([sys.executable, 'report.py', '--help'], None),
+        f'primeira requisição ({args.source})': (
+            [sys.executable, '-c', FIRST_REQUEST_SNIPPET.format(source=args.source)], FIRST_REQUEST_MARKER
+        ),
+    }
+
+    for name, (command, marker) in measures.items():
+        elapsed = statistics.median(time_command(command, marker) for _ in range(args.runs))
+        status = 'OK' if elapsed <= args.max_seconds else 'LENTO'
+        failed |= status != 'OK'
+        print(f"{name:<40} {elapsed:7.3f}s  {status}")
+
+    for script in ('scraper.py', 'report.py'):
+        print(f"\nImportações mais caras em {script} --help:")
+        for cumulative, module in slowest_imports(script, args.top):
+            print(f"  {cumulative / 1000:8.1f} ms  {module}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Verificação de paridade entre o processamento em lote e o --stream.
+
+Processa os artigos de data/raw pelos dois caminhos, sem tradução: em lote
+(clean_frame, detect_frame_languages, extract_frame_keywords e
+categorize_frame, como em scraper.annotate_frame) e artigo a artigo
+(prepare_article e annotate_records, como em process_stream). Compara, por
+artigo, o idioma, as palavras-chave e as categorias (inclusive a ordem).
+Casos sintéticos com campos traduzidos vazios ou ausentes cobrem a escolha
+do texto. Sai com código 1 se algum artigo divergir.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/stream_parity.py
+    python benchmarks/stream_parity.py --input data/raw --batch-categorize
+"""
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from src.processors.text_processor import TextProcessor
+from src.processors.pipeline import (
+    FM_CATEGORIES, clean_frame, detect_frame_languages, extract_frame_keywords, categorize_frame,
+    prepare_article, annotate_records
+)
+from src.utils.helpers import iter_articles
+
+# Artigos com traduções parciais: conteúdo traduzido vazio, só o título traduzido, nenhuma tradução
+TRANSLATED_CASES = [
+    {'id': 'caso-1', 'title': 'Facility management', 'abstract': 'Maintenance planning in hospitals',
+     'content': '', 'translated_content': '', 'translated_abstract': 'planejamento da manutenção em hospitais',
+     'translated_title': 'gestão de facilities'},
+    {'id': 'caso-2', 'title': 'Smart buildings', 'abstract': '', 'content': '',
+     'translated_content': None, 'translated_abstract': None, 'translated_title': 'edifícios inteligentes iot'},
+    {'id': 'caso-3', 'title': 'Limpeza hospitalar', 'abstract': 'contratos de limpeza e segurança', 'content': None,
+     'translated_content': None, 'translated_abstract': None, 'translated_title': None},
+]
+
+def parse_arguments():
+    """Analisa os argumentos da linha de comando"""
+    parser = argparse.ArgumentParser(description='Paridade do processamento em lote com o --stream')
+
+    parser.add_argument('--input', type=str, default='data/raw',
+                        help='Diretório com os artigos coletados')
+
+    parser.add_argument('--batch-categorize', action='store_true',
+                        help='Categorizar com categorize_batch nos dois caminhos')
+
+    return parser.parse_args()
+
+def batch_annotations(articles, text_processor, batch_categorize):
+    """Idioma, palavras-chave e categorias de cada artigo pelo caminho em lote"""
+    df = pd.DataFrame([article.to_dict() for article in articles])
+    clean_frame(df, text_processor)
+    detect_frame_languages(df)
+    extract_frame_keywords(df, text_processor)
+    categorize_frame(df, FM_CATEGORIES, batch=batch_categorize)
+    return [
+        (row['language'], list(row['keywords']), list(row['categories']))
+        for _, row in df.iterrows()
+    ]
+
+def stream_annotations(articles, text_processor, batch_categorize):
+    """Idioma, palavras-chave e categorias de cada artigo pelo caminho --stream"""
+    records = annotate_records(
+        [prepare_article(article, text_processor) for article in articles],
+        text_processor, FM_CATEGORIES, batch_categorize
+    )
+    return [(record['language'], list(record['keywords']), list(record['categories'])) for record in records]
+
+def translated_annotations(text_processor, batch_categorize):
+    """Palavras-chave dos casos traduzidos pelos dois caminhos"""
+    df = pd.DataFrame(TRANSLATED_CASES)
+    clean_frame(df, text_processor)
+    extract_frame_keywords(df, text_processor)
+    categorize_frame(df, FM_CATEGORIES, batch=batch_categorize)
+    batch = [(list(row['keywords']), list(row['categories'])) for _, row in df.iterrows()]
+
+    records = df.drop(columns=['keywords', 'categories']).to_dict('records')
+    annotate_records(records, text_processor, FM_CATEGORIES, batch_categorize)
+    stream = [(list(record['keywords']), list(record['categories'])) for record in records]
+    return batch, stream
+
+def main():
+    """Função principal da verificação"""
+    args = parse_arguments()
+    text_processor = TextProcessor()
+
+    articles = list(iter_articles(args.input))
+    comparisons = [
+        (article.get('id'), batch, stream) for article, batch, stream in zip(
+            articles,
+            batch_annotations(articles, text_processor, args.batch_categorize),
+            stream_annotations(articles, text_processor, args.batch_categorize)
+        )
+    ]
+    comparisons += [
+        (case['id'], batch, stream)
+        for case, batch, stream in zip(TRANSLATED_CASES, *translated_annotations(text_processor, args.batch_categorize))
+    ]
+
+    mismatches = 0
+    for article_id, batch, stream in comparisons:
+        if batch != stream:
+            mismatches += 1
+            print(f"Diferença em {article_id}: lote {batch} != stream {stream}")
+
+    print(f"{len(comparisons)} artigos, {mismatches} com resultados diferentes")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Verificação de paridade e tempo do tokenizador rápido de TextProcessor.
+
+Para cada título, resumo e conteúdo dos artigos em data/raw, limpa o texto
+com clean_text e compara TextProcessor.tokenize com word_tokenize do NLTK.
+Sai com código 1 se algum texto produzir tokens diferentes.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/tokenizer_parity.py
+    python benchmarks/tokenizer_parity.py --input data/raw --repeat 5
+    python benchmarks/tokenizer_parity.py --corpus data/processed/corpus
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nltk.tokenize import word_tokenize
+from src.processors.text_processor import TextProcessor, ensure_nltk_resource
+from src.processors.corpus import TextCorpus
+from src.utils.helpers import iter_articles
+
+def parse_arguments():
+    """Analisa os argumentos da linha de comando"""
+    parser = argparse.ArgumentParser(description='Paridade do tokenizador rápido com word_tokenize')
+
+    parser.add_argument('--input', type=str, default='data/raw',
+                        help='Diretório com os artigos coletados')
+
+    parser.add_argument('--corpus', type=str,
+                        help='Ler os textos já limpos do corpus gerado pelo processamento, em vez de data/raw')
+
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Número de repetições na medida de tempo')
+
+    return parser.parse_args()
+
+def main():
+    """Função principal da verificação"""
+    args = parse_arguments()
+    text_processor = TextProcessor()
+    ensure_nltk_resource('tokenizers/punkt')
+
+    if args.corpus:
+        with TextCorpus(args.corpus) as corpus:
+            texts = [text for field in corpus.fields for text in corpus.texts(field) if text]
+    else:
+        texts = [
+            text_processor.clean_text(article.get(field))
+            for article in iter_articles(args.input)
+            for field in ('title', 'abstract', 'content')
+            if article.get(field)
+        ]
+
+    mismatches = 0
+    for text in texts:
+        if text_processor.tokenize(text) != word_tokenize(text, language='portuguese'):
+            mismatches += 1
+            print(f"Diferença: {text[:80]!r}")
+
+    timings = {}
+    for name, tokenize in (('word_tokenize', lambda text: word_tokenize(text, language='portuguese')),
+                           ('TextProcessor.tokenize', text_processor.tokenize)):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for text in texts:
+                tokenize(text)
+        timings[name] = (time.perf_counter() - start) / args.repeat
+
+    print(f"{len(texts)} textos, {mismatches} com tokens diferentes")
+    for name, elapsed in timings.items():
+        print(f"{name:<24} {elapsed * 1000:8.1f} ms")
+    print(f"Aceleração: {timings['word_tokenize'] / timings['TextProcessor.tokenize']:.1f}x")
+
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == '__main__':
+    main()
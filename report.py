@@ -1,16 +1,16 @@
 import os
 import sys
+import ast
 import argparse
 import logging
-import pandas as pd
-import json
 from datetime import datetime
-import matplotlib.pyplot as plt
-import seaborn as sns
-from wordcloud import WordCloud
 from collections import Counter
+from itertools import chain
 from src.utils.helpers import ensure_dir, setup_logging
 
+# Colunas dos dados processados usadas no relatório
+REPORT_COLUMNS = ['title', 'url', 'date', 'source', 'categories', 'keywords']
+
 # Configurar variável de ambiente para evitar erros Qt
 os.environ['QT_QPA_PLATFORM'] = 'xcb'
 
@@ -18,19 +18,44 @@ def parse_arguments():
     """Analisa os argumentos da linha de comando"""
     parser = argparse.ArgumentParser(description='Geração de relatórios de tendências em Facility Management')
     
-    parser.add_argument('--input', type=str, default='data/processed/articles_processed.csv',
-                        help='Caminho para o arquivo CSV de dados processados')
+    parser.add_argument('--input', type=str, default='data/processed/articles_processed.parquet',
+                        help='Caminho para o arquivo de dados processados (Parquet, CSV ou JSON)')
     
     parser.add_argument('--output', type=str, default='data/processed/report.html',
                         help='Caminho para o arquivo de saída do relatório')
     
+    parser.add_argument('--aggregates', type=str, default='data/processed/aggregates.sqlite',
+                        help='Caminho para os agregados mensais usados nos gráficos de tendência')
+    
+    parser.add_argument('--bursts', type=str, default='data/processed/bursts.sqlite',
+                        help='Caminho para as linhas de base usadas na detecção de palavras-chave em alta')
+    
+    parser.add_argument('--workers', type=int, default=3,
+                        help='Número de processos para gerar os gráficos')
+    
+    parser.add_argument('--memory-report', action='store_true',
+                        help='Exibir o uso de memória de cada coluna dos dados carregados')
+    
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
                         default='INFO', help='Nível de logging')
     
     return parser.parse_args()
 
-def generate_report(df, output_path):
+def trend_chart_params(series, title, ylabel):
+    """Parâmetros de um gráfico de linhas a partir de uma série mensal (mês x coluna)"""
+    return {
+        'x': [str(month) for month in series.index],
+        'series': {str(column): [int(value) for value in series[column]] for column in series.columns},
+        'title': title, 'xlabel': 'Mês', 'ylabel': ylabel
+    }
+
+def generate_report(df, output_path, workers=1, aggregates_path=None, bursts_path=None):
     """Gera um relatório HTML com as tendências identificadas"""
+    import pandas as pd
+    from src.reports import HtmlReportWriter, Link, recent_articles_by_category
+    from src.reports.charts import WORDCLOUD_MAX_WORDS, render_charts
+    from src.processors.bursts import MIN_HISTORY_MONTHS, BurstDetector
+    
     logger = logging.getLogger(__name__)
     logger.info("Gerando relatório de tendências...")
     
@@ -38,234 +63,150 @@ def generate_report(df, output_path):
     output_dir = os.path.dirname(output_path)
     ensure_dir(output_dir)
     
-    # Configurar estilo das visualizações
-    plt.style.use('ggplot')
-    
-    # Criar HTML básico
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Tendências em Facility Management</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; }}
-            h1, h2, h3 {{ color: #2c3e50; }}
-            .container {{ max-width: 1200px; margin: 0 auto; }}
-            .section {{ margin-bottom: 40px; }}
-            .chart {{ margin: 20px 0; }}
-            table {{ border-collapse: collapse; width: 100%; }}
-            th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-            th {{ background-color: #f2f2f2; }}
-            tr:nth-child(even) {{ background-color: #f9f9f9; }}
-            .alert {{ background-color: #f8d7da; color: #721c24; padding: 10px; border-radius: 5px; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>Tendências em Facility Management</h1>
-            <p>Relatório gerado em {datetime.now().strftime('%d/%m/%Y %H:%M')}</p>
-            
-            <div class="section">
-                <h2>Visão Geral</h2>
-                <p>Total de artigos analisados: {len(df)}</p>
-    """
-    
-    # Adicionar resumo por fonte
+    # Dados de entrada de cada gráfico
     source_counts = df['source'].value_counts()
-    html += """
-                <h3>Artigos por Fonte</h3>
-                <table>
-                    <tr>
-                        <th>Fonte</th>
-                        <th>Número de Artigos</th>
-                    </tr>
-    """
-    
-    for source, count in source_counts.items():
-        html += f"""
-                    <tr>
-                        <td>{source}</td>
-                        <td>{count}</td>
-                    </tr>
-        """
-    
-    html += """
-                </table>
-    """
-    
-    # Gráfico de distribuição por fonte
-    plt.figure(figsize=(10, 6))
-    source_counts.plot(kind='bar')
-    plt.title('Número de Artigos por Fonte')
-    plt.xlabel('Fonte')
-    plt.ylabel('Número de Artigos')
-    plt.tight_layout()
-    
-    # Salvar gráfico como imagem
-    source_chart_path = 'data/processed/source_chart.png'
-    plt.savefig(source_chart_path)
-    plt.close()
-    
-    html += f"""
-                <div class="chart">
-                    <img src="{os.path.relpath(source_chart_path, os.path.dirname(output_path))}" alt="Artigos por Fonte" style="max-width: 100%;">
-                </div>
-            </div>
-    """
-    
-    # Análise de categorias
-    html += """
-            <div class="section">
-                <h2>Categorias Identificadas</h2>
-    """
     
     # Contar ocorrências de cada categoria
     category_counts = Counter()
     for cats in df['categories']:
         for cat in cats:
             category_counts[cat] += 1
+    category_ranking = sorted(category_counts.items(), key=lambda item: item[1], reverse=True)
     
-    # Tabela de categorias
-    html += """
-                <table>
-                    <tr>
-                        <th>Categoria</th>
-                        <th>Número de Artigos</th>
-                    </tr>
-    """
-    
-    for category, count in category_counts.most_common():
-        html += f"""
-                    <tr>
-                        <td>{category}</td>
-                        <td>{count}</td>
-                    </tr>
-        """
-    
-    html += """
-                </table>
-    """
-    
-    # Gráfico de distribuição por categoria
-    plt.figure(figsize=(12, 6))
-    category_df = pd.DataFrame(list(category_counts.items()), columns=['Categoria', 'Contagem'])
-    category_df = category_df.sort_values('Contagem', ascending=False)
-    
-    plt.bar(category_df['Categoria'], category_df['Contagem'])
-    plt.title('Distribuição de Categorias nos Artigos')
-    plt.xlabel('Categoria')
-    plt.ylabel('Número de Artigos')
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
+    # Contar as palavras-chave uma única vez; a nuvem usa apenas as mais frequentes
+    keyword_counts = Counter(chain.from_iterable(df['keywords']))
+    top_keywords = dict(keyword_counts.most_common(WORDCLOUD_MAX_WORDS))
     
-    # Salvar gráfico como imagem
+    # Gráficos gerados em paralelo (ou reaproveitados do cache)
+    source_chart_path = 'data/processed/source_chart.png'
     category_chart_path = 'data/processed/category_chart.png'
-    plt.savefig(category_chart_path)
-    plt.close()
-    
-    html += f"""
-                <div class="chart">
-                    <img src="{os.path.relpath(category_chart_path, os.path.dirname(output_path))}" alt="Distribuição de Categorias" style="max-width: 100%;">
-                </div>
-            </div>
-    """
-    
-    # Nuvem de palavras
-    html += """
-            <div class="section">
-                <h2>Palavras-chave Mais Frequentes</h2>
-    """
-    
-    # Extrair todas as palavras-chave
-    all_keywords = []
-    for keywords in df['keywords']:
-        all_keywords.extend(keywords)
-    
-    # Criar texto para nuvem de palavras
-    keyword_text = ' '.join(all_keywords)
+    wordcloud_path = 'data/processed/wordcloud.png'
+    charts = [
+        ('bar', source_chart_path, {
+            'labels': [str(source) for source in source_counts.index],
+            'values': [int(count) for count in source_counts.values],
+            'title': 'Número de Artigos por Fonte', 'xlabel': 'Fonte', 'ylabel': 'Número de Artigos'
+        }),
+        ('bar', category_chart_path, {
+            'labels': [category for category, _ in category_ranking],
+            'values': [count for _, count in category_ranking],
+            'title': 'Distribuição de Categorias nos Artigos', 'xlabel': 'Categoria', 'ylabel': 'Número de Artigos',
+            'figsize': (12, 6), 'rotation': 45, 'ha': 'right'
+        }),
+    ]
     
     # Verificar se há palavras-chave antes de gerar a nuvem
-    if keyword_text.strip():
-        # Gerar nuvem de palavras
-        wordcloud = WordCloud(width=800, height=400, background_color='white').generate(keyword_text)
+    has_keywords = bool(top_keywords)
+    if has_keywords:
+        charts.append(('wordcloud', wordcloud_path, {'frequencies': top_keywords}))
+    
+    # Tendências mensais, lidas apenas dos agregados materializados
+    category_trend_path = 'data/processed/category_trend.png'
+    keyword_trend_path = 'data/processed/keyword_trend.png'
+    has_trends = False
+    emerging, emerging_month, history_months = [], None, 0
+    if aggregates_path and os.path.exists(aggregates_path):
+        from src.processors.aggregates import TrendAggregates
+        with TrendAggregates(aggregates_path) as aggregates:
+            category_trend = aggregates.category_series()
+            keyword_trend = aggregates.keyword_series(top_n=10)
+            if bursts_path and os.path.exists(bursts_path):
+                # Palavras-chave em alta no mês mais recente, em relação às linhas de base
+                with BurstDetector(bursts_path) as bursts:
+                    history_months = bursts.months
+                    emerging = bursts.emerging(aggregates, top_n=15)
+                emerging_month = list(aggregates.article_counts())[-1] if emerging else None
+        has_trends = len(category_trend) > 0
+        if has_trends:
+            charts.append(('line', category_trend_path, trend_chart_params(
+                category_trend, 'Artigos por Categoria ao Longo do Tempo', 'Número de Artigos'
+            )))
+        if len(keyword_trend) > 0:
+            charts.append(('line', keyword_trend_path, trend_chart_params(
+                keyword_trend, 'Palavras-chave Mais Frequentes ao Longo do Tempo', 'Número de Artigos'
+            )))
+    
+    render_charts(charts, workers)
+    
+    # O relatório é gravado seção a seção, à medida que é gerado
+    with open(output_path, 'w', encoding='utf-8') as f:
+        report = HtmlReportWriter(f)
+        report.start_page('Tendências em Facility Management', datetime.now().strftime('%d/%m/%Y %H:%M'))
         
-        plt.figure(figsize=(10, 5))
-        plt.imshow(wordcloud, interpolation='bilinear')
-        plt.axis('off')
+        report.start_section('Visão Geral')
+        report.paragraph(f"Total de artigos analisados: {len(df)}")
         
-        # Salvar nuvem de palavras como imagem
-        wordcloud_path = 'data/processed/wordcloud.png'
-        plt.savefig(wordcloud_path)
-        plt.close()
+        # Adicionar resumo por fonte
+        report.heading('Artigos por Fonte')
+        report.table(['Fonte', 'Número de Artigos'], source_counts.items())
+        report.image(os.path.relpath(source_chart_path, os.path.dirname(output_path)), 'Artigos por Fonte')
+        report.end_section()
         
-        html += f"""
-                    <div class="chart">
-                        <img src="{os.path.relpath(wordcloud_path, os.path.dirname(output_path))}" alt="Nuvem de Palavras-chave" style="max-width: 100%;">
-                    </div>
-                </div>
-        """
-    else:
-        # Se não houver palavras-chave, exibir uma mensagem
-        html += """
-                    <div class="alert">
-                        <p>Não foi possível gerar a nuvem de palavras-chave porque nenhuma palavra-chave foi encontrada nos artigos.</p>
-                    </div>
-                </div>
-        """
-    
-    # Artigos mais recentes por categoria
-    html += """
-            <div class="section">
-                <h2>Artigos Recentes por Categoria</h2>
-    """
-    
-    # Converter categorias de lista para string para facilitar filtragem
-    df['categories_str'] = df['categories'].apply(lambda x: ', '.join(x) if isinstance(x, list) else '')
-    
-    for category in category_counts.keys():
-        category_articles = df[df['categories_str'].str.contains(category)].sort_values('date', ascending=False).head(5)
+        # Análise de categorias
+        report.start_section('Categorias Identificadas')
+        report.table(['Categoria', 'Número de Artigos'], category_counts.most_common())
+        report.image(os.path.relpath(category_chart_path, os.path.dirname(output_path)), 'Distribuição de Categorias')
+        report.end_section()
         
-        if len(category_articles) > 0:
-            html += f"""
-                <h3>{category.capitalize()}</h3>
-                <table>
-                    <tr>
-                        <th>Título</th>
-                        <th>Fonte</th>
-                        <th>Data</th>
-                    </tr>
-            """
-            
-            for _, article in category_articles.iterrows():
-                title = article['title']
-                source = article['source']
-                date = article['date'] if pd.notna(article['date']) else 'N/A'
-                url = article['url'] if pd.notna(article['url']) else '#'
-                
-                html += f"""
-                    <tr>
-                        <td><a href="{url}" target="_blank">{title}</a></td>
-                        <td>{source}</td>
-                        <td>{date}</td>
-                    </tr>
-                """
+        # Nuvem de palavras
+        report.start_section('Palavras-chave Mais Frequentes')
+        if has_keywords:
+            report.image(os.path.relpath(wordcloud_path, os.path.dirname(output_path)), 'Nuvem de Palavras-chave')
+        else:
+            # Se não houver palavras-chave, exibir uma mensagem
+            report.alert('Não foi possível gerar a nuvem de palavras-chave porque nenhuma palavra-chave '
+                         'foi encontrada nos artigos.')
+        report.end_section()
+        
+        # Tendências mensais
+        report.start_section('Tendências Mensais')
+        if has_trends:
+            report.image(os.path.relpath(category_trend_path, os.path.dirname(output_path)),
+                         'Artigos por Categoria ao Longo do Tempo')
+            if len(keyword_trend) > 0:
+                report.image(os.path.relpath(keyword_trend_path, os.path.dirname(output_path)),
+                             'Palavras-chave ao Longo do Tempo')
+        else:
+            report.alert('Não há agregados mensais disponíveis; execute o processamento dos dados para gerá-los.')
+        report.end_section()
+        
+        # Palavras-chave em alta
+        report.start_section('Palavras-chave em Alta')
+        if emerging:
+            report.paragraph(f"Palavras-chave com frequência acima da linha de base em {emerging_month} "
+                             f"(histórico de {history_months} meses).")
+            if history_months < MIN_HISTORY_MONTHS:
+                report.alert('O histórico ainda é curto; as palavras-chave em alta podem refletir apenas '
+                             'a falta de meses anteriores.')
+            report.table(['Palavra-chave', 'Artigos no Mês', 'Artigos Esperados', 'Pontuação'], (
+                [keyword, count, f"{expected:.1f}", f"{score:.2f}"]
+                for keyword, count, expected, score in emerging
+            ))
+        else:
+            report.alert('Nenhuma palavra-chave em alta foi identificada no mês mais recente.')
+        report.end_section()
+        
+        # Artigos mais recentes por categoria, a partir do índice de categorias
+        report.start_section('Artigos Recentes por Categoria')
+        recent_articles = recent_articles_by_category(df, n=5)
+        
+        for category in category_counts.keys():
+            category_articles = recent_articles.get(category)
             
-            html += """
-                </table>
-            """
-    
-    html += """
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    
-    # Salvar HTML
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+            if category_articles is not None and len(category_articles) > 0:
+                report.heading(category.capitalize())
+                # Linhas emitidas uma a uma
+                report.table(['Título', 'Fonte', 'Data'], (
+                    [
+                        Link(article.title, article.url if pd.notna(article.url) else '#'),
+                        article.source,
+                        article.date if pd.notna(article.date) else 'N/A'
+                    ]
+                    for article in category_articles.reindex(columns=['title', 'url', 'source', 'date']).itertuples(index=False)
+                ))
+        
+        report.end_section()
+        report.end_page()
     
     logger.info(f"Relatório salvo em {output_path}")
     return output_path
@@ -287,10 +228,15 @@ def main():
         sys.exit(1)
     
     logger.info(f"Carregando dados de {input_path}")
+    import pandas as pd
     
     # Determinar o formato do arquivo de entrada
-    if input_path.endswith('.csv'):
-        df = pd.read_csv(input_path)
+    if input_path.endswith('.parquet'):
+        # Apenas as colunas do relatório; listas já vêm como listas
+        from src.processors.storage import read_processed
+        df = read_processed(input_path, columns=REPORT_COLUMNS)
+    elif input_path.endswith('.csv'):
+        df = pd.read_csv(input_path, usecols=lambda column: column in REPORT_COLUMNS)
     elif input_path.endswith('.json'):
         df = pd.read_json(input_path)
     else:
@@ -300,15 +246,21 @@ def main():
     
     # Converter strings de lista para listas reais
     if 'categories' in df.columns and isinstance(df['categories'].iloc[0], str):
-        df['categories'] = df['categories'].apply(lambda x: eval(x) if isinstance(x, str) else x)
+        df['categories'] = df['categories'].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else x)
     
     if 'keywords' in df.columns and isinstance(df['keywords'].iloc[0], str):
-        df['keywords'] = df['keywords'].apply(lambda x: eval(x) if isinstance(x, str) else x)
+        df['keywords'] = df['keywords'].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else x)
+    
+    # Esquema otimizado de memória (texto em string[pyarrow], fonte como 'category')
+    from src.processors.storage import optimize_frame, memory_report
+    df = optimize_frame(df)
+    if args.memory_report:
+        print(memory_report(df))
     
     logger.info(f"Dados carregados: {len(df)} artigos")
     
     # Gerar relatório
-    output_path = generate_report(df, args.output)
+    output_path = generate_report(df, args.output, args.workers, args.aggregates, args.bursts)
     
     logger.info("Geração de relatório concluída com sucesso")
     print(f"Relatório gerado com sucesso em: {output_path}")
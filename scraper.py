@@ -2,11 +2,44 @@ import os
 import sys
 import argparse
 import logging
-import pandas as pd
 import json
 from datetime import datetime
-from src.utils.helpers import ensure_dir, setup_logging
-from src.processors import TextProcessor, translate_text, categorize_article
+from src.utils.helpers import ensure_dir, setup_logging, generate_content_hash
+
+# pandas, NLTK e o pipeline de processamento são importados dentro das funções
+# que os usam, para que --help e a coleta comecem sem esse custo
+
+# Arquivos de dados processados (Parquet é o formato principal; CSV e JSON são opcionais)
+PROCESSED_PARQUET_PATH = 'data/processed/articles_processed.parquet'
+PROCESSED_CSV_PATH = 'data/processed/articles_processed.csv'
+PROCESSED_JSON_PATH = 'data/processed/articles_processed.json'
+
+# Agregados mensais (por mês/fonte/categoria e por mês/palavra-chave) usados nas tendências
+AGGREGATES_PATH = 'data/processed/aggregates.sqlite'
+
+# Linhas de base das palavras-chave usadas na detecção de palavras-chave em alta
+BURSTS_PATH = 'data/processed/bursts.sqlite'
+
+# Índice invertido usado por search.py
+SEARCH_INDEX_PATH = 'data/processed/search_index.sqlite'
+
+# Corpus consolidado dos textos limpos (mapeado em memória), mantido mesmo quando
+# as colunas intermediárias são descartadas dos dados processados
+CORPUS_PATH = 'data/processed/corpus'
+
+# Cache persistente de traduções
+TRANSLATION_CACHE_PATH = 'data/cache/translations.sqlite'
+
+# Estatísticas de IDF persistidas do extrator de palavras-chave TF-IDF
+KEYWORD_MODEL_PATH = 'data/processed/keyword_idf.npz'
+
+# Modelo de tópicos (k-means em mini-lotes), atualizado a cada execução
+TOPIC_MODEL_PATH = 'data/processed/topic_model.joblib'
+
+# Orçamento padrão de caracteres enviados para tradução por execução (o mesmo
+# de translator.DEFAULT_TRANSLATION_BUDGET, repetido aqui para que o tradutor
+# e o dotenv só sejam importados quando houver tradução)
+DEFAULT_TRANSLATION_BUDGET = 1000000
 
 # Configurar variável de ambiente para evitar erros Qt
 os.environ['QT_QPA_PLATFORM'] = 'xcb'
@@ -27,7 +60,62 @@ def parse_arguments():
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
                         default='INFO', help='Nível de logging')
     
-    return parser.parse_args()
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Número de processos para o processamento dos artigos')
+    
+    parser.add_argument('--stream', action='store_true',
+                        help='Processar os artigos um a um e gravar os resultados em lotes')
+    
+    parser.add_argument('--batch-size', type=int, default=500,
+                        help='Número de artigos por lote gravado no modo --stream')
+    
+    parser.add_argument('--from-raw', action='store_true',
+                        help='Processar os artigos já salvos em data/raw, sem nova coleta')
+    
+    parser.add_argument('--keyword-method', choices=['frequency', 'tfidf'], default='frequency',
+                        help='Método de extração de palavras-chave (frequência no documento ou TF-IDF do corpus)')
+    
+    parser.add_argument('--incremental', action='store_true',
+                        help='Processar apenas artigos novos ou alterados e mesclar com os dados já processados')
+    
+    parser.add_argument('--translation-budget', type=int, default=DEFAULT_TRANSLATION_BUDGET,
+                        help='Máximo de caracteres enviados para tradução na execução')
+    
+    parser.add_argument('--csv', action='store_true',
+                        help='Exportar também os dados processados em CSV')
+    
+    parser.add_argument('--json', action='store_true',
+                        help='Exportar também os dados processados em JSON')
+    
+    parser.add_argument('--keep-intermediate', action='store_true',
+                        help='Manter nos dados processados as colunas de texto limpo (clean_*)')
+    
+    parser.add_argument('--memory-report', action='store_true',
+                        help='Exibir o uso de memória de cada coluna dos dados processados')
+    
+    parser.add_argument('--batch-categorize', action='store_true',
+                        help='Categorizar todos os artigos de uma vez com matrizes esparsas')
+    
+    parser.add_argument('--topics', type=int, default=0,
+                        help='Número de tópicos descobertos com k-means em mini-lotes (padrão: 0, desativado)')
+    
+    args = parser.parse_args()
+    
+    # O modo --stream processa os artigos em um único processo, lote a lote,
+    # sem o DataFrame completo nem os dados já processados
+    if args.stream:
+        incompatible = [
+            option for option, used in (
+                ('--workers', args.workers > 1),
+                ('--keyword-method tfidf', args.keyword_method == 'tfidf'),
+                ('--incremental', args.incremental),
+                ('--memory-report', args.memory_report),
+            ) if used
+        ]
+        if incompatible:
+            parser.error(f"--stream não pode ser combinado com {', '.join(incompatible)}")
+    
+    return args
 
 def collect_data(sources, limit=None):
     """Coleta dados das fontes especificadas"""
@@ -38,12 +126,13 @@ def collect_data(sources, limit=None):
     ensure_dir('data/raw')
     ensure_dir('data/processed')
     
-    # Importar scrapers aqui para evitar importação circular
-    from src.scrapers import AbrafacScraper, InfraFMScraper, IfmaScraper, GoogleScholarScraper
+    # Cada scraper é importado apenas se a fonte for selecionada (o do Google
+    # Scholar carrega Selenium e webdriver-manager)
     
     # Coletar da ABRAFAC
     if 'all' in sources or 'abrafac' in sources:
         logger.info("Coletando dados da ABRAFAC...")
+        from src.scrapers import AbrafacScraper
         scraper = AbrafacScraper()
         articles = scraper.run(limit=limit)
         logger.info(f"Coletados {len(articles)} artigos da ABRAFAC")
@@ -52,6 +141,7 @@ def collect_data(sources, limit=None):
     # Coletar da InfraFM
     if 'all' in sources or 'infrafm' in sources:
         logger.info("Coletando dados da InfraFM...")
+        from src.scrapers import InfraFMScraper
         scraper = InfraFMScraper()
         articles = scraper.run(limit=limit)
         logger.info(f"Coletados {len(articles)} artigos da InfraFM")
@@ -60,6 +150,7 @@ def collect_data(sources, limit=None):
     # Coletar do IFMA
     if 'all' in sources or 'ifma' in sources:
         logger.info("Coletando dados do IFMA Blog...")
+        from src.scrapers import IfmaScraper
         scraper = IfmaScraper()
         articles = scraper.run(limit=limit)
         logger.info(f"Coletados {len(articles)} artigos do IFMA Blog")
@@ -68,6 +159,7 @@ def collect_data(sources, limit=None):
     # Coletar do Google Scholar
     if 'all' in sources or 'google_scholar' in sources:
         logger.info("Coletando dados do Google Scholar...")
+        from src.scrapers import GoogleScholarScraper
         scraper = GoogleScholarScraper(headless=True)
         articles = scraper.run(limit=limit)
         logger.info(f"Coletados {len(articles)} artigos do Google Scholar")
@@ -75,103 +167,236 @@ def collect_data(sources, limit=None):
     
     return all_articles
 
-def process_data(articles, translate_non_pt=False):
-    """Processa os dados coletados"""
+def annotate_frame(df, translate_non_pt=False, workers=1, batch_categorize=False,
+                   keyword_method='frequency', translation_budget=DEFAULT_TRANSLATION_BUDGET, n_topics=0,
+                   append_corpus=False):
+    """Aplica limpeza, tradução, palavras-chave e categorização ao DataFrame de artigos"""
+    import pandas as pd
+    from src.processors import TextProcessor
+    from src.processors.corpus import CorpusWriter, TextCorpus
+    from src.processors.pipeline import (
+        FM_CATEGORIES, clean_frame, extract_frame_keywords, extract_frame_keywords_tfidf, categorize_frame,
+        assign_frame_topics, detect_frame_languages, process_frame_parallel, annotate_frame_parallel
+    )
+    
     logger = logging.getLogger(__name__)
-    logger.info(f"Processando {len(articles)} artigos...")
+    
+    # Com vários processos, palavras-chave por frequência e categorias são
+    # calculadas no pool (o TF-IDF depende do corpus inteiro e fica neste processo)
+    annotate_in_pool = workers > 1 and keyword_method == 'frequency'
     
     # Inicializar processador de texto
     text_processor = TextProcessor()
     
-    # Converter para DataFrame para facilitar o processamento
-    df = pd.DataFrame(articles)
-    
-    # Aplicar limpeza de texto
-    if 'content' in df.columns:
-        df['clean_content'] = df['content'].fillna('').apply(text_processor.clean_text)
+    if workers > 1:
+        # Limpeza em paralelo, por blocos
+        df = process_frame_parallel(df, workers)
+    else:
+        # Aplicar limpeza de texto
+        clean_frame(df, text_processor)
     
-    if 'abstract' in df.columns:
-        df['clean_abstract'] = df['abstract'].fillna('').apply(text_processor.clean_text)
-    
-    df['clean_title'] = df['title'].fillna('').apply(text_processor.clean_text)
+    # Identificar o idioma pelo texto limpo, antes da tradução
+    detect_frame_languages(df)
     
     # Traduzir conteúdo não português se solicitado
     if translate_non_pt:
+        from src.processors.translator import TranslationBudget, translate_documents, log_translation_summary
+        from src.processors.translation_cache import TranslationCache
+        
         logger.info("Traduzindo conteúdo não português...")
-        non_pt_count = 0
+        non_pt = df[df['language'] != 'pt']
+        
+        # Título, resumo e conteúdo originais completos, traduzidos em trechos
+        # e limpos em seguida para as palavras-chave e a categorização
+        fields = [field for field in ['title', 'abstract', 'content'] if field in df.columns]
+        texts = {}
+        for field in fields:
+            values = non_pt[field]
+            texts[field] = values[values.apply(lambda value: isinstance(value, str) and bool(value.strip()))]
+        
+        cache = TranslationCache(TRANSLATION_CACHE_PATH)
+        budget = TranslationBudget(translation_budget)
+        translated = translate_documents(
+            [text for field in fields for text in texts[field]], target_lang='pt', cache=cache, budget=budget
+        )
+        cache.close()
+        log_translation_summary()
         
-        for idx, row in df[df['language'] != 'pt'].iterrows():
-            try:
-                # Traduzir título
-                if pd.notna(row['clean_title']):
-                    translated_title = translate_text(row['clean_title'], target_lang='pt')
-                    df.at[idx, 'translated_title'] = translated_title
-                
-                # Traduzir resumo ou conteúdo
-                if 'clean_abstract' in df.columns and pd.notna(row['clean_abstract']):
-                    translated_text = translate_text(row['clean_abstract'], target_lang='pt')
-                    df.at[idx, 'translated_abstract'] = translated_text
-                elif 'clean_content' in df.columns and pd.notna(row['clean_content']):
-                    # Traduzir apenas os primeiros 1000 caracteres para economizar recursos
-                    text_to_translate = row['clean_content'][:1000]
-                    translated_text = translate_text(text_to_translate, target_lang='pt')
-                    df.at[idx, 'translated_content'] = translated_text
-                
-                non_pt_count += 1
-                if non_pt_count % 10 == 0:
-                    logger.info(f"Traduzidos {non_pt_count} artigos não portugueses")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao traduzir artigo {idx}: {str(e)}")
+        offset = 0
+        for field in fields:
+            results = translated[offset:offset + len(texts[field])]
+            offset += len(texts[field])
+            cleaned = [text_processor.clean_text(text) if text is not None else None for text in results]
+            if any(text is not None for text in cleaned):
+                df[f'translated_{field}'] = pd.Series(cleaned, index=texts[field].index, dtype=object)
+        logger.info(f"Traduzidos {len(non_pt)} artigos não portugueses")
+    
+    # Gravar os textos limpos e traduzidos no corpus (acrescentando ao existente
+    # no modo incremental); os processos do pool leem os textos dele
+    with CorpusWriter(CORPUS_PATH, append=append_corpus) as corpus_writer:
+        positions = corpus_writer.write_batch(df.reindex(columns=corpus_writer.fields + ['id']).to_dict('records'))
     
     # Extrair palavras-chave
     logger.info("Extraindo palavras-chave...")
-    df['keywords'] = df.apply(
-        lambda row: text_processor.extract_keywords(
-            row['clean_content'] if 'clean_content' in df.columns and pd.notna(row['clean_content']) 
-            else row['clean_abstract'] if 'clean_abstract' in df.columns and pd.notna(row['clean_abstract'])
-            else row['clean_title']
-        ),
-        axis=1
-    )
+    if annotate_in_pool:
+        # Palavras-chave e categorias em paralelo, com os textos lidos do corpus
+        with TextCorpus(CORPUS_PATH) as corpus:
+            annotate_frame_parallel(df, corpus, positions, workers, FM_CATEGORIES, batch_categorize)
+    elif keyword_method == 'tfidf':
+        from src.processors.keyword_engine import TfidfKeywordExtractor
+        extractor = TfidfKeywordExtractor.load(KEYWORD_MODEL_PATH, text_processor)
+        extract_frame_keywords_tfidf(df, extractor)
+        extractor.save(KEYWORD_MODEL_PATH)
+    else:
+        extract_frame_keywords(df, text_processor)
     
     # Categorizar artigos
-    logger.info("Categorizando artigos...")
-    fm_categories = {
-        'tecnologia': ['iot', 'internet das coisas', 'automação', 'digital', 'software', 'tecnologia', 'app', 'aplicativo', 'bim', 'inteligente', 'smart', 'ai', 'ia', 'inteligência artificial'],
-        'sustentabilidade': ['sustentável', 'sustentabilidade', 'verde', 'ambiental', 'energia', 'eficiência energética', 'carbono', 'renovável', 'esg', 'leed'],
-        'gestão_espacial': ['espaço', 'layout', 'ocupação', 'workplace', 'ambiente de trabalho', 'escritório', 'flexível', 'coworking'],
-        'manutenção': ['manutenção', 'preventiva', 'preditiva', 'corretiva', 'equipamento', 'falha', 'reparo', 'vida útil'],
-        'saúde_bem_estar': ['saúde', 'bem-estar', 'ergonomia', 'conforto', 'qualidade do ar', 'covid', 'pandemia', 'segurança'],
-        'gestão_contratos': ['contrato', 'terceirização', 'outsourcing', 'fornecedor', 'sla', 'kpi', 'desempenho', 'indicador']
-    }
-    
-    df['categories'] = df.apply(
-        lambda row: categorize_article(
-            text=row['clean_content'] if 'clean_content' in df.columns and pd.notna(row['clean_content']) 
-            else row['clean_abstract'] if 'clean_abstract' in df.columns and pd.notna(row['clean_abstract'])
-            else row['clean_title'],
-            keywords=row['keywords'],
-            category_dict=fm_categories
-        ),
-        axis=1
+    if not annotate_in_pool:
+        logger.info("Categorizando artigos...")
+        categorize_frame(df, FM_CATEGORIES, batch=batch_categorize)
+    
+    # Descobrir tópicos além das categorias fixas (o modelo é atualizado e salvo a cada execução)
+    if n_topics > 0:
+        logger.info("Atribuindo tópicos...")
+        from src.processors.topics import TopicModel
+        topic_model = TopicModel.load(TOPIC_MODEL_PATH, n_topics, text_processor)
+        assign_frame_topics(df, topic_model)
+        topic_model.save(TOPIC_MODEL_PATH)
+    
+    return df
+
+def process_data(articles, translate_non_pt=False, workers=1, batch_categorize=False,
+                 keyword_method='frequency', incremental=False, translation_budget=DEFAULT_TRANSLATION_BUDGET,
+                 export_csv=False, export_json=False, keep_intermediate=False, show_memory=False, n_topics=0):
+    """Processa os dados coletados"""
+    import pandas as pd
+    from src.processors.pipeline import PROCESSOR_VERSION
+    from src.processors.aggregates import TrendAggregates
+    from src.processors.bursts import BurstDetector
+    from src.processors.search_index import SearchIndex
+    from src.processors.storage import (
+        INTERMEDIATE_COLUMNS, read_processed, write_processed, optimize_frame, memory_report
     )
     
+    logger = logging.getLogger(__name__)
+    logger.info(f"Processando {len(articles)} artigos...")
+    
+    # Converter para DataFrame para facilitar o processamento (com o esquema otimizado)
+    df = optimize_frame(pd.DataFrame([article.to_dict() for article in articles]))
+    
+    # Modo incremental: processar apenas artigos novos ou alterados
+    if incremental:
+        df['content_hash'] = [generate_content_hash(article, PROCESSOR_VERSION) for article in articles]
+        if os.path.exists(PROCESSED_PARQUET_PATH):
+            existing = read_processed(PROCESSED_PARQUET_PATH)
+        else:
+            existing = pd.DataFrame()
+        known_hashes = set(existing['content_hash']) if 'content_hash' in existing.columns else set()
+        df = df[~df['content_hash'].isin(known_hashes)].reset_index(drop=True)
+        logger.info(f"{len(df)} artigos novos ou alterados, {len(articles) - len(df)} reaproveitados")
+    
+    if len(df) > 0:
+        df = annotate_frame(df, translate_non_pt, workers, batch_categorize, keyword_method, translation_budget,
+                            n_topics, append_corpus=incremental)
+        
+        # Atualizar os agregados mensais apenas com os artigos processados nesta execução
+        # e incorporar os meses fechados às linhas de base das palavras-chave
+        records = df.to_dict('records')
+        with TrendAggregates(AGGREGATES_PATH) as aggregates, BurstDetector(BURSTS_PATH) as bursts:
+            aggregates.update(records)
+            bursts.update(aggregates)
+        
+        # Indexar os mesmos artigos para a busca
+        with SearchIndex(SEARCH_INDEX_PATH) as search_index:
+            search_index.update(records)
+    
+    # Mesclar com o conjunto já processado, substituindo os artigos atualizados
+    if incremental and len(existing):
+        if 'id' in df.columns:
+            existing = existing[~existing['id'].isin(df['id'])]
+        df = pd.concat([existing, df], ignore_index=True)
+    
+    # Aplicar o esquema otimizado e descartar as colunas intermediárias
+    df = optimize_frame(df, () if keep_intermediate else INTERMEDIATE_COLUMNS)
+    if show_memory:
+        print(memory_report(df))
+    
     # Salvar dados processados
-    processed_csv_path = 'data/processed/articles_processed.csv'
-    df.to_csv(processed_csv_path, index=False)
-    logger.info(f"Dados processados salvos em {processed_csv_path}")
+    write_processed(df, PROCESSED_PARQUET_PATH)
+    logger.info(f"Dados processados salvos em {PROCESSED_PARQUET_PATH}")
     
-    processed_json_path = 'data/processed/articles_processed.json'
-    df.to_json(processed_json_path, orient='records', force_ascii=False, indent=4)
-    logger.info(f"Dados processados salvos em {processed_json_path}")
+    if export_csv:
+        df.to_csv(PROCESSED_CSV_PATH, index=False)
+        logger.info(f"Dados processados salvos em {PROCESSED_CSV_PATH}")
+    
+    if export_json:
+        df.to_json(PROCESSED_JSON_PATH, orient='records', force_ascii=False, indent=4)
+        logger.info(f"Dados processados salvos em {PROCESSED_JSON_PATH}")
     
     return df
 
+def process_data_stream(articles, translate_non_pt=False, batch_size=500,
+                        translation_budget=DEFAULT_TRANSLATION_BUDGET, export_csv=False, export_json=False, n_topics=0,
+                        batch_categorize=False, keep_intermediate=False):
+    """Processa os artigos em streaming, com memória limitada ao tamanho do lote"""
+    from src.processors.pipeline import FM_CATEGORIES, process_stream
+    from src.processors.aggregates import TrendAggregates
+    from src.processors.bursts import BurstDetector
+    from src.processors.search_index import SearchIndex
+    from src.processors.corpus import CorpusWriter
+    
+    logger = logging.getLogger(__name__)
+    logger.info(f"Processando artigos em streaming (lotes de {batch_size})...")
+    
+    # O tradutor só é importado quando há tradução
+    cache = budget = None
+    if translate_non_pt:
+        from src.processors.translator import TranslationBudget, log_translation_summary
+        from src.processors.translation_cache import TranslationCache
+        cache = TranslationCache(TRANSLATION_CACHE_PATH)
+        budget = TranslationBudget(translation_budget)
+    aggregates = TrendAggregates(AGGREGATES_PATH)
+    search_index = SearchIndex(SEARCH_INDEX_PATH)
+    corpus = CorpusWriter(CORPUS_PATH)
+    topic_model = None
+    if n_topics > 0:
+        from src.processors.topics import TopicModel
+        topic_model = TopicModel.load(TOPIC_MODEL_PATH, n_topics)
+    count = process_stream(
+        articles,
+        output_dir='data/processed',
+        category_dict=FM_CATEGORIES,
+        translate_non_pt=translate_non_pt,
+        batch_size=batch_size,
+        translation_cache=cache,
+        translation_budget=budget,
+        export_csv=export_csv,
+        export_json=export_json,
+        aggregates=aggregates,
+        topic_model=topic_model,
+        search_index=search_index,
+        corpus_writer=corpus,
+        batch_categorize=batch_categorize,
+        keep_intermediate=keep_intermediate
+    )
+    search_index.close()
+    corpus.close()
+    if topic_model is not None:
+        topic_model.save(TOPIC_MODEL_PATH)
+    with BurstDetector(BURSTS_PATH) as bursts:
+        bursts.update(aggregates)
+    aggregates.close()
+    if cache is not None:
+        cache.close()
+        log_translation_summary()
+    
+    logger.info(f"Processados {count} artigos em streaming")
+    return count
+
 def main():
     """Função principal do programa"""
     # Importações necessárias
-    from src.utils.helpers import load_articles
+    from src.utils.helpers import load_articles, iter_articles
     
     # Configurar argumentos e logging
     args = parse_arguments()
@@ -180,14 +405,33 @@ def main():
     logger = logging.getLogger(__name__)
     logger.info("Iniciando coleta e processamento de dados em Facility Management")
     
+    # Reprocessar artigos já coletados
+    if args.from_raw:
+        ensure_dir('data/processed')
+        logger.info("Processando artigos salvos em data/raw")
+        if args.stream:
+            process_data_stream(iter_articles('data/raw'), args.translate, args.batch_size,
+                                args.translation_budget, args.csv, args.json, args.topics, args.batch_categorize,
+                                args.keep_intermediate)
+        else:
+            df = process_data(load_articles('data/raw'), args.translate, args.workers, args.batch_categorize,
+                              args.keyword_method, args.incremental, args.translation_budget,
+                              args.csv, args.json, args.keep_intermediate, args.memory_report, args.topics)
+    
     # Coletar dados
-    if args.sources:
+    elif args.sources:
         logger.info(f"Coletando dados das fontes: {', '.join(args.sources)}")
         articles = collect_data(args.sources, args.limit)
         logger.info(f"Coletados {len(articles)} artigos no total")
         
         # Processar dados
-        df = process_data(articles, args.translate)
+        if args.stream:
+            process_data_stream(iter(articles), args.translate, args.batch_size, args.translation_budget,
+                                args.csv, args.json, args.topics, args.batch_categorize, args.keep_intermediate)
+        else:
+            df = process_data(articles, args.translate, args.workers, args.batch_categorize,
+                              args.keyword_method, args.incremental, args.translation_budget,
+                              args.csv, args.json, args.keep_intermediate, args.memory_report, args.topics)
     
     logger.info("Coleta e processamento concluídos com sucesso")
     print("Processamento concluído! Verifique a pasta 'data' para os resultados.")
@@ -0,0 +1,105 @@
+import os
+import sys
+import time
+import argparse
+import logging
+from src.utils.helpers import setup_logging
+
+# O índice (e o NLTK) são importados dentro das funções que os usam,
+# para que --help responda sem esse custo
+
+# Índice invertido atualizado por scraper.py
+SEARCH_INDEX_PATH = 'data/processed/search_index.sqlite'
+
+# Dados processados usados para reconstruir o índice
+PROCESSED_PARQUET_PATH = 'data/processed/articles_processed.parquet'
+
+def parse_arguments():
+    """Analisa os argumentos da linha de comando"""
+    parser = argparse.ArgumentParser(description='Busca nos artigos coletados sobre Facility Management')
+
+    parser.add_argument('query', type=str, nargs='?',
+                        help='Termos da busca')
+
+    parser.add_argument('--source', type=str, nargs='+',
+                        help='Restringir a uma ou mais fontes (por exemplo, ABRAFAC "IFMA Blog")')
+
+    parser.add_argument('--since', type=str,
+                        help='Data mínima de publicação (AAAA, AAAA-MM ou AAAA-MM-DD)')
+
+    parser.add_argument('--until', type=str,
+                        help='Data máxima de publicação (AAAA, AAAA-MM ou AAAA-MM-DD)')
+
+    parser.add_argument('--limit', type=int, default=10,
+                        help='Número máximo de resultados')
+
+    parser.add_argument('--index', type=str, default=SEARCH_INDEX_PATH,
+                        help='Caminho para o índice de busca')
+
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Reconstruir o índice a partir dos dados processados (Parquet) antes de buscar')
+
+    parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+                        default='WARNING', help='Nível de logging')
+
+    args = parser.parse_args()
+    if not args.query and not args.rebuild:
+        parser.error('informe os termos da busca ou --rebuild')
+    return args
+
+def rebuild_index(index_path, input_path=PROCESSED_PARQUET_PATH):
+    """Reconstrói o índice de busca do zero a partir dos artigos processados"""
+    from src.processors.search_index import SearchIndex
+    from src.processors.storage import read_processed
+
+    logger = logging.getLogger(__name__)
+    if not os.path.exists(input_path):
+        logger.error(f"Arquivo de entrada não encontrado: {input_path}")
+        print(f"Erro: Arquivo de entrada não encontrado: {input_path}")
+        sys.exit(1)
+
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(index_path + suffix):
+            os.remove(index_path + suffix)
+
+    df = read_processed(input_path)
+    with SearchIndex(index_path) as index:
+        indexed = index.update(df.to_dict('records'))
+    print(f"Índice reconstruído com {indexed} artigos: {index_path}")
+
+def main():
+    """Função principal do programa"""
+    # Configurar argumentos e logging
+    args = parse_arguments()
+    setup_logging(getattr(logging, args.log_level))
+
+    if args.rebuild:
+        rebuild_index(args.index)
+        if not args.query:
+            return
+
+    if not os.path.exists(args.index):
+        print(f"Erro: Índice de busca não encontrado: {args.index} (execute scraper.py ou search.py --rebuild)")
+        sys.exit(1)
+
+    from src.processors.search_index import SearchIndex
+
+    with SearchIndex(args.index) as index:
+        start = time.perf_counter()
+        try:
+            results = index.search(args.query, limit=args.limit, sources=args.source,
+                                   since=args.since, until=args.until)
+        except ValueError as e:
+            print(f"Erro: {e}")
+            sys.exit(1)
+        elapsed = (time.perf_counter() - start) * 1000
+        n_documents = index.n_documents
+
+    print(f"{len(results)} resultados em {elapsed:.1f} ms ({n_documents} artigos indexados)")
+    for position, result in enumerate(results, 1):
+        print(f"\n{position}. {result['title']}  [{result['score']:.2f}]")
+        print(f"   {result['source']} | {result['date'] or 'sem data'}")
+        print(f"   {result['url']}")
+
+if __name__ == "__main__":
+    main()
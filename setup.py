@@ -9,7 +9,12 @@ setup(
         "beautifulsoup4>=4.11.0",
         "selenium>=4.8.0",
         "webdriver-manager>=3.8.0",
-        "pandas>=1.5.0",
+        "pandas>=2.0.0",
+        "numpy>=1.22.0",
+        "pyarrow>=10.0.0",
+        "scipy>=1.8.0",
+        "scikit-learn>=1.0.0",
+        "joblib>=1.1.0",
         "nltk>=3.8.0",
         "googletrans==4.0.0-rc1",
         "python-dotenv>=1.0.0",
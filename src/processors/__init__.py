@@ -1,13 +1,30 @@
 # src/processors/__init__.py
 
-from .text_processor import TextProcessor
-from .translator import translate_text
-from .categorizer import categorize_article
 from src.utils.helpers import ensure_dir
 
+# Importação sob demanda: NLTK, unidecode, requests e dotenv só são
+# carregados quando o processador correspondente é usado
+_EXPORTS = {
+    'TextProcessor': '.text_processor',
+    'translate_text': '.translator',
+    'translate_batch': '.translator',
+    'translate_documents': '.translator',
+    'categorize_article': '.categorizer',
+    'categorize_batch': '.categorizer',
+}
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'TextProcessor',
     'translate_text',
-    'categorize_article'
+    'translate_batch',
+    'translate_documents',
+    'categorize_article',
+    'categorize_batch',
     'ensure_dir'
-]
\ No newline at end of file
+]
@@ -0,0 +1,245 @@
+import os
+import re
+import json
+import sqlite3
+import logging
+from collections import Counter
+from src.utils.helpers import ensure_dir, extract_date
+
+logger = logging.getLogger(__name__)
+
+# Local padrão dos agregados mensais
+DEFAULT_AGGREGATES_PATH = 'data/processed/aggregates.sqlite'
+
+# Prefixo ano-mês de uma data ISO 8601
+ISO_MONTH = re.compile(r'(\d{4})-(\d{2})')
+
+def article_month(record):
+    """
+    Mês (AAAA-MM) de um artigo: o da data de publicação ou, na falta dela, o da coleta.
+
+    Returns:
+        str: Mês do artigo, ou None se nenhuma data for reconhecida
+    """
+    for field in ('date', 'collected_at'):
+        value = record.get(field)
+        if not isinstance(value, str) or not value:
+            continue
+        match = ISO_MONTH.match(value)
+        if match:
+            return f"{match.group(1)}-{match.group(2)}"
+        parsed = extract_date(value)
+        if parsed:
+            return parsed.strftime('%Y-%m')
+    return None
+
+class TrendAggregates:
+    """
+    Agregados mensais materializados em SQLite.
+
+    Mantém o número de artigos por (mês, fonte, categoria) e por (mês,
+    palavra-chave). A contribuição de cada artigo é guardada por id, então
+    reprocessar um artigo substitui a contribuição anterior em vez de
+    somá-la de novo, e artigos inalterados não custam nada além da consulta.
+    Cada mês tem uma revisão, incrementada sempre que os seus contadores
+    mudam, para que quem deriva dados dos meses saiba quais recalcular.
+    """
+
+    def __init__(self, path=DEFAULT_AGGREGATES_PATH):
+        self.path = path
+        ensure_dir(os.path.dirname(path) or '.')
+        self._conn = sqlite3.connect(path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS category_counts ('
+            ' month TEXT NOT NULL, source TEXT NOT NULL, category TEXT NOT NULL, count INTEGER NOT NULL,'
+            ' PRIMARY KEY (month, source, category))'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS keyword_counts ('
+            ' month TEXT NOT NULL, keyword TEXT NOT NULL, count INTEGER NOT NULL,'
+            ' PRIMARY KEY (month, keyword))'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS contributions ('
+            ' article_id TEXT PRIMARY KEY, month TEXT NOT NULL, source TEXT NOT NULL,'
+            ' categories TEXT NOT NULL, keywords TEXT NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS month_revisions (month TEXT PRIMARY KEY, revision INTEGER NOT NULL)'
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def contribution(record):
+        """
+        Contribuição de um artigo aos agregados.
+
+        Returns:
+            tuple: (mês, fonte, categorias, palavras-chave), ou None se o artigo não tiver data
+        """
+        month = article_month(record)
+        if month is None:
+            return None
+        source = record.get('source')
+        categories = record.get('categories')
+        keywords = record.get('keywords')
+        return (
+            month,
+            source if isinstance(source, str) else '',
+            sorted(set(categories)) if isinstance(categories, (list, tuple)) else [],
+            sorted(set(keywords)) if isinstance(keywords, (list, tuple)) else []
+        )
+
+    def update(self, records):
+        """
+        Incorpora artigos processados aos agregados.
+
+        Args:
+            records: Iterável de dicionários de artigos processados (com 'id')
+
+        Returns:
+            int: Número de artigos cuja contribuição mudou
+        """
+        category_delta = Counter()
+        keyword_delta = Counter()
+        upserts, deletes = [], []
+        touched_months = set()
+
+        for record in records:
+            article_id = record.get('id')
+            if not article_id:
+                continue
+
+            new = self.contribution(record)
+            row = self._conn.execute(
+                'SELECT month, source, categories, keywords FROM contributions WHERE article_id = ?', (article_id,)
+            ).fetchone()
+            old = (row[0], row[1], json.loads(row[2]), json.loads(row[3])) if row else None
+            if old == new:
+                continue
+
+            for contribution, sign in ((old, -1), (new, 1)):
+                if contribution is None:
+                    continue
+                month, source, categories, keywords = contribution
+                touched_months.add(month)
+                for category in categories:
+                    category_delta[(month, source, category)] += sign
+                for keyword in keywords:
+                    keyword_delta[(month, keyword)] += sign
+
+            if new is None:
+                deletes.append((article_id,))
+            else:
+                month, source, categories, keywords = new
+                upserts.append((
+                    article_id, month, source,
+                    json.dumps(categories, ensure_ascii=False), json.dumps(keywords, ensure_ascii=False)
+                ))
+
+        self._conn.executemany(
+            'INSERT INTO category_counts (month, source, category, count) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT (month, source, category) DO UPDATE SET count = count + excluded.count',
+            [(*key, delta) for key, delta in category_delta.items() if delta]
+        )
+        self._conn.executemany(
+            'INSERT INTO keyword_counts (month, keyword, count) VALUES (?, ?, ?) '
+            'ON CONFLICT (month, keyword) DO UPDATE SET count = count + excluded.count',
+            [(*key, delta) for key, delta in keyword_delta.items() if delta]
+        )
+        self._conn.execute('DELETE FROM category_counts WHERE count <= 0')
+        self._conn.execute('DELETE FROM keyword_counts WHERE count <= 0')
+        self._conn.executemany('INSERT OR REPLACE INTO contributions VALUES (?, ?, ?, ?, ?)', upserts)
+        self._conn.executemany('DELETE FROM contributions WHERE article_id = ?', deletes)
+        self._conn.executemany(
+            'INSERT INTO month_revisions (month, revision) VALUES (?, 1) '
+            'ON CONFLICT (month) DO UPDATE SET revision = revision + 1',
+            [(month,) for month in sorted(touched_months)]
+        )
+        self._conn.commit()
+
+        changed = len(upserts) + len(deletes)
+        logger.info(f"Agregados mensais: {changed} artigos incorporados ou atualizados")
+        return changed
+
+    def article_counts(self):
+        """
+        Número de artigos de cada mês.
+
+        Returns:
+            dict: Mês -> número de artigos, em ordem de mês
+        """
+        rows = self._conn.execute(
+            'SELECT month, COUNT(*) FROM contributions GROUP BY month ORDER BY month'
+        ).fetchall()
+        return dict(rows)
+
+    def month_revisions(self):
+        """
+        Revisão de cada mês (incrementada a cada alteração dos seus contadores).
+
+        Returns:
+            dict: Mês -> revisão (meses anteriores ao controle de revisões ficam de fora)
+        """
+        return dict(self._conn.execute('SELECT month, revision FROM month_revisions').fetchall())
+
+    def month_keyword_counts(self, month):
+        """
+        Número de artigos de cada palavra-chave em um mês.
+
+        Returns:
+            dict: Palavra-chave -> número de artigos
+        """
+        rows = self._conn.execute('SELECT keyword, count FROM keyword_counts WHERE month = ?', (month,)).fetchall()
+        return dict(rows)
+
+    def category_series(self, source=None):
+        """
+        Série mensal de artigos por categoria.
+
+        Args:
+            source: Restringir a uma fonte (None para todas)
+
+        Returns:
+            DataFrame com um mês por linha e uma categoria por coluna
+        """
+        import pandas as pd
+
+        query = 'SELECT month, category, SUM(count) FROM category_counts'
+        params = ()
+        if source is not None:
+            query += ' WHERE source = ?'
+            params = (source,)
+        rows = self._conn.execute(query + ' GROUP BY month, category', params).fetchall()
+
+        frame = pd.DataFrame(rows, columns=['month', 'category', 'count'])
+        return frame.pivot_table(index='month', columns='category', values='count', fill_value=0).sort_index()
+
+    def keyword_series(self, top_n=10):
+        """
+        Série mensal de artigos das top_n palavras-chave mais frequentes no total.
+
+        Returns:
+            DataFrame com um mês por linha e uma palavra-chave por coluna
+        """
+        import pandas as pd
+
+        rows = self._conn.execute(
+            'SELECT k.month, k.keyword, k.count FROM keyword_counts k JOIN ('
+            ' SELECT keyword FROM keyword_counts GROUP BY keyword ORDER BY SUM(count) DESC, keyword LIMIT ?'
+            ') top ON k.keyword = top.keyword',
+            (top_n,)
+        ).fetchall()
+
+        frame = pd.DataFrame(rows, columns=['month', 'keyword', 'count'])
+        return frame.pivot_table(index='month', columns='keyword', values='count', fill_value=0).sort_index()
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
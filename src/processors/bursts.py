@@ -0,0 +1,229 @@
+import os
+import math
+import sqlite3
+import logging
+from src.utils.helpers import ensure_dir
+
+logger = logging.getLogger(__name__)
+
+# Local padrão do estado da detecção de picos
+DEFAULT_BURSTS_PATH = 'data/processed/bursts.sqlite'
+
+# Peso do mês mais recente na linha de base (média móvel exponencial)
+SMOOTHING = 0.3
+
+# Linhas de base com taxa efetiva abaixo deste valor são descartadas
+PRUNE_RATE = 0.001
+
+# Número máximo de palavras-chave acompanhadas
+MAX_TRACKED_KEYWORDS = 50000
+
+# Número mínimo de artigos no mês para uma palavra-chave ser considerada em alta
+MIN_BURST_COUNT = 3
+
+# Pontuação mínima (excesso sobre o esperado, em desvios de Poisson) para uma palavra-chave em alta
+MIN_BURST_SCORE = 2.0
+
+# Número mínimo de meses na linha de base para que os picos sejam confiáveis
+MIN_HISTORY_MONTHS = 3
+
+# Distância máxima (em meses) entre a origem do decaimento adiantado e o último
+# mês incorporado; acima dela os pesos são renormalizados para a nova origem
+RENORMALIZE_MONTHS = 24
+
+def month_index(month):
+    """Índice de calendário de um mês AAAA-MM (meses desde o ano 0)"""
+    year, number = month.split('-')
+    return int(year) * 12 + int(number) - 1
+
+class BurstDetector:
+    """
+    Detecção incremental de palavras-chave em alta.
+
+    A linha de base de cada palavra-chave é a média móvel exponencial da
+    fração de artigos do mês que a contêm, calculada sobre os meses já
+    fechados (todos menos o mais recente) e avaliada no último deles. O
+    decaimento segue o calendário: um mês sem artigos não contribui, mas o
+    peso dos anteriores decai mesmo assim. Cada mês é incorporado uma única
+    vez, a partir dos contadores por (mês, palavra-chave) dos agregados
+    mensais, então o custo de cada execução depende apenas dos meses novos.
+    Se um mês já incorporado mudou (dados reprocessados) ou chegou um mês
+    anterior ao último incorporado (dados atrasados), a linha de base é
+    recalculada a partir dos agregados.
+
+    O decaimento é aplicado de forma adiantada: o peso guardado é a
+    contribuição dividida por (1 - SMOOTHING) elevado à distância, em meses,
+    até uma origem, de modo que incorporar um mês só altera as palavras-chave
+    presentes nele. Quando essa distância passa de RENORMALIZE_MONTHS, os pesos
+    são trazidos para uma nova origem. A memória é limitada descartando as
+    linhas de base que decaíram abaixo de PRUNE_RATE e mantendo no máximo
+    MAX_TRACKED_KEYWORDS palavras-chave.
+    """
+
+    def __init__(self, path=DEFAULT_BURSTS_PATH):
+        self.path = path
+        ensure_dir(os.path.dirname(path) or '.')
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS baselines (keyword TEXT PRIMARY KEY, weight REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS folded (month TEXT PRIMARY KEY, revision INTEGER NOT NULL)'
+        )
+        self._conn.commit()
+
+    def _get_state(self, key, default):
+        row = self._conn.execute('SELECT value FROM state WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_state(self, key, value):
+        self._conn.execute('INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)', (key, str(value)))
+
+    def _folded(self):
+        """Meses incorporados e a revisão dos agregados de cada um"""
+        return dict(self._conn.execute('SELECT month, revision FROM folded ORDER BY month').fetchall())
+
+    @property
+    def months(self):
+        """Número de meses de calendário cobertos pela linha de base (do primeiro ao último incorporado)"""
+        first, last = self._conn.execute('SELECT MIN(month), MAX(month) FROM folded').fetchone()
+        return month_index(last) - month_index(first) + 1 if first else 0
+
+    @property
+    def last_month(self):
+        """Último mês incorporado à linha de base"""
+        return self._conn.execute('SELECT MAX(month) FROM folded').fetchone()[0] or ''
+
+    def _decay(self, months):
+        return (1 - SMOOTHING) ** months
+
+    def update(self, aggregates):
+        """
+        Incorpora à linha de base os meses fechados ainda não incorporados.
+
+        Args:
+            aggregates: Agregados mensais (TrendAggregates)
+
+        Returns:
+            int: Número de meses incorporados (todos os fechados, se a linha de base foi recalculada)
+        """
+        article_counts = aggregates.article_counts()
+        revisions = aggregates.month_revisions()
+        closed = {month: revisions.get(month, 0) for month in list(article_counts)[:-1]}
+        folded = self._folded()
+
+        pending = [month for month in closed if month not in folded]
+        stale = not folded or any(closed.get(month) != revision for month, revision in folded.items())
+        late = bool(pending) and bool(folded) and pending[0] < max(folded)
+        if stale or late:
+            # Meses incorporados mudaram (ou chegaram meses atrasados): recalcular do zero
+            if folded:
+                logger.info("Meses já incorporados mudaram; recalculando a linha de base de palavras-chave")
+            self._conn.execute('DELETE FROM baselines')
+            self._conn.execute('DELETE FROM folded')
+            self._conn.execute('DELETE FROM state')
+            pending = list(closed)
+
+        if not pending:
+            self._conn.commit()
+            return 0
+
+        origin = int(self._get_state('origin', month_index(pending[0])))
+        for month in pending:
+            scale = SMOOTHING / (article_counts[month] * self._decay(month_index(month) - origin))
+            self._conn.executemany(
+                'INSERT INTO baselines (keyword, weight) VALUES (?, ?) '
+                'ON CONFLICT (keyword) DO UPDATE SET weight = weight + excluded.weight',
+                [(keyword, count * scale) for keyword, count in aggregates.month_keyword_counts(month).items()]
+            )
+        self._conn.executemany('INSERT INTO folded (month, revision) VALUES (?, ?)',
+                               [(month, closed[month]) for month in pending])
+
+        last = month_index(pending[-1])
+        if last - origin > RENORMALIZE_MONTHS:
+            # Trazer os pesos para a nova origem antes que a escala cresça demais
+            self._conn.execute('UPDATE baselines SET weight = weight * ?', (self._decay(last - origin),))
+            origin = last
+        self._set_state('origin', origin)
+        self._prune(last - origin)
+        self._conn.commit()
+        logger.info(f"Linha de base de palavras-chave atualizada com {len(pending)} meses (até {pending[-1]})")
+        return len(pending)
+
+    def _prune(self, distance):
+        """Descarta linhas de base que decaíram e limita o número de palavras-chave"""
+        self._conn.execute('DELETE FROM baselines WHERE weight < ?', (PRUNE_RATE / self._decay(distance),))
+        self._conn.execute(
+            'DELETE FROM baselines WHERE keyword NOT IN ('
+            ' SELECT keyword FROM baselines ORDER BY weight DESC LIMIT ?)',
+            (MAX_TRACKED_KEYWORDS,)
+        )
+
+    def baselines(self, keywords):
+        """
+        Taxa esperada (fração de artigos por mês) de cada palavra-chave.
+
+        Returns:
+            dict: Palavra-chave -> taxa esperada (palavras-chave sem histórico ficam de fora)
+        """
+        last_month = self.last_month
+        if not last_month:
+            return {}
+        decay = self._decay(month_index(last_month) - int(self._get_state('origin', month_index(last_month))))
+        keywords = list(keywords)
+        rates = {}
+        # Consultas em blocos, abaixo do limite de parâmetros do SQLite
+        for start in range(0, len(keywords), 500):
+            chunk = keywords[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for keyword, weight in self._conn.execute(
+                f'SELECT keyword, weight FROM baselines WHERE keyword IN ({placeholders})', chunk
+            ):
+                rates[keyword] = weight * decay
+        return rates
+
+    def emerging(self, aggregates, top_n=15, min_count=MIN_BURST_COUNT, min_score=MIN_BURST_SCORE):
+        """
+        Palavras-chave em alta no mês mais recente, em relação à linha de base.
+
+        A pontuação é o excesso de artigos sobre o esperado, normalizado pela
+        raiz do esperado (como em uma contagem de Poisson).
+
+        Args:
+            aggregates: Agregados mensais (TrendAggregates)
+            top_n: Número máximo de palavras-chave
+            min_count: Número mínimo de artigos do mês com a palavra-chave
+            min_score: Pontuação mínima
+
+        Returns:
+            list: Tuplas (palavra-chave, artigos no mês, artigos esperados, pontuação),
+            da maior para a menor pontuação
+        """
+        article_counts = aggregates.article_counts()
+        if not article_counts:
+            return []
+
+        month = list(article_counts)[-1]
+        counts = {
+            keyword: count for keyword, count in aggregates.month_keyword_counts(month).items() if count >= min_count
+        }
+        rates = self.baselines(counts)
+
+        ranking = []
+        for keyword, count in counts.items():
+            expected = rates.get(keyword, 0.0) * article_counts[month]
+            score = (count - expected) / math.sqrt(expected + 1)
+            if score >= min_score:
+                ranking.append((keyword, count, expected, score))
+        ranking.sort(key=lambda item: (-item[3], item[0]))
+        return ranking[:top_n]
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
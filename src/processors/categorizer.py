@@ -1,9 +1,187 @@
 import re
 import logging
 from collections import Counter
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Categorias padrão se nenhuma for fornecida
+DEFAULT_CATEGORIES = {
+    'tecnologia': ['iot', 'internet das coisas', 'automação', 'digital', 'software', 'tecnologia', 'app', 'aplicativo', 'bim', 'inteligente', 'smart', 'ai', 'ia', 'inteligência artificial'],
+    'sustentabilidade': ['sustentável', 'sustentabilidade', 'verde', 'ambiental', 'energia', 'eficiência energética', 'carbono', 'renovável', 'esg', 'leed'],
+    'gestão_espacial': ['espaço', 'layout', 'ocupação', 'workplace', 'ambiente de trabalho', 'escritório', 'flexível', 'coworking'],
+    'manutenção': ['manutenção', 'preventiva', 'preditiva', 'corretiva', 'equipamento', 'falha', 'reparo', 'vida útil'],
+    'saúde_bem_estar': ['saúde', 'bem-estar', 'ergonomia', 'conforto', 'qualidade do ar', 'covid', 'pandemia', 'segurança'],
+    'gestão_contratos': ['contrato', 'terceirização', 'outsourcing', 'fornecedor', 'sla', 'kpi', 'desempenho', 'indicador']
+}
+
+# Limite de palavras-chave memorizadas por matcher
+KEYWORD_CACHE_SIZE = 100000
+
+class CategoryMatcher:
+    """
+    Dicionário de categorias compilado para busca de todos os termos em uma
+    única passada sobre o texto.
+
+    Os termos são agrupados em camadas sem prefixos em comum; cada camada vira
+    uma única expressão regular de alternância dentro de um lookahead, que
+    encontra todas as posições de início. Como numa camada só um termo pode
+    casar por posição, as contagens reproduzem exatamente as de
+    re.findall(r'\\b' + re.escape(term) + r'\\b', texto) termo a termo.
+    """
+
+    def __init__(self, category_dict):
+        self.categories = list(category_dict)
+
+        # Termo -> categorias (com repetição, como no laço original)
+        self.term_categories = {}
+        for category, terms in category_dict.items():
+            for term in terms:
+                self.term_categories.setdefault(term, []).append(category)
+
+        self.term_ids = {term: i for i, term in enumerate(self.term_categories)}
+        self.self_overlapping = {term for term in self.term_categories if self._overlaps_itself(term)}
+        self.patterns = [
+            re.compile(r'(?=\b(' + '|'.join(re.escape(term) for term in layer) + r')\b)')
+            for layer in self._prefix_free_layers(list(self.term_categories))
+        ]
+
+        # Busca de substrings para o bônus de palavras-chave, por categoria
+        self.keyword_patterns = [
+            (category, re.compile('|'.join(re.escape(term) for term in terms)))
+            for category, terms in category_dict.items() if terms
+        ]
+        self._keyword_cache = {}
+
+    @staticmethod
+    def _prefix_free_layers(terms):
+        """Distribui os termos em camadas onde nenhum termo é prefixo de outro"""
+        layers = []
+        for term in sorted(terms, key=len):
+            for layer in layers:
+                if not any(term.startswith(other) for other in layer):
+                    layer.append(term)
+                    break
+            else:
+                layers.append([term])
+        return layers
+
+    @staticmethod
+    def _overlaps_itself(term):
+        """Indica se duas ocorrências do termo podem se sobrepor no texto"""
+        return not term or any(term.startswith(term[i:]) for i in range(1, len(term)))
+
+    def count_terms(self, text):
+        """Conta as ocorrências não sobrepostas de cada termo no texto"""
+        counts = Counter()
+        for pattern in self.patterns:
+            last_end = {}
+            for match in pattern.finditer(text):
+                term = match.group(1)
+                start = match.start()
+                # re.findall não conta ocorrências sobrepostas do mesmo termo
+                if start >= last_end.get(term, 0):
+                    counts[term] += 1
+                    last_end[term] = start + len(term)
+        return counts
+
+    def count_terms_batch(self, texts_lower):
+        """
+        Conta os termos de vários textos com uma varredura por camada sobre o
+        lote concatenado (separado por quebras de linha, que delimitam palavras
+        como o início e o fim de cada texto).
+
+        Returns:
+            tuple: Arrays (índice do documento, índice do termo) de cada ocorrência
+        """
+        import numpy as np
+
+        lengths = np.fromiter((len(text) for text in texts_lower), dtype=np.int64, count=len(texts_lower))
+        doc_starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1])).astype(np.int64)
+        doc_ends = doc_starts + lengths
+        term_lengths = np.array([len(term) for term in self.term_ids], dtype=np.int64)
+        joined = '\n'.join(texts_lower)
+
+        all_positions, all_terms = [], []
+        for pattern in self.patterns:
+            positions, term_ids = [], []
+            last_end = {}
+            for match in pattern.finditer(joined):
+                term = match.group(1)
+                start = match.start()
+                if term in self.self_overlapping:
+                    if start < last_end.get(term, 0):
+                        continue
+                    last_end[term] = start + len(term)
+                positions.append(start)
+                term_ids.append(self.term_ids[term])
+            all_positions.append(np.array(positions, dtype=np.int64))
+            all_terms.append(np.array(term_ids, dtype=np.int64))
+
+        positions = np.concatenate(all_positions) if all_positions else np.zeros(0, dtype=np.int64)
+        term_ids = np.concatenate(all_terms) if all_terms else np.zeros(0, dtype=np.int64)
+        doc_ids = np.searchsorted(doc_starts, positions, side='right') - 1
+
+        # Descartar ocorrências que atravessam o separador entre documentos
+        inside = positions + term_lengths[term_ids] <= doc_ends[doc_ids]
+        return doc_ids[inside], term_ids[inside]
+
+    def keyword_categories(self, keyword_lower):
+        """Categorias com algum termo contido na palavra-chave (memorizado)"""
+        categories = self._keyword_cache.get(keyword_lower)
+        if categories is None:
+            categories = tuple(
+                category for category, pattern in self.keyword_patterns
+                if pattern.search(keyword_lower)
+            )
+            if len(self._keyword_cache) >= KEYWORD_CACHE_SIZE:
+                self._keyword_cache.clear()
+            self._keyword_cache[keyword_lower] = categories
+        return categories
+
+    def score(self, text_lower, keywords=None):
+        """Calcula a pontuação de cada categoria, na ordem de inserção original"""
+        term_counts = self.count_terms(text_lower)
+
+        text_scores = Counter()
+        for term, count in term_counts.items():
+            for category in self.term_categories[term]:
+                text_scores[category] += count
+
+        # Categorias encontradas no texto entram na ordem do dicionário
+        category_scores = Counter()
+        for category in self.categories:
+            if text_scores[category] > 0:
+                category_scores[category] = text_scores[category]
+
+        # Adicionar pontuação com base nas palavras-chave (a lista pode ser um
+        # array numpy, lido de uma coluna de listas do Parquet)
+        if keywords is not None:
+            for keyword in keywords:
+                for category in self.keyword_categories(keyword.lower()):
+                    category_scores[category] += 2  # Peso maior para palavras-chave
+
+        return category_scores
+
+@lru_cache(maxsize=32)
+def _compile_matcher(frozen_categories):
+    return CategoryMatcher({category: list(terms) for category, terms in frozen_categories})
+
+def get_category_matcher(category_dict=None):
+    """
+    Retorna o matcher compilado para o dicionário de categorias (em cache).
+
+    Args:
+        category_dict (dict): Dicionário de categorias e termos relacionados
+
+    Returns:
+        CategoryMatcher: Matcher compilado
+    """
+    if category_dict is None:
+        category_dict = DEFAULT_CATEGORIES
+    frozen = tuple((category, tuple(terms)) for category, terms in category_dict.items())
+    return _compile_matcher(frozen)
+
 def categorize_article(text, keywords=None, category_dict=None):
     """
     Categoriza um artigo com base em seu conteúdo e palavras-chave.
@@ -19,38 +197,14 @@ def categorize_article(text, keywords=None, category_dict=None):
     if not text:
         return []
     
-    # Categorias padrão se nenhuma for fornecida
-    if category_dict is None:
-        category_dict = {
-            'tecnologia': ['iot', 'internet das coisas', 'automação', 'digital', 'software', 'tecnologia', 'app', 'aplicativo', 'bim', 'inteligente', 'smart', 'ai', 'ia', 'inteligência artificial'],
-            'sustentabilidade': ['sustentável', 'sustentabilidade', 'verde', 'ambiental', 'energia', 'eficiência energética', 'carbono', 'renovável', 'esg', 'leed'],
-            'gestão_espacial': ['espaço', 'layout', 'ocupação', 'workplace', 'ambiente de trabalho', 'escritório', 'flexível', 'coworking'],
-            'manutenção': ['manutenção', 'preventiva', 'preditiva', 'corretiva', 'equipamento', 'falha', 'reparo', 'vida útil'],
-            'saúde_bem_estar': ['saúde', 'bem-estar', 'ergonomia', 'conforto', 'qualidade do ar', 'covid', 'pandemia', 'segurança'],
-            'gestão_contratos': ['contrato', 'terceirização', 'outsourcing', 'fornecedor', 'sla', 'kpi', 'desempenho', 'indicador']
-        }
+    # Matcher compilado uma única vez por dicionário de categorias
+    matcher = get_category_matcher(category_dict)
     
     # Normalizar texto para busca
     text_lower = text.lower()
     
-    # Contagem de ocorrências de termos por categoria
-    category_scores = Counter()
-    
-    # Verificar ocorrências de termos no texto
-    for category, terms in category_dict.items():
-        for term in terms:
-            # Contar ocorrências do termo no texto
-            count = len(re.findall(r'\b' + re.escape(term) + r'\b', text_lower))
-            if count > 0:
-                category_scores[category] += count
-    
-    # Adicionar pontuação com base nas palavras-chave
-    if keywords:
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            for category, terms in category_dict.items():
-                if any(term in keyword_lower for term in terms):
-                    category_scores[category] += 2  # Peso maior para palavras-chave
+    # Contagem de ocorrências de termos por categoria, em uma única passada
+    category_scores = matcher.score(text_lower, keywords)
     
     # Selecionar categorias com pontuação acima do limiar
     threshold = 1  # Pelo menos uma ocorrência
@@ -60,4 +214,78 @@ def categorize_article(text, keywords=None, category_dict=None):
     if not categories:
         categories = ['outros']
     
-    return categories
\ No newline at end of file
+    return categories
+
+def categorize_batch(texts, keywords=None, category_dict=None):
+    """
+    Categoriza um lote de artigos de uma só vez com matrizes esparsas.
+    
+    Monta uma matriz esparsa documento x termo restrita ao vocabulário das
+    categorias, preenchida por uma varredura do CategoryMatcher sobre o lote
+    concatenado, e obtém as pontuações com um produto pela matriz indicadora
+    termo x categoria. As categorias das palavras-chave são acrescentadas na
+    ordem das palavras-chave de cada documento, então o resultado (inclusive
+    a ordem das categorias) é idêntico ao de categorize_article.
+    
+    Args:
+        texts (list): Textos dos artigos
+        keywords (list): Listas de palavras-chave de cada artigo (opcional)
+        category_dict (dict): Dicionário de categorias e termos relacionados
+        
+    Returns:
+        list: Lista de categorias atribuídas a cada artigo
+    """
+    import numpy as np
+    from scipy import sparse
+    
+    matcher = get_category_matcher(category_dict)
+    categories = matcher.categories
+    category_index = {category: i for i, category in enumerate(categories)}
+    term_index = matcher.term_ids
+    texts = [text if isinstance(text, str) else '' for text in texts]
+    
+    def indicator(row_items, shape):
+        rows, cols = [], []
+        for row, row_categories in row_items:
+            for category in row_categories:
+                rows.append(row)
+                cols.append(category_index[category])
+        return sparse.csr_matrix((np.ones(len(rows), dtype=np.int64), (rows, cols)), shape=shape)
+    
+    # Matriz indicadora termo x categoria (com repetição de termos)
+    term_category = indicator(
+        ((term_index[term], term_categories) for term, term_categories in matcher.term_categories.items()),
+        (len(term_index), len(categories))
+    )
+    
+    # Matriz documento x termo (ocorrências repetidas são somadas)
+    doc_ids, term_ids = matcher.count_terms_batch([text.lower() for text in texts])
+    doc_term = sparse.csr_matrix(
+        (np.ones(len(doc_ids), dtype=np.int64), (doc_ids, term_ids)),
+        shape=(len(texts), len(term_index))
+    )
+    text_scores = (doc_term @ term_category).toarray()
+    
+    # Categorias encontradas só pelas palavras-chave (sempre acima do limiar,
+    # pois valem 2 cada), na ordem de categorize_article: percorrendo as
+    # palavras-chave de cada documento na ordem em que foram extraídas
+    threshold = 1
+    from_text = (text_scores >= threshold).tolist()
+    
+    results = []
+    for doc_id, (text, text_row) in enumerate(zip(texts, from_text)):
+        if not text:
+            results.append([])
+            continue
+        assigned = [category for category, hit in zip(categories, text_row) if hit]
+        doc_keywords = keywords[doc_id] if keywords is not None else None
+        if doc_keywords is not None:
+            found = set(assigned)
+            for keyword in doc_keywords:
+                for category in matcher.keyword_categories(keyword.lower()):
+                    if category not in found:
+                        found.add(category)
+                        assigned.append(category)
+        results.append(assigned or ['outros'])
+    
+    return results
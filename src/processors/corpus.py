@@ -0,0 +1,208 @@
+import os
+import mmap
+import logging
+import numpy as np
+from src.utils.helpers import ensure_dir
+
+logger = logging.getLogger(__name__)
+
+# Local padrão do corpus de textos limpos (gera corpus.bin e corpus.idx.npz)
+DEFAULT_CORPUS_PATH = 'data/processed/corpus'
+
+# Campos de texto limpo gravados no corpus (as traduções também são limpas)
+CORPUS_FIELDS = [
+    'clean_title', 'clean_abstract', 'clean_content',
+    'translated_title', 'translated_abstract', 'translated_content'
+]
+
+# Fração de versões substituídas acima da qual o corpus é compactado ao ser reaberto com append=True
+COMPACT_FRACTION = 0.25
+
+def corpus_files(path):
+    """Arquivos do corpus: textos concatenados e índice"""
+    return f"{path}.bin", f"{path}.idx.npz"
+
+class CorpusWriter:
+    """
+    Grava textos limpos no corpus consolidado, artigo a artigo.
+
+    Os textos são concatenados em UTF-8 em um único arquivo binário e o
+    índice (início e tamanho em bytes de cada campo de cada artigo, e o id
+    do artigo) é gravado em NumPy ao fechar. Com append=True, os artigos
+    são acrescentados ao corpus existente (um id repetido passa a apontar
+    para a versão mais recente); um corpus existente com outros campos é
+    substituído. Se mais de COMPACT_FRACTION dos artigos do corpus existente
+    forem versões substituídas, ele é compactado antes de receber os novos
+    artigos, mantendo só a versão mais recente de cada id.
+    """
+
+    def __init__(self, path=DEFAULT_CORPUS_PATH, fields=None, append=False):
+        self.path = path
+        self.fields = list(fields or CORPUS_FIELDS)
+        self.blob_path, self.index_path = corpus_files(path)
+        ensure_dir(os.path.dirname(path) or '.')
+
+        self.offsets, self.lengths, self.ids = [], [], []
+        if append and os.path.exists(self.index_path) and os.path.exists(self.blob_path):
+            with np.load(self.index_path) as index:
+                fields = [str(field) for field in index['fields']]
+                if fields == self.fields:
+                    self.offsets = index['offsets'].tolist()
+                    self.lengths = index['lengths'].tolist()
+                    self.ids = index['ids'].tolist()
+                    superseded = len(self.ids) - len(self._latest_positions())
+                    if superseded > COMPACT_FRACTION * len(self.ids):
+                        self._compact()
+                else:
+                    logger.warning(f"Corpus em {path} tem os campos {fields}, e não {self.fields}; será recriado")
+                    append = False
+        self._file = open(self.blob_path, 'ab' if append and self.ids else 'wb')
+        self._position = self._file.tell()
+
+    def _latest_positions(self):
+        """Posições mantidas na compactação: a versão mais recente de cada id (e artigos sem id)"""
+        latest = {}
+        for i, article_id in enumerate(self.ids):
+            latest[article_id or i] = i
+        return sorted(latest.values())
+
+    def _compact(self):
+        """Reescreve o arquivo de textos e o índice só com a versão mais recente de cada artigo"""
+        keep = self._latest_positions()
+        removed = len(self.ids) - len(keep)
+        offsets, lengths = [], []
+        position = 0
+        with open(self.blob_path, 'rb') as source, open(self.blob_path + '.tmp', 'wb') as target:
+            for i in keep:
+                row = []
+                for offset, length in zip(self.offsets[i], self.lengths[i]):
+                    source.seek(offset)
+                    target.write(source.read(length))
+                    row.append(position)
+                    position += length
+                offsets.append(row)
+                lengths.append(self.lengths[i])
+        os.replace(self.blob_path + '.tmp', self.blob_path)
+
+        self.offsets, self.lengths = offsets, lengths
+        self.ids = [self.ids[i] for i in keep]
+        self._save_index()
+        logger.info(f"Corpus em {self.blob_path} compactado: {removed} versões substituídas removidas")
+
+    def _save_index(self):
+        n_fields = len(self.fields)
+        np.savez(
+            self.index_path,
+            fields=np.array(self.fields),
+            offsets=np.array(self.offsets, dtype=np.int64).reshape(-1, n_fields),
+            lengths=np.array(self.lengths, dtype=np.int64).reshape(-1, n_fields),
+            ids=np.array(self.ids, dtype=str)
+        )
+
+    def write(self, record):
+        """
+        Acrescenta os textos de um artigo (campos ausentes viram texto vazio).
+
+        Returns:
+            int: Posição do artigo no corpus
+        """
+        offsets, lengths = [], []
+        for field in self.fields:
+            value = record.get(field)
+            data = value.encode('utf-8') if isinstance(value, str) else b''
+            self._file.write(data)
+            offsets.append(self._position)
+            lengths.append(len(data))
+            self._position += len(data)
+        self.offsets.append(offsets)
+        self.lengths.append(lengths)
+        self.ids.append(str(record.get('id') or ''))
+        return len(self.ids) - 1
+
+    def write_batch(self, records):
+        """Acrescenta vários artigos e devolve as suas posições no corpus"""
+        return [self.write(record) for record in records]
+
+    def close(self):
+        """Fecha o arquivo de textos e grava o índice"""
+        self._file.close()
+        self._save_index()
+        logger.info(f"Corpus de textos limpos salvo em {self.blob_path} ({len(self.ids)} artigos)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class TextCorpus:
+    """
+    Corpus de textos limpos mapeado em memória.
+
+    O arquivo de textos é aberto com mmap e cada texto é devolvido como um
+    memoryview da região correspondente, sem cópia e sem decodificar JSON.
+    Ao ser serializado (por exemplo, ao ser enviado a um processo de um
+    pool), o corpus leva apenas o caminho e é reaberto no destino, então os
+    processos compartilham os textos pelo cache de páginas do sistema.
+    """
+
+    def __init__(self, path=DEFAULT_CORPUS_PATH):
+        self.path = path
+        self.blob_path, self.index_path = corpus_files(path)
+        with np.load(self.index_path) as index:
+            self.fields = [str(field) for field in index['fields']]
+            self.offsets = index['offsets']
+            self.lengths = index['lengths']
+            self.ids = index['ids']
+
+        self._file = open(self.blob_path, 'rb')
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer = memoryview(self._mmap)
+        else:
+            self._mmap = None
+            self._buffer = memoryview(b'')
+        self._positions = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def position(self, article_id):
+        """Posição da versão mais recente de um artigo no corpus, ou None"""
+        if self._positions is None:
+            self._positions = {str(article_id): i for i, article_id in enumerate(self.ids)}
+        return self._positions.get(article_id)
+
+    def view(self, i, field='clean_content'):
+        """Texto de um campo do i-ésimo artigo como memoryview (UTF-8), sem cópia"""
+        j = self.fields.index(field)
+        start = int(self.offsets[i, j])
+        return self._buffer[start:start + int(self.lengths[i, j])]
+
+    def text(self, i, field='clean_content'):
+        """Texto de um campo do i-ésimo artigo, decodificado"""
+        return str(self.view(i, field), 'utf-8')
+
+    def texts(self, field='clean_content'):
+        """Itera pelos textos de um campo, na ordem do corpus"""
+        for i in range(len(self)):
+            yield self.text(i, field)
+
+    def close(self):
+        """Libera o mapeamento (memoryviews obtidos com view() devem ter sido liberados)"""
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
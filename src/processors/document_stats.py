@@ -0,0 +1,89 @@
+import numpy as np
+from src.utils.helpers import text_fingerprint
+
+class DocumentFrequencies:
+    """
+    Frequência de documentos por termo, mantida por documento.
+
+    Cada documento é identificado por uma chave (o id do artigo, ou a
+    impressão digital do texto quando não há id) e guarda a impressão
+    digital do texto e os termos que contribuiu. Reprocessar o mesmo texto
+    não altera as estatísticas; um artigo editado tem os termos da versão
+    anterior subtraídos antes de os da nova serem somados. Assim o número de
+    documentos é o de artigos distintos, e não cresce com as reexecuções.
+    """
+
+    def __init__(self, n_features=0):
+        self.document_frequency = np.zeros(n_features, dtype=np.int64)
+        # Chave do documento -> (impressão digital do texto, índices dos termos)
+        self.documents = {}
+
+    @property
+    def n_documents(self):
+        return len(self.documents)
+
+    def grow(self, n_features):
+        """Estende as frequências para um vocabulário maior"""
+        if len(self.document_frequency) < n_features:
+            self.document_frequency = np.concatenate([
+                self.document_frequency,
+                np.zeros(n_features - len(self.document_frequency), dtype=np.int64)
+            ])
+
+    def update(self, texts, counts, keys=None):
+        """
+        Incorpora um lote de documentos às frequências.
+
+        Args:
+            texts: Lista de textos
+            counts: Matriz de contagens (csr, sem índices duplicados) dos textos
+            keys: Chave (texto) de cada documento, por exemplo o id do artigo;
+                sem chave, o texto é identificado pela própria impressão digital
+
+        Returns:
+            list: Linhas de documentos com chave ainda não vista
+        """
+        self.grow(counts.shape[1])
+        new_rows = []
+        for row, text in enumerate(texts):
+            fingerprint = text_fingerprint(text)
+            key = keys[row] if keys is not None else None
+            if not isinstance(key, str) or not key:
+                # Sem id (ausente ou NA): o texto é a própria chave
+                key = f'#{fingerprint}'
+
+            previous = self.documents.get(key)
+            if previous is not None and previous[0] == fingerprint:
+                continue
+            if previous is None:
+                new_rows.append(row)
+            else:
+                self.document_frequency[previous[1]] -= 1
+
+            terms = counts.indices[counts.indptr[row]:counts.indptr[row + 1]].astype(np.int32)
+            self.document_frequency[terms] += 1
+            self.documents[key] = (fingerprint, terms)
+        return new_rows
+
+    def state(self):
+        """Estado em arrays, para persistência (chaves, impressões digitais e termos em CSR)"""
+        terms = [entry[1] for entry in self.documents.values()]
+        return {
+            'document_frequency': self.document_frequency,
+            'document_keys': np.array(list(self.documents), dtype=str),
+            'document_fingerprints': np.fromiter(
+                (entry[0] for entry in self.documents.values()), dtype=np.uint64, count=len(self.documents)
+            ),
+            'document_offsets': np.cumsum([0] + [len(t) for t in terms], dtype=np.int64),
+            'document_terms': np.concatenate(terms) if terms else np.zeros(0, dtype=np.int32),
+        }
+
+    @classmethod
+    def from_state(cls, data):
+        """Reconstrói as frequências a partir de state()"""
+        frequencies = cls()
+        frequencies.document_frequency = np.asarray(data['document_frequency'], dtype=np.int64)
+        offsets, terms = data['document_offsets'], data['document_terms'].astype(np.int32)
+        for i, (key, fingerprint) in enumerate(zip(data['document_keys'], data['document_fingerprints'])):
+            frequencies.documents[str(key)] = (int(fingerprint), terms[offsets[i]:offsets[i + 1]])
+        return frequencies
@@ -0,0 +1,195 @@
+import os
+import logging
+import numpy as np
+from scipy import sparse
+from .text_processor import TextProcessor
+from .document_stats import DocumentFrequencies
+from src.utils.helpers import ensure_dir
+
+logger = logging.getLogger(__name__)
+
+# Número máximo de células densas por bloco na seleção dos top-n termos
+DENSE_BLOCK_CELLS = 2 ** 22
+
+class TfidfKeywordExtractor:
+    """
+    Extrai palavras-chave por TF-IDF calculado sobre todo o corpus.
+
+    Usa o mesmo pré-processamento de TextProcessor.extract_keywords (stopwords,
+    stems RSLP e termos com mais de 2 caracteres). As estatísticas de IDF
+    (frequência de documentos por termo e total de documentos) são acumuladas
+    de forma incremental e podem ser persistidas entre execuções. Elas são
+    mantidas por artigo (DocumentFrequencies): reprocessar os mesmos artigos
+    não infla as frequências de documentos, e um artigo editado substitui a
+    contribuição da versão anterior.
+    """
+
+    def __init__(self, text_processor=None):
+        self.text_processor = text_processor or TextProcessor()
+        self.vocabulary = {}
+        self.statistics = DocumentFrequencies()
+
+    @property
+    def document_frequency(self):
+        return self.statistics.document_frequency
+
+    @property
+    def n_documents(self):
+        return self.statistics.n_documents
+
+    def analyze(self, text):
+        """Tokens usados no cálculo do TF-IDF"""
+        if not text or not isinstance(text, str):
+            return []
+        return [token for token in self.text_processor.preprocess_text(text) if len(token) > 2]
+
+    def count_matrix(self, texts, grow=True):
+        """
+        Monta a matriz esparsa documento x termo com as frequências dos termos.
+
+        Args:
+            texts: Lista de textos
+            grow: Incluir no vocabulário os termos ainda não vistos
+
+        Returns:
+            scipy.sparse.csr_matrix: Matriz de contagens
+        """
+        indptr, indices = [0], []
+        for text in texts:
+            for token in self.analyze(text):
+                term_id = self.vocabulary.get(token)
+                if term_id is None:
+                    if not grow:
+                        continue
+                    term_id = self.vocabulary[token] = len(self.vocabulary)
+                indices.append(term_id)
+            indptr.append(len(indices))
+
+        counts = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float64), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(texts), len(self.vocabulary))
+        )
+        counts.sum_duplicates()
+        return counts
+
+    def partial_fit(self, texts, ids=None):
+        """
+        Atualiza as estatísticas de IDF com os documentos novos ou alterados.
+
+        Artigos com o mesmo texto já contado (nesta ou em execuções anteriores)
+        não alteram as estatísticas; um artigo cujo texto mudou tem os termos
+        da versão anterior substituídos pelos da nova.
+
+        Args:
+            texts: Lista de textos
+            ids: Id do artigo de cada texto (opcional; sem ids, cada texto distinto é um documento)
+
+        Returns:
+            scipy.sparse.csr_matrix: Matriz de contagens de todos os documentos
+        """
+        counts = self.count_matrix(texts, grow=True)
+        self.statistics.update(texts, counts, ids)
+        return counts
+
+    @property
+    def idf(self):
+        """IDF suavizado: log((1 + n) / (1 + df)) + 1"""
+        return np.log((1 + self.n_documents) / (1 + self.document_frequency)) + 1
+
+    def tfidf(self, counts):
+        """Aplica os pesos de IDF a uma matriz de contagens"""
+        idf = self.idf
+        if counts.shape[1] < len(idf):
+            counts = sparse.csr_matrix((counts.data, counts.indices, counts.indptr), shape=(counts.shape[0], len(idf)))
+        return counts @ sparse.diags(idf[:counts.shape[1]])
+
+    def top_terms(self, matrix, top_n=10):
+        """
+        Seleciona os top_n termos de maior peso em cada linha.
+
+        A seleção é feita em blocos densos de linhas com np.argpartition;
+        empates são resolvidos pela ordem de entrada do termo no vocabulário.
+
+        Returns:
+            list: Lista de termos de cada documento
+        """
+        matrix = sparse.csr_matrix(matrix)
+        n_rows, n_terms = matrix.shape
+        if n_terms == 0 or top_n <= 0:
+            return [[] for _ in range(n_rows)]
+
+        terms = np.empty(len(self.vocabulary), dtype=object)
+        for term, term_id in self.vocabulary.items():
+            terms[term_id] = term
+
+        k = min(top_n, n_terms)
+        block_rows = max(1, DENSE_BLOCK_CELLS // n_terms)
+        results = []
+        for start in range(0, n_rows, block_rows):
+            block = matrix[start:start + block_rows].toarray()
+            candidates = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            scores = np.take_along_axis(block, candidates, axis=1)
+
+            # Empates no k-ésimo peso (positivo): argpartition escolhe qualquer
+            # um dos termos empatados, então essas linhas usam ordenação estável
+            kth = scores.min(axis=1)
+            ties = ((block >= kth[:, None]).sum(axis=1) > k) & (kth > 0)
+            for row in np.flatnonzero(ties):
+                candidates[row] = np.argsort(-block[row], kind='stable')[:k]
+                scores[row] = block[row, candidates[row]]
+
+            # Ordenar candidatos por peso decrescente e, no empate, pelo índice do termo
+            order = np.lexsort((candidates, -scores), axis=1)
+            candidates = np.take_along_axis(candidates, order, axis=1)
+            scores = np.take_along_axis(scores, order, axis=1)
+
+            for row_terms, row_scores in zip(candidates, scores):
+                results.append(terms[row_terms[row_scores > 0]].tolist())
+        return results
+
+    def extract(self, texts, top_n=10, update=True, ids=None):
+        """
+        Extrai as palavras-chave de um lote de textos.
+
+        Args:
+            texts: Lista de textos
+            top_n: Número de palavras-chave por texto
+            update: Incorporar os textos novos ou alterados às estatísticas de IDF antes de pontuar
+            ids: Id do artigo de cada texto (opcional)
+
+        Returns:
+            list: Lista de palavras-chave de cada texto
+        """
+        counts = self.partial_fit(texts, ids) if update else self.count_matrix(texts, grow=False)
+        return self.top_terms(self.tfidf(counts), top_n)
+
+    def save(self, path):
+        """Persiste vocabulário e estatísticas de IDF (por artigo) em um arquivo .npz"""
+        ensure_dir(os.path.dirname(path) or '.')
+
+        terms = np.empty(len(self.vocabulary), dtype=object)
+        for term, term_id in self.vocabulary.items():
+            terms[term_id] = term
+
+        np.savez_compressed(
+            path,
+            terms=terms.astype(str),
+            **self.statistics.state()
+        )
+
+    @classmethod
+    def load(cls, path, text_processor=None):
+        """Carrega um extrator salvo, ou cria um novo se o arquivo não existir"""
+        extractor = cls(text_processor)
+        if os.path.exists(path):
+            with np.load(path) as data:
+                extractor.vocabulary = {str(term): i for i, term in enumerate(data['terms'])}
+                if 'document_keys' in data:
+                    extractor.statistics = DocumentFrequencies.from_state(data)
+                else:
+                    # Formato anterior, sem os termos de cada artigo: as frequências
+                    # não podem ser corrigidas por artigo e são recalculadas
+                    logger.warning(f"Estatísticas de IDF em {path} no formato anterior; serão recalculadas")
+                    extractor.statistics.grow(len(extractor.vocabulary))
+            logger.info(f"Estatísticas de IDF carregadas de {path} ({extractor.n_documents} documentos)")
+        return extractor
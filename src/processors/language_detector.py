@@ -0,0 +1,194 @@
+import math
+import logging
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+# Tamanho dos n-gramas de caracteres
+NGRAM_SIZE = 3
+
+# Número de n-gramas mantidos em cada perfil
+PROFILE_SIZE = 400
+
+# Caracteres analisados por documento (o início do texto basta para identificar o idioma)
+MAX_CHARS = 1500
+
+# Mínimo de n-gramas e de diferença média de log-probabilidade por n-grama
+# para aceitar o resultado; abaixo disso mantém-se o idioma informado (textos de
+# duas ou três palavras, como "portal de beneficios", são ambíguos entre pt e es)
+MIN_NGRAMS = 40
+MIN_MARGIN = 0.3
+
+# Arquivo gerado com os perfis de idioma distribuídos com o pacote
+PROFILES_MODULE_PATH = 'src/processors/language_profiles.py'
+
+# Textos de exemplo (<idioma>.txt) dos idiomas sem fonte própria em data/raw,
+# como o espanhol de parte dos resumos do Google Scholar
+LANGUAGE_SAMPLES_DIR = 'data/language_samples'
+
+def char_ngrams(text, n=NGRAM_SIZE):
+    """
+    Conta os n-gramas de caracteres do texto, com as palavras delimitadas por espaço.
+
+    Args:
+        text (str): Texto limpo (minúsculo, sem pontuação)
+        n (int): Tamanho dos n-gramas
+
+    Returns:
+        Counter: Contagem de cada n-grama
+    """
+    padded = ' ' + ' '.join(text[:MAX_CHARS].split()) + ' '
+    return Counter(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+def build_profiles(texts_by_language, size=PROFILE_SIZE):
+    """
+    Monta os perfis de idioma a partir de textos de exemplo.
+
+    Cada perfil guarda a log-probabilidade dos size n-gramas mais frequentes
+    e um valor mínimo usado para os n-gramas ausentes.
+
+    Args:
+        texts_by_language (dict): Idioma -> lista de textos limpos
+        size (int): Número de n-gramas por perfil
+
+    Returns:
+        dict: Idioma -> {'ngrams': {n-grama: log-probabilidade}, 'floor': float}
+    """
+    profiles = {}
+    for language, texts in texts_by_language.items():
+        counts = Counter()
+        for text in texts:
+            padded = ' ' + ' '.join(text.split()) + ' '
+            counts.update(padded[i:i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1))
+
+        total = sum(counts.values())
+        top = counts.most_common(size)
+        profiles[language] = {
+            'ngrams': {ngram: round(math.log(count / total), 3) for ngram, count in top},
+            # Metade da probabilidade do n-grama menos frequente do perfil
+            'floor': round(math.log(top[-1][1] / total / 2), 3) if top else 0.0,
+        }
+    return profiles
+
+def write_profiles_module(profiles, path=PROFILES_MODULE_PATH):
+    """Grava os perfis como um módulo Python distribuído com o pacote"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('# Gerado por src.processors.language_detector; não editar manualmente\n\n')
+        f.write('PROFILES = {\n')
+        for language, profile in profiles.items():
+            f.write(f"    {language!r}: {{\n        'floor': {profile['floor']!r},\n        'ngrams': {{\n")
+            for ngram, logprob in profile['ngrams'].items():
+                f.write(f'            {ngram!r}: {logprob!r},\n')
+            f.write('        },\n    },\n')
+        f.write('}\n')
+
+class LanguageDetector:
+    """
+    Identificador de idioma offline por perfis de trigramas de caracteres.
+
+    Pontua o texto como um classificador Naive Bayes sobre os trigramas e
+    devolve o idioma mais provável, ou o idioma padrão quando o texto é curto
+    demais ou a diferença entre os perfis é pequena.
+    """
+
+    def __init__(self, profiles=None):
+        if profiles is None:
+            from .language_profiles import PROFILES
+            profiles = PROFILES
+        self.languages = list(profiles)
+        self.floors = [profiles[language]['floor'] for language in self.languages]
+
+        # Trigrama -> log-probabilidades em cada idioma
+        self.table = {}
+        for i, language in enumerate(self.languages):
+            for ngram, logprob in profiles[language]['ngrams'].items():
+                self.table.setdefault(ngram, list(self.floors))[i] = logprob
+
+    def scores(self, text):
+        """Log-verossimilhança do texto em cada idioma e número de trigramas"""
+        counts = char_ngrams(text)
+        scores = [0.0] * len(self.languages)
+        total = 0
+        for ngram, count in counts.items():
+            total += count
+            logprobs = self.table.get(ngram)
+            if logprobs is None:
+                continue  # Ausente de todos os perfis: não distingue os idiomas
+            for i, logprob in enumerate(logprobs):
+                scores[i] += count * logprob
+        return scores, total
+
+    def detect(self, text, default=None):
+        """
+        Identifica o idioma do texto.
+
+        Args:
+            text (str): Texto limpo (minúsculo, sem pontuação)
+            default (str): Idioma devolvido quando não há confiança suficiente
+
+        Returns:
+            str: Código do idioma
+        """
+        if not text or not isinstance(text, str):
+            return default
+
+        scores, total = self.scores(text)
+        if total < MIN_NGRAMS:
+            return default
+
+        ranked = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+        if len(ranked) > 1 and (scores[ranked[0]] - scores[ranked[1]]) / total < MIN_MARGIN:
+            return default
+        return self.languages[ranked[0]]
+
+_detector = None
+
+def get_language_detector():
+    """Detector com os perfis distribuídos com o pacote (criado uma única vez)"""
+    global _detector
+    if _detector is None:
+        _detector = LanguageDetector()
+    return _detector
+
+def detect_language(text, default=None):
+    """
+    Identifica o idioma de um texto com os perfis distribuídos com o pacote.
+
+    Args:
+        text (str): Texto limpo (minúsculo, sem pontuação)
+        default (str): Idioma devolvido quando não há confiança suficiente
+
+    Returns:
+        str: Código do idioma ('pt', 'en' ou 'es')
+    """
+    return get_language_detector().detect(text, default)
+
+if __name__ == '__main__':
+    # Regenera os perfis a partir dos artigos em data/raw cujas fontes têm idioma
+    # conhecido e dos textos de exemplo dos demais idiomas
+    import os
+    from .text_processor import TextProcessor
+    from src.utils.helpers import iter_articles
+
+    SOURCE_LANGUAGES = {'ABRAFAC': 'pt', 'InfraFM': 'pt', 'IFMA Blog': 'en'}
+
+    logging.basicConfig(level=logging.INFO)
+    text_processor = TextProcessor()
+    texts_by_language = {}
+    for article in iter_articles('data/raw'):
+        language = SOURCE_LANGUAGES.get(article.get('source'))
+        if language:
+            text = ' '.join(article.get(field) or '' for field in ('title', 'content'))
+            texts_by_language.setdefault(language, []).append(text_processor.clean_text(text))
+
+    for filename in sorted(os.listdir(LANGUAGE_SAMPLES_DIR)):
+        language, extension = os.path.splitext(filename)
+        if extension == '.txt':
+            with open(os.path.join(LANGUAGE_SAMPLES_DIR, filename), encoding='utf-8') as f:
+                paragraphs = [paragraph for paragraph in f.read().split('\n\n') if paragraph.strip()]
+            texts_by_language.setdefault(language, []).extend(
+                text_processor.clean_text(paragraph) for paragraph in paragraphs
+            )
+
+    write_profiles_module(build_profiles(texts_by_language))
+    logger.info(f"Perfis de idioma gravados em {PROFILES_MODULE_PATH}")
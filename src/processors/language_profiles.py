@@ -0,0 +1,1219 @@
+# Gerado por src.processors.language_detector; não editar manualmente
+
+PROFILES = {
+    'en': {
+        'floor': -8.035,
+        'ngrams': {
+            ' th': -4.529,
+            'the': -4.689,
+            'ing': -4.869,
+            'ng ': -4.932,
+            'he ': -5.074,
+            ' to': -5.109,
+            'and': -5.116,
+            'nd ': -5.123,
+            ' an': -5.153,
+            'es ': -5.168,
+            ' in': -5.222,
+            'ent': -5.23,
+            'to ': -5.255,
+            're ': -5.263,
+            'on ': -5.271,
+            'you': -5.387,
+            ' yo': -5.396,
+            'ion': -5.396,
+            'or ': -5.486,
+            ' of': -5.551,
+            ' a ': -5.551,
+            's a': -5.573,
+            ' co': -5.573,
+            'er ': -5.584,
+            'ty ': -5.596,
+            'ce ': -5.596,
+            'ed ': -5.608,
+            'e t': -5.62,
+            'al ': -5.632,
+            'ity': -5.644,
+            'in ': -5.656,
+            'ati': -5.681,
+            ' pr': -5.694,
+            'our': -5.707,
+            'are': -5.707,
+            'e a': -5.72,
+            'men': -5.72,
+            'an ': -5.733,
+            'tio': -5.733,
+            's t': -5.746,
+            ' ma': -5.788,
+            'pro': -5.802,
+            'of ': -5.846,
+            'for': -5.876,
+            'ur ': -5.907,
+            ' fo': -5.923,
+            'lit': -5.923,
+            ' ex': -5.923,
+            ' ca': -5.923,
+            'th ': -5.94,
+            ' re': -5.94,
+            'is ': -5.956,
+            'ly ': -5.99,
+            'nce': -5.99,
+            'ts ': -5.99,
+            ' be': -6.007,
+            'per': -6.025,
+            'ate': -6.025,
+            ' fa': -6.043,
+            ' he': -6.043,
+            'man': -6.061,
+            'can': -6.061,
+            'con': -6.061,
+            'fac': -6.08,
+            've ': -6.08,
+            'ili': -6.099,
+            ' me': -6.119,
+            'ou ': -6.138,
+            'e i': -6.138,
+            'lea': -6.138,
+            'ter': -6.159,
+            'ess': -6.159,
+            'ers': -6.159,
+            'rea': -6.179,
+            ' ar': -6.2,
+            ' is': -6.222,
+            'e c': -6.222,
+            'e s': -6.222,
+            'st ': -6.266,
+            'age': -6.266,
+            ' wh': -6.289,
+            'at ': -6.313,
+            'aci': -6.313,
+            'n t': -6.313,
+            'cil': -6.337,
+            'e o': -6.337,
+            'enc': -6.337,
+            'rs ': -6.337,
+            'wor': -6.362,
+            'nt ': -6.362,
+            ' bu': -6.362,
+            'nin': -6.387,
+            'res': -6.387,
+            ' wi': -6.387,
+            'e b': -6.387,
+            ' on': -6.387,
+            'n a': -6.387,
+            'r c': -6.413,
+            'e e': -6.413,
+            'exp': -6.439,
+            't t': -6.439,
+            'ace': -6.439,
+            'est': -6.467,
+            'all': -6.467,
+            'se ': -6.467,
+            'ork': -6.467,
+            'eri': -6.467,
+            ' wo': -6.467,
+            's i': -6.467,
+            ' st': -6.495,
+            'te ': -6.495,
+            's o': -6.495,
+            't a': -6.495,
+            'rat': -6.495,
+            ' ha': -6.495,
+            'y t': -6.495,
+            'g a': -6.495,
+            'wit': -6.495,
+            'duc': -6.495,
+            's c': -6.524,
+            ' de': -6.524,
+            'd t': -6.524,
+            ' su': -6.524,
+            'le ': -6.524,
+            'tin': -6.524,
+            'eal': -6.524,
+            'ust': -6.554,
+            ' se': -6.554,
+            ' sh': -6.585,
+            'y m': -6.585,
+            ' as': -6.585,
+            'fic': -6.585,
+            ' en': -6.585,
+            'ut ': -6.585,
+            'tor': -6.585,
+            ' li': -6.585,
+            'ss ': -6.616,
+            'hat': -6.616,
+            'cti': -6.616,
+            'ect': -6.616,
+            'ure': -6.616,
+            'alt': -6.616,
+            'ns ': -6.616,
+            'fm ': -6.649,
+            'red': -6.649,
+            'int': -6.649,
+            'ere': -6.649,
+            ' mo': -6.649,
+            'ces': -6.649,
+            't i': -6.649,
+            'ana': -6.649,
+            'nag': -6.649,
+            'tes': -6.649,
+            'ica': -6.649,
+            'her': -6.649,
+            'hea': -6.649,
+            'ial': -6.683,
+            'nte': -6.683,
+            'e p': -6.683,
+            'ort': -6.683,
+            'e f': -6.683,
+            "'s ": -6.683,
+            ' or': -6.683,
+            ' cl': -6.683,
+            'ith': -6.683,
+            'lth': -6.683,
+            'cre': -6.718,
+            'ry ': -6.718,
+            'e y': -6.718,
+            'tha': -6.718,
+            'ons': -6.718,
+            'com': -6.718,
+            ' le': -6.718,
+            'eas': -6.718,
+            'ne ': -6.718,
+            's w': -6.718,
+            'ow ': -6.718,
+            ' mi': -6.755,
+            'as ': -6.755,
+            'e w': -6.755,
+            'n e': -6.755,
+            'mpl': -6.755,
+            's f': -6.755,
+            'por': -6.755,
+            ' em': -6.755,
+            'emp': -6.755,
+            'ive': -6.755,
+            'nti': -6.792,
+            'ain': -6.792,
+            'ger': -6.792,
+            'xpe': -6.792,
+            ' no': -6.792,
+            'ge ': -6.792,
+            'sio': -6.792,
+            ' ne': -6.792,
+            'et ': -6.792,
+            'ien': -6.792,
+            ' al': -6.792,
+            ' ho': -6.792,
+            'nto': -6.792,
+            'ear': -6.832,
+            'hel': -6.832,
+            'e r': -6.832,
+            'd a': -6.832,
+            ' we': -6.832,
+            'r i': -6.832,
+            'am ': -6.832,
+            'str': -6.832,
+            'cat': -6.832,
+            'din': -6.832,
+            'act': -6.832,
+            'ssi': -6.832,
+            'ore': -6.832,
+            'n f': -6.832,
+            'r a': -6.832,
+            'g t': -6.832,
+            'cle': -6.832,
+            ' cf': -6.872,
+            'cfm': -6.872,
+            ' te': -6.872,
+            'exa': -6.872,
+            't m': -6.872,
+            'thi': -6.872,
+            'one': -6.872,
+            'tur': -6.872,
+            'igh': -6.872,
+            'sti': -6.915,
+            'r e': -6.915,
+            'ave': -6.915,
+            'tiv': -6.915,
+            'ies': -6.915,
+            ' ch': -6.915,
+            'how': -6.915,
+            's b': -6.915,
+            'rk ': -6.915,
+            'sin': -6.915,
+            'ass': -6.915,
+            'off': -6.915,
+            'ver': -6.915,
+            'ani': -6.915,
+            ' im': -6.915,
+            'imp': -6.915,
+            'pac': -6.915,
+            'xam': -6.959,
+            'ind': -6.959,
+            'hav': -6.959,
+            'e m': -6.959,
+            'anc': -6.959,
+            'ice': -6.959,
+            'eme': -6.959,
+            't o': -6.959,
+            'r t': -6.959,
+            'll ': -6.959,
+            'y c': -6.959,
+            'ir ': -6.959,
+            'sha': -6.959,
+            'ffi': -6.959,
+            'ean': -6.959,
+            'ght': -6.959,
+            'en ': -6.959,
+            's m': -7.006,
+            'tra': -7.006,
+            'e d': -7.006,
+            'nta': -7.006,
+            'der': -7.006,
+            'ors': -7.006,
+            'ine': -7.006,
+            'rie': -7.006,
+            'ide': -7.006,
+            'ds ': -7.006,
+            'y a': -7.006,
+            'tal': -7.006,
+            'rin': -7.006,
+            'plo': -7.006,
+            'ste': -7.055,
+            ' cr': -7.055,
+            'den': -7.055,
+            'tia': -7.055,
+            ' if': -7.055,
+            'ert': -7.055,
+            'd c': -7.055,
+            'l t': -7.055,
+            'it ': -7.055,
+            'd s': -7.055,
+            'n s': -7.055,
+            'r m': -7.055,
+            't f': -7.055,
+            's s': -7.055,
+            'edu': -7.055,
+            's p': -7.055,
+            'har': -7.055,
+            ' ic': -7.055,
+            'ico': -7.055,
+            ' sp': -7.055,
+            ' us': -7.055,
+            ' fr': -7.055,
+            'pla': -7.055,
+            'ead': -7.106,
+            'rti': -7.106,
+            'des': -7.106,
+            'not': -7.106,
+            ' it': -7.106,
+            ' ac': -7.106,
+            'r o': -7.106,
+            ' by': -7.106,
+            'elp': -7.106,
+            ' po': -7.106,
+            'ual': -7.106,
+            ' di': -7.106,
+            'n o': -7.106,
+            'cia': -7.106,
+            's e': -7.106,
+            'rod': -7.106,
+            'usi': -7.106,
+            'ell': -7.106,
+            'o t': -7.16,
+            'now': -7.16,
+            'ls ': -7.16,
+            'by ': -7.16,
+            'y f': -7.16,
+            'ey ': -7.16,
+            'ee ': -7.16,
+            'sur': -7.16,
+            'ch ': -7.16,
+            'out': -7.16,
+            'd p': -7.16,
+            'rom': -7.16,
+            'tim': -7.16,
+            'bui': -7.16,
+            'uil': -7.16,
+            'han': -7.16,
+            'odu': -7.16,
+            ' pe': -7.16,
+            'loy': -7.16,
+            'oye': -7.16,
+            'y s': -7.217,
+            'd i': -7.217,
+            'n i': -7.217,
+            'ost': -7.217,
+            'ign': -7.217,
+            'cou': -7.217,
+            'ot ': -7.217,
+            ' do': -7.217,
+            'ten': -7.217,
+            'ivi': -7.217,
+            'vit': -7.217,
+            'ill': -7.217,
+            'lig': -7.217,
+            't s': -7.217,
+            'n h': -7.217,
+            'ct ': -7.217,
+            ' ta': -7.217,
+            'hei': -7.217,
+            'ove': -7.217,
+            'ic ': -7.217,
+            'ms ': -7.217,
+            'his': -7.217,
+            'iat': -7.217,
+            'rop': -7.217,
+            'but': -7.217,
+            'uct': -7.217,
+            'wel': -7.217,
+            ' fu': -7.217,
+            'whe': -7.217,
+            'yee': -7.217,
+            'shi': -7.217,
+            ' so': -7.217,
+            'min': -7.278,
+            'sig': -7.278,
+            'n c': -7.278,
+            'sta': -7.278,
+            'iti': -7.278,
+            'ake': -7.278,
+            'ant': -7.278,
+            'car': -7.278,
+            'ona': -7.278,
+            'nal': -7.278,
+            'ope': -7.278,
+            ' ou': -7.278,
+            'als': -7.278,
+            'd b': -7.278,
+            'be ': -7.278,
+            'tic': -7.278,
+            'eir': -7.278,
+            'ffe': -7.278,
+            'soc': -7.278,
+            'oci': -7.278,
+            'ild': -7.278,
+            'e l': -7.278,
+            'ppo': -7.278,
+            'hip': -7.278,
+            'arn': -7.342,
+            'h t': -7.342,
+            'esi': -7.342,
+            'y e': -7.342,
+            ' kn': -7.342,
+            'kno': -7.342,
+            't c': -7.342,
+            'ay ': -7.342,
+            'y i': -7.342,
+        },
+    },
+    'pt': {
+        'floor': -8.094,
+        'ngrams': {
+            ' co': -4.674,
+            'os ': -4.683,
+            'de ': -4.712,
+            ' de': -4.722,
+            'es ': -4.847,
+            'do ': -4.904,
+            'fac': -4.952,
+            'con': -4.977,
+            'ent': -4.99,
+            'bra': -5.003,
+            'o a': -5.084,
+            ' ab': -5.098,
+            ' se': -5.142,
+            'abr': -5.172,
+            'eir': -5.172,
+            'raf': -5.22,
+            'afa': -5.22,
+            'ac ': -5.22,
+            'ado': -5.22,
+            'ao ': -5.236,
+            'res': -5.304,
+            ' ma': -5.321,
+            ' pr': -5.339,
+            'o d': -5.396,
+            'nte': -5.396,
+            'to ': -5.415,
+            'as ': -5.435,
+            'ro ': -5.497,
+            ' e ': -5.563,
+            's d': -5.563,
+            'nto': -5.586,
+            'tor': -5.586,
+            'ra ': -5.609,
+            'a a': -5.609,
+            'ons': -5.633,
+            ' do': -5.633,
+            'men': -5.658,
+            's c': -5.658,
+            'cao': -5.683,
+            'iro': -5.683,
+            'a d': -5.709,
+            'io ': -5.709,
+            'eto': -5.736,
+            'aca': -5.736,
+            'que': -5.736,
+            'mar': -5.736,
+            'da ': -5.791,
+            'elh': -5.791,
+            'cia': -5.82,
+            'o s': -5.85,
+            'com': -5.85,
+            ' as': -5.85,
+            'or ': -5.85,
+            'pro': -5.85,
+            ' em': -5.85,
+            'em ': -5.85,
+            'lhe': -5.85,
+            ' re': -5.881,
+            'ant': -5.881,
+            's p': -5.881,
+            's a': -5.881,
+            'dos': -5.881,
+            'ia ': -5.881,
+            'nse': -5.881,
+            'sel': -5.881,
+            'sta': -5.913,
+            'e a': -5.913,
+            'sso': -5.913,
+            'pre': -5.913,
+            'o c': -5.946,
+            ' pa': -5.946,
+            'hei': -5.946,
+            'o e': -5.979,
+            'ira': -5.979,
+            'a c': -5.979,
+            'est': -6.015,
+            'oci': -6.015,
+            'o p': -6.015,
+            ' di': -6.015,
+            ' a ': -6.051,
+            'o m': -6.051,
+            'e e': -6.089,
+            ' fa': -6.089,
+            'age': -6.089,
+            'ari': -6.089,
+            'ria': -6.089,
+            's e': -6.128,
+            'and': -6.128,
+            'soc': -6.169,
+            'tiv': -6.169,
+            'ass': -6.169,
+            'e f': -6.169,
+            ' me': -6.169,
+            'e s': -6.169,
+            'ili': -6.211,
+            'te ': -6.211,
+            'des': -6.211,
+            'is ': -6.211,
+            'ore': -6.211,
+            'ue ': -6.211,
+            'ida': -6.211,
+            'dad': -6.211,
+            ' da': -6.211,
+            'ran': -6.211,
+            'ndo': -6.256,
+            'no ': -6.256,
+            'e p': -6.256,
+            'nta': -6.256,
+            ' qu': -6.256,
+            'ire': -6.256,
+            'o r': -6.302,
+            'ion': -6.302,
+            'ty ': -6.302,
+            'aci': -6.302,
+            'r d': -6.351,
+            'tes': -6.351,
+            'dor': -6.351,
+            'car': -6.351,
+            'dir': -6.351,
+            ' in': -6.351,
+            'vol': -6.402,
+            'ona': -6.402,
+            ' no': -6.402,
+            'ras': -6.402,
+            'ert': -6.402,
+            'ais': -6.402,
+            's s': -6.402,
+            'ico': -6.402,
+            'cos': -6.402,
+            'ont': -6.402,
+            'tra': -6.402,
+            ' sa': -6.402,
+            'ade': -6.402,
+            'ret': -6.402,
+            'man': -6.456,
+            'cil': -6.456,
+            'lit': -6.456,
+            ' um': -6.456,
+            'eja': -6.456,
+            'ara': -6.456,
+            'a e': -6.456,
+            'ori': -6.456,
+            'se ': -6.456,
+            'co ': -6.456,
+            'ard': -6.456,
+            'o f': -6.456,
+            ' es': -6.514,
+            ' so': -6.514,
+            ' po': -6.514,
+            'a m': -6.514,
+            'ce ': -6.514,
+            'gem': -6.514,
+            'ver': -6.514,
+            'ser': -6.514,
+            'par': -6.514,
+            'a p': -6.514,
+            'ati': -6.574,
+            'ace': -6.574,
+            'ana': -6.574,
+            'nag': -6.574,
+            'e d': -6.574,
+            'ese': -6.574,
+            'sen': -6.574,
+            'mer': -6.574,
+            'ssi': -6.574,
+            'ar ': -6.574,
+            'a s': -6.574,
+            'ica': -6.574,
+            'end': -6.574,
+            'rio': -6.574,
+            ' en': -6.574,
+            'oni': -6.574,
+            ' an': -6.574,
+            'ici': -6.639,
+            'o b': -6.639,
+            'om ': -6.639,
+            ' o ': -6.639,
+            'er ': -6.639,
+            'cad': -6.639,
+            'sio': -6.639,
+            'rat': -6.639,
+            'ist': -6.639,
+            'na ': -6.639,
+            'ime': -6.639,
+            'rec': -6.639,
+            'eci': -6.639,
+            'art': -6.639,
+            'rti': -6.639,
+            'lho': -6.639,
+            'tos': -6.708,
+            ' at': -6.708,
+            'ivo': -6.708,
+            'set': -6.708,
+            'sil': -6.708,
+            'per': -6.708,
+            'nt ': -6.708,
+            'erc': -6.708,
+            'aco': -6.708,
+            'fis': -6.708,
+            'iss': -6.708,
+            'am ': -6.708,
+            'ora': -6.708,
+            ' ca': -6.708,
+            ' pe': -6.708,
+            'ess': -6.708,
+            'ta ': -6.708,
+            'nda': -6.708,
+            ' be': -6.782,
+            'cio': -6.782,
+            ' br': -6.782,
+            'wor': -6.782,
+            'ity': -6.782,
+            'y m': -6.782,
+            'eme': -6.782,
+            'rca': -6.782,
+            's o': -6.782,
+            'oes': -6.782,
+            'rof': -6.782,
+            'ofi': -6.782,
+            'sej': -6.782,
+            ' ag': -6.782,
+            'gen': -6.782,
+            'lo ': -6.782,
+            'e m': -6.782,
+            ' fi': -6.782,
+            'm a': -6.782,
+            'um ': -6.782,
+            'san': -6.782,
+            'rac': -6.782,
+            'al ': -6.862,
+            'fic': -6.862,
+            'olu': -6.862,
+            'e o': -6.862,
+            'ork': -6.862,
+            'e c': -6.862,
+            'o o': -6.862,
+            'eti': -6.862,
+            'env': -6.862,
+            'm e': -6.862,
+            'str': -6.862,
+            'sas': -6.862,
+            'o n': -6.862,
+            'iad': -6.862,
+            'nhe': -6.862,
+            'rei': -6.862,
+            ' ac': -6.862,
+            'ece': -6.862,
+            'ome': -6.862,
+            'ina': -6.862,
+            'nci': -6.862,
+            'und': -6.862,
+            'arc': -6.862,
+            'int': -6.862,
+            'ton': -6.862,
+            'rdo': -6.862,
+            ' ev': -6.949,
+            'ven': -6.949,
+            'por': -6.949,
+            'omo': -6.949,
+            ' te': -6.949,
+            'vos': -6.949,
+            ' wo': -6.949,
+            'lac': -6.949,
+            'unt': -6.949,
+            'iza': -6.949,
+            'coe': -6.949,
+            'ini': -6.949,
+            'mai': -6.949,
+            'onh': -6.949,
+            'hec': -6.949,
+            'ing': -6.949,
+            's f': -6.949,
+            'ima': -6.949,
+            'ber': -6.949,
+            'nad': -6.949,
+            'for': -6.949,
+            'eve': -7.044,
+            'luc': -7.044,
+            'enc': -7.044,
+            'iac': -7.044,
+            'asi': -7.044,
+            'ope': -7.044,
+            'pla': -7.044,
+            'ma ': -7.044,
+            'nai': -7.044,
+            'ntr': -7.044,
+            'min': -7.044,
+            'esa': -7.044,
+            'tad': -7.044,
+            'vic': -7.044,
+            'ulo': -7.044,
+            'ng ': -7.044,
+            'ja ': -7.044,
+            'anc': -7.044,
+            ' vo': -7.044,
+            'gra': -7.044,
+            ' al': -7.044,
+            'ere': -7.044,
+            'nov': -7.044,
+            're ': -7.044,
+            'ano': -7.044,
+            'jos': -7.044,
+            'ose': -7.044,
+            'ias': -7.15,
+            'c a': -7.15,
+            'lei': -7.15,
+            'rop': -7.15,
+            'rkp': -7.15,
+            'kpl': -7.15,
+            'r o': -7.15,
+            'ani': -7.15,
+            'jam': -7.15,
+            'ele': -7.15,
+            ' ad': -7.15,
+            ' ou': -7.15,
+            'aqu': -7.15,
+            'm d': -7.15,
+            'cim': -7.15,
+            ' ne': -7.15,
+            'ito': -7.15,
+            'so ': -7.15,
+            's b': -7.15,
+            'fm ': -7.15,
+            'c p': -7.15,
+            'e r': -7.15,
+            'uni': -7.15,
+            'ren': -7.15,
+            'atr': -7.15,
+            'ada': -7.15,
+            's m': -7.15,
+            ' ve': -7.15,
+            ' - ': -7.15,
+            'ale': -7.15,
+            'ian': -7.15,
+            'tin': -7.15,
+            'pau': -7.15,
+            'aul': -7.15,
+            'oli': -7.15,
+            'erg': -7.15,
+            'tat': -7.267,
+            'atu': -7.267,
+            'ile': -7.267,
+            'rty': -7.267,
+            'y w': -7.267,
+            'tan': -7.267,
+            ' ju': -7.267,
+            'vo ': -7.267,
+            'olv': -7.267,
+            'org': -7.267,
+            'niz': -7.267,
+            ' os': -7.267,
+            'ies': -7.267,
+            ' el': -7.267,
+            'ult': -7.267,
+            'nis': -7.267,
+            'rad': -7.267,
+            'ou ': -7.267,
+            'emp': -7.267,
+            'mpr': -7.267,
+            'erv': -7.267,
+            'rvi': -7.267,
+            'ues': -7.267,
+            ' na': -7.267,
+            'eco': -7.267,
+            'ivi': -7.267,
+            'net': -7.267,
+            'e j': -7.267,
+            'ilh': -7.267,
+            's l': -7.267,
+            'o g': -7.267,
+            'lar': -7.267,
+            'tar': -7.267,
+            'e v': -7.267,
+            'ins': -7.267,
+            'ric': -7.267,
+            'mun': -7.267,
+            'mos': -7.267,
+            'teg': -7.267,
+            'ter': -7.267,
+            'eri': -7.267,
+            'il ': -7.267,
+            ' fo': -7.267,
+            ' lu': -7.267,
+            ' fu': -7.267,
+            'nos': -7.267,
+            'ive': -7.267,
+            'a r': -7.267,
+            'nde': -7.267,
+            'ndr': -7.267,
+            'ato': -7.267,
+            'amo': -7.267,
+            'sou': -7.267,
+            'rta': -7.401,
+            'tal': -7.401,
+            'ene': -7.401,
+            'mo ': -7.401,
+            'jet': -7.401,
+            'nvo': -7.401,
+            'lve': -7.401,
+            ' or': -7.401,
+        },
+    },
+    'es': {
+        'floor': -8.109,
+        'ngrams': {
+            ' de': -3.805,
+            'os ': -3.957,
+            'de ': -4.028,
+            ' la': -4.23,
+            'cio': -4.381,
+            'ion': -4.41,
+            'as ': -4.526,
+            'es ': -4.537,
+            'on ': -4.56,
+            'la ': -4.571,
+            'e l': -4.708,
+            'los': -4.763,
+            ' lo': -4.806,
+            'el ': -4.915,
+            'aci': -4.931,
+            's d': -4.931,
+            'en ': -4.983,
+            'ent': -4.983,
+            ' y ': -5.037,
+            ' co': -5.114,
+            ' en': -5.134,
+            ' in': -5.241,
+            'n d': -5.264,
+            ' el': -5.264,
+            'nte': -5.288,
+            'las': -5.312,
+            ' re': -5.362,
+            'con': -5.362,
+            'est': -5.388,
+            's e': -5.415,
+            'res': -5.442,
+            ' es': -5.47,
+            'ici': -5.47,
+            's y': -5.529,
+            'ien': -5.529,
+            'ida': -5.529,
+            'a l': -5.529,
+            ' un': -5.56,
+            'nes': -5.592,
+            'ado': -5.592,
+            'o d': -5.592,
+            ' se': -5.592,
+            'ue ': -5.624,
+            ' pr': -5.624,
+            'ica': -5.624,
+            'e e': -5.624,
+            'que': -5.658,
+            's p': -5.658,
+            'dad': -5.658,
+            ' qu': -5.693,
+            'ant': -5.73,
+            'to ': -5.73,
+            'n e': -5.73,
+            'one': -5.767,
+            'a d': -5.767,
+            's a': -5.848,
+            'te ': -5.848,
+            'del': -5.848,
+            'tra': -5.848,
+            'a e': -5.848,
+            'ia ': -5.89,
+            'n l': -5.89,
+            'dos': -5.935,
+            ' ma': -5.935,
+            'nto': -5.935,
+            'io ': -5.935,
+            'ad ': -5.935,
+            'ios': -5.981,
+            's s': -5.981,
+            'ten': -5.981,
+            'fic': -5.981,
+            'na ': -6.03,
+            'per': -6.03,
+            'par': -6.03,
+            'sti': -6.081,
+            'e i': -6.081,
+            'a p': -6.081,
+            'pro': -6.081,
+            ' pa': -6.081,
+            'an ': -6.081,
+            'mie': -6.081,
+            'des': -6.081,
+            'ntr': -6.081,
+            'nci': -6.081,
+            'sta': -6.135,
+            'ra ': -6.135,
+            'ist': -6.135,
+            'tos': -6.135,
+            'man': -6.135,
+            ' a ': -6.135,
+            'una': -6.192,
+            'les': -6.192,
+            'ste': -6.192,
+            'esp': -6.253,
+            'iza': -6.253,
+            'e c': -6.253,
+            'imi': -6.253,
+            'tic': -6.253,
+            'ari': -6.253,
+            's c': -6.253,
+            'a s': -6.253,
+            'a c': -6.253,
+            ' pe': -6.318,
+            'ar ': -6.318,
+            'enc': -6.318,
+            'eni': -6.318,
+            'ifi': -6.318,
+            ' si': -6.318,
+            'da ': -6.318,
+            'ene': -6.318,
+            'ore': -6.318,
+            'e d': -6.318,
+            'tal': -6.387,
+            's o': -6.387,
+            's l': -6.387,
+            'do ': -6.387,
+            'men': -6.387,
+            'ale': -6.387,
+            'ali': -6.387,
+            'nti': -6.387,
+            'se ': -6.387,
+            ' ca': -6.387,
+            'for': -6.387,
+            'y l': -6.387,
+            ' po': -6.387,
+            'cia': -6.387,
+            'nst': -6.461,
+            'ina': -6.461,
+            'a a': -6.461,
+            'ons': -6.461,
+            ' so': -6.461,
+            'o a': -6.461,
+            'e a': -6.461,
+            'n s': -6.461,
+            'd d': -6.461,
+            'o l': -6.461,
+            'ona': -6.541,
+            'o e': -6.541,
+            'str': -6.541,
+            'emp': -6.541,
+            'rac': -6.541,
+            'l p': -6.541,
+            'nal': -6.541,
+            'ema': -6.541,
+            'ter': -6.541,
+            's m': -6.541,
+            'lid': -6.541,
+            'rio': -6.541,
+            'orm': -6.541,
+            'rma': -6.541,
+            'a i': -6.541,
+            'por': -6.541,
+            'n c': -6.541,
+            'tio': -6.628,
+            'ins': -6.628,
+            'int': -6.628,
+            'tiv': -6.628,
+            's i': -6.628,
+            'nim': -6.628,
+            'a o': -6.628,
+            'un ': -6.628,
+            'e m': -6.628,
+            'edi': -6.628,
+            'cad': -6.628,
+            'tre': -6.628,
+            're ': -6.628,
+            'ues': -6.628,
+            'or ': -6.628,
+            's q': -6.628,
+            'mas': -6.628,
+            'ont': -6.628,
+            ' ge': -6.723,
+            'ala': -6.723,
+            'lac': -6.723,
+            ' di': -6.723,
+            'pac': -6.723,
+            'ara': -6.723,
+            'r l': -6.723,
+            ' an': -6.723,
+            's r': -6.723,
+            's h': -6.723,
+            'l m': -6.723,
+            'y e': -6.723,
+            ' pu': -6.723,
+            ' tr': -6.723,
+            'rec': -6.723,
+            'ect': -6.723,
+            'tem': -6.723,
+            'era': -6.723,
+            'qui': -6.723,
+            'nta': -6.723,
+            'ta ': -6.723,
+            'pos': -6.723,
+            'e p': -6.723,
+            ' me': -6.723,
+            'l c': -6.723,
+            'al ': -6.723,
+            'art': -6.723,
+            ' su': -6.723,
+            'ece': -6.723,
+            's u': -6.828,
+            'ers': -6.828,
+            'nas': -6.828,
+            'e s': -6.828,
+            'ser': -6.828,
+            'sto': -6.828,
+            'com': -6.828,
+            'n p': -6.828,
+            'pre': -6.828,
+            'ita': -6.828,
+            'uni': -6.828,
+            'lic': -6.828,
+            'ca ': -6.828,
+            'cas': -6.828,
+            'o p': -6.828,
+            'dif': -6.828,
+            'ria': -6.828,
+            'rea': -6.828,
+            'sis': -6.828,
+            'ada': -6.828,
+            'e u': -6.828,
+            'ran': -6.828,
+            'ume': -6.828,
+            'ili': -6.828,
+            'equ': -6.828,
+            'no ': -6.828,
+            'dic': -6.828,
+            'erv': -6.828,
+            'ren': -6.828,
+            'cci': -6.828,
+            'sum': -6.828,
+            'ato': -6.828,
+            'ron': -6.828,
+            'tes': -6.828,
+            'ges': -6.946,
+            'spa': -6.946,
+            'ces': -6.946,
+            ' or': -6.946,
+            'ult': -6.946,
+            'o y': -6.946,
+            'rat': -6.946,
+            'ico': -6.946,
+            'esa': -6.946,
+            'ade': -6.946,
+            'ini': -6.946,
+            'cos': -6.946,
+            'ati': -6.946,
+            'sio': -6.946,
+            'esu': -6.946,
+            'tad': -6.946,
+            ' ac': -6.946,
+            'ma ': -6.946,
+            'mac': -6.946,
+            'a f': -6.946,
+            ' fa': -6.946,
+            'ndi': -6.946,
+            'lo ': -6.946,
+            'o s': -6.946,
+            'pue': -6.946,
+            'cen': -6.946,
+            'l a': -6.946,
+            'rti': -6.946,
+            'cip': -7.08,
+            'pli': -7.08,
+            'rso': -7.08,
+            'son': -7.08,
+            ' te': -7.08,
+            'ani': -7.08,
+            'zac': -7.08,
+            'mo ': -7.08,
+            'ocu': -7.08,
+            'ate': -7.08,
+            'ive': -7.08,
+            ' ad': -7.08,
+            'ese': -7.08,
+            'aba': -7.08,
+            'jo ': -7.08,
+            'liz': -7.08,
+            'e r': -7.08,
+            'a r': -7.08,
+            'tud': -7.08,
+            'dio': -7.08,
+            'so ': -7.08,
+            'lta': -7.08,
+            'o r': -7.08,
+            'ost': -7.08,
+            'bil': -7.08,
+            ' eq': -7.08,
+            'uip': -7.08,
+            'a u': -7.08,
+            'tar': -7.08,
+            'inf': -7.08,
+            'den': -7.08,
+            's f': -7.08,
+            'pen': -7.08,
+            'o c': -7.08,
+            'rvi': -7.08,
+            'vic': -7.08,
+            'ner': -7.08,
+            'a t': -7.08,
+            'tie': -7.08,
+            'ro ': -7.08,
+            'lim': -7.08,
+            'l d': -7.08,
+            'cto': -7.08,
+            'end': -7.08,
+            'tor': -7.08,
+            'cue': -7.08,
+            ' fo': -7.08,
+            'a g': -7.234,
+            'sos': -7.234,
+            'gia': -7.234,
+            ' ob': -7.234,
+            'ivo': -7.234,
+            'rga': -7.234,
+            'gan': -7.234,
+            'ano': -7.234,
+            'nos': -7.234,
+            'pon': -7.234,
+            'ble': -7.234,
+            ' oc': -7.234,
+            'r e': -7.234,
+            'niv': -7.234,
+            'sid': -7.234,
+            'min': -7.234,
+            'sen': -7.234,
+            'e t': -7.234,
+            'rab': -7.234,
+            'baj': -7.234,
+            'ajo': -7.234,
+            'ana': -7.234,
+            'act': -7.234,
+            'cti': -7.234,
+            'ven': -7.234,
+            ' ed': -7.234,
+            'y d': -7.234,
+            'eri': -7.234,
+            'isi': -7.234,
+            'ura': -7.234,
+            'inc': -7.234,
+            'stu': -7.234,
+            'udi': -7.234,
+            ' mu': -7.234,
+            ' pl': -7.234,
+            'pla': -7.234,
+            ' op': -7.234,
+            'n y': -7.234,
+            ' au': -7.234,
+            'ipo': -7.234,
+            ' ex': -7.234,
+            'n i': -7.234,
+            'nfo': -7.234,
+            'ipa': -7.234,
+            'ide': -7.234,
+            'n m': -7.234,
+            'ere': -7.234,
+            'mpo': -7.234,
+            'med': -7.234,
+            'e f': -7.234,
+            'tro': -7.234,
+            ' cu': -7.234,
+            'efi': -7.234,
+            'nsu': -7.234,
+            'n u': -7.234,
+            'rte': -7.234,
+            'imp': -7.234,
+            'ort': -7.234,
+            'rta': -7.234,
+            'tan': -7.234,
+            ' da': -7.234,
+            'dat': -7.234,
+            'n a': -7.234,
+            'ero': -7.234,
+            'bie': -7.234,
+            'gen': -7.234,
+            ' mo': -7.234,
+            'ier': -7.234,
+            's b': -7.234,
+            'nic': -7.234,
+            'fin': -7.234,
+            'nec': -7.234,
+            'rid': -7.234,
+            ' ar': -7.234,
+            'aro': -7.234,
+            'dis': -7.416,
+            'gra': -7.416,
+            ' ap': -7.416,
+            'org': -7.416,
+            'niz': -7.416,
+            'spo': -7.416,
+            ' ha': -7.416,
+            ' vi': -7.416,
+            'vis': -7.416,
+            'cup': -7.416,
+            'upa': -7.416,
+            'co ': -7.416,
+            ' em': -7.416,
+            'ver': -7.416,
+            'pub': -7.416,
+            'ubl': -7.416,
+        },
+    },
+}
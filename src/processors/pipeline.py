@@ -0,0 +1,528 @@
+import os
+import csv
+import json
+import math
+import logging
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from .text_processor import TextProcessor
+from .categorizer import categorize_article, categorize_batch, DEFAULT_CATEGORIES
+from .language_detector import detect_language
+from .storage import INTERMEDIATE_COLUMNS, collection_date_groups, stream_schema
+from src.utils.helpers import generate_content_hash
+
+logger = logging.getLogger(__name__)
+
+# Categorias de tendências em FM usadas no processamento
+FM_CATEGORIES = DEFAULT_CATEGORIES
+
+# Versão do processamento; alterá-la força o reprocessamento no modo incremental
+PROCESSOR_VERSION = '3'
+
+# Colunas fixas da saída do pipeline em streaming (as intermediárias só com --keep-intermediate)
+STREAM_COLUMNS = [
+    'title', 'url', 'date', 'author', 'authors', 'abstract', 'year', 'content',
+    'source', 'language', 'id', 'collected_at', 'content_hash',
+    'clean_content', 'clean_abstract', 'clean_title',
+    'translated_title', 'translated_abstract', 'translated_content',
+    'keywords', 'categories', 'topic'
+]
+
+# Processador de texto de cada processo do pool (criado no inicializador)
+_worker_processor = None
+
+# Colunas de onde sai o texto de palavras-chave e categorias, da mais para a menos preferida
+TEXT_COLUMNS = ('translated_content', 'clean_content', 'translated_abstract', 'clean_abstract', 'translated_title')
+
+def has_text(value):
+    """Indica se o valor é um texto não vazio (NA e textos vazios são ignorados na seleção)"""
+    return isinstance(value, str) and value != ''
+
+def select_text(row, columns):
+    """
+    Seleciona o texto usado na extração de palavras-chave e na categorização.
+
+    Args:
+        row: Linha do DataFrame de artigos (ou dicionário de um registro)
+        columns: Colunas disponíveis no DataFrame
+
+    Returns:
+        Conteúdo, ou resumo, ou título, dando preferência à versão traduzida;
+        campos ausentes ou vazios (por exemplo, o conteúdo de artigos do
+        Google Scholar, que só têm resumo) são ignorados
+    """
+    for column in TEXT_COLUMNS:
+        if column in columns and has_text(row[column]):
+            return row[column]
+    return row['clean_title']
+
+def text_mask(values):
+    """Versão vetorizada de has_text para uma coluna"""
+    return values.notna() & (values.astype(object) != '')
+
+def select_text_series(df):
+    """Versão vetorizada de select_text para o DataFrame inteiro"""
+    text = df['clean_title']
+    for column in reversed(TEXT_COLUMNS):
+        if column in df.columns:
+            text = df[column].where(text_mask(df[column]), text)
+    return text
+
+def clean_frame(df, text_processor):
+    """Aplica a limpeza de texto ao conteúdo, resumo e título"""
+    if 'content' in df.columns:
+        df['clean_content'] = df['content'].fillna('').apply(text_processor.clean_text)
+
+    if 'abstract' in df.columns:
+        df['clean_abstract'] = df['abstract'].fillna('').apply(text_processor.clean_text)
+
+    df['clean_title'] = df['title'].fillna('').apply(text_processor.clean_text)
+    return df
+
+def language_text(record):
+    """Título, resumo e conteúdo limpos de um artigo, usados na detecção de idioma"""
+    parts = [record.get(col) for col in ('clean_title', 'clean_abstract', 'clean_content')]
+    return ' '.join(part for part in parts if isinstance(part, str) and part)
+
+def topic_text(record):
+    """Título, resumo e conteúdo de um artigo (traduzidos, se houver), usados na descoberta de tópicos"""
+    parts = []
+    for field in ('title', 'abstract', 'content'):
+        for column in (f'translated_{field}', f'clean_{field}'):
+            value = record.get(column)
+            if isinstance(value, str) and value:
+                parts.append(value)
+                break
+    return ' '.join(parts)
+
+def detect_frame_languages(df):
+    """
+    Define a coluna 'language' pelo idioma detectado no texto limpo.
+
+    Quando a detecção não tem confiança suficiente, mantém o idioma informado
+    pelo scraper.
+    """
+    columns = [col for col in ('clean_title', 'clean_abstract', 'clean_content') if col in df.columns]
+    if 'language' in df.columns:
+        defaults = df['language'].astype(object).where(df['language'].notna(), None)
+    else:
+        defaults = pd.Series(None, index=df.index, dtype=object)
+    detected = [
+        detect_language(language_text(record), default)
+        for record, default in zip(df[columns].to_dict('records'), defaults)
+    ]
+    changed = sum(1 for new, old in zip(detected, defaults) if new != old)
+    df['language'] = pd.Series(detected, index=df.index, dtype=object)
+    logger.info(f"Idioma detectado: {changed} artigos com idioma diferente do informado")
+    return df
+
+def extract_frame_keywords(df, text_processor):
+    """Extrai as palavras-chave de cada artigo"""
+    df['keywords'] = df.apply(
+        lambda row: text_processor.extract_keywords(select_text(row, df.columns)),
+        axis=1
+    )
+    return df
+
+def extract_frame_keywords_tfidf(df, extractor, top_n=10):
+    """
+    Extrai as palavras-chave de todos os artigos com TF-IDF no nível do corpus.
+
+    Args:
+        df: DataFrame com as colunas limpas
+        extractor: Instância de TfidfKeywordExtractor (estatísticas atualizadas no lugar)
+        top_n: Número de palavras-chave por artigo
+    """
+    ids = df['id'].tolist() if 'id' in df.columns else None
+    df['keywords'] = extractor.extract(select_text_series(df).tolist(), top_n=top_n, ids=ids)
+    return df
+
+def assign_frame_topics(df, topic_model):
+    """
+    Atribui um tópico a cada artigo, atualizando o modelo de tópicos em mini-lotes.
+
+    Args:
+        df: DataFrame com as colunas limpas
+        topic_model: Instância de TopicModel (atualizada no lugar)
+    """
+    columns = [col for col in df.columns if col.startswith(('clean_', 'translated_'))]
+    ids = df['id'].tolist() if 'id' in df.columns else None
+    df['topic'] = topic_model.assign([topic_text(record) for record in df[columns].to_dict('records')], ids)
+    return df
+
+def categorize_frame(df, category_dict=None, batch=False):
+    """Categoriza cada artigo com base no texto e nas palavras-chave"""
+    if batch:
+        df['categories'] = categorize_batch(
+            select_text_series(df).tolist(),
+            keywords=df['keywords'].tolist(),
+            category_dict=category_dict or FM_CATEGORIES
+        )
+        return df
+
+    df['categories'] = df.apply(
+        lambda row: categorize_article(
+            text=select_text(row, df.columns),
+            keywords=row['keywords'],
+            category_dict=category_dict or FM_CATEGORIES
+        ),
+        axis=1
+    )
+    return df
+
+def _init_worker():
+    """Inicializa o estado de NLTK/TextProcessor uma única vez por processo"""
+    global _worker_processor
+    _worker_processor = TextProcessor()
+
+def _clean_chunk(chunk):
+    """Executa a limpeza de texto em um bloco de artigos"""
+    return clean_frame(chunk, _worker_processor)
+
+def process_frame_parallel(df, workers, chunks_per_worker=4):
+    """
+    Limpa o DataFrame de artigos em blocos usando um pool de processos.
+
+    Args:
+        df: DataFrame com os artigos coletados
+        workers: Número de processos
+        chunks_per_worker: Número de blocos por processo (balanceamento de carga)
+
+    Returns:
+        DataFrame com as colunas limpas, na ordem original
+    """
+    if df.empty:
+        return df
+
+    chunk_size = math.ceil(len(df) / (workers * chunks_per_worker))
+    chunks = [df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size)]
+    logger.info(f"Limpando {len(df)} artigos em {len(chunks)} blocos com {workers} processos")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        # executor.map preserva a ordem dos blocos
+        results = list(executor.map(_clean_chunk, chunks))
+
+    return pd.concat(results)
+
+def select_text_fields(df):
+    """Coluna de onde select_text tira o texto de cada artigo (versão vetorizada)"""
+    fields = pd.Series('clean_title', index=df.index, dtype=object)
+    for column in reversed(TEXT_COLUMNS):
+        if column in df.columns:
+            fields = fields.where(~text_mask(df[column]), column)
+    return fields
+
+def _annotate_corpus_chunk(corpus, rows, category_dict, batch_categorize):
+    """
+    Extrai palavras-chave e categoriza um bloco de artigos lidos do corpus.
+
+    Args:
+        corpus: TextCorpus (serializado apenas pelo caminho e reaberto no processo)
+        rows: Pares (posição no corpus, campo) de cada artigo do bloco
+
+    Returns:
+        tuple: Listas de palavras-chave e de categorias de cada artigo
+    """
+    texts = [corpus.text(position, field) for position, field in rows]
+    keywords = [_worker_processor.extract_keywords(text) for text in texts]
+    if batch_categorize:
+        categories = categorize_batch(texts, keywords=keywords, category_dict=category_dict or FM_CATEGORIES)
+    else:
+        categories = [
+            categorize_article(text=text, keywords=text_keywords, category_dict=category_dict or FM_CATEGORIES)
+            for text, text_keywords in zip(texts, keywords)
+        ]
+    return keywords, categories
+
+def annotate_frame_parallel(df, corpus, positions, workers, category_dict=None, batch_categorize=False,
+                            chunks_per_worker=4):
+    """
+    Extrai palavras-chave e categoriza os artigos em um pool de processos,
+    lendo os textos do corpus mapeado em memória.
+
+    Cada bloco leva apenas o caminho do corpus e os pares (posição, campo)
+    dos seus artigos; os processos leem os textos pelo cache de páginas, sem
+    receber cópias serializadas. O texto de cada artigo é o mesmo de
+    select_text, então o resultado é idêntico ao do processamento serial.
+
+    Args:
+        df: DataFrame com as colunas limpas (e traduzidas)
+        corpus: TextCorpus com os textos do DataFrame
+        positions: Posição de cada linha do DataFrame no corpus
+        workers: Número de processos
+        category_dict: Dicionário de categorias e termos relacionados
+        batch_categorize: Categorizar cada bloco com categorize_batch
+        chunks_per_worker: Número de blocos por processo (balanceamento de carga)
+    """
+    rows = list(zip(positions, select_text_fields(df)))
+    chunk_size = math.ceil(len(rows) / (workers * chunks_per_worker))
+    chunks = [rows[start:start + chunk_size] for start in range(0, len(rows), chunk_size)]
+    logger.info(f"Anotando {len(rows)} artigos em {len(chunks)} blocos com {workers} processos")
+
+    keywords, categories = [], []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        for chunk_keywords, chunk_categories in executor.map(
+            _annotate_corpus_chunk, [corpus] * len(chunks), chunks,
+            [category_dict] * len(chunks), [batch_categorize] * len(chunks)
+        ):
+            keywords.extend(chunk_keywords)
+            categories.extend(chunk_categories)
+
+    df['keywords'] = pd.Series(keywords, index=df.index, dtype=object)
+    df['categories'] = pd.Series(categories, index=df.index, dtype=object)
+    return df
+
+def prepare_article(article, text_processor):
+    """
+    Primeiro passo do processamento de um artigo: limpeza e detecção de idioma.
+
+    Args:
+        article: Artigo coletado (Article)
+        text_processor: Instância de TextProcessor
+
+    Returns:
+        Dicionário com os dados originais, o hash do conteúdo (como no modo
+        --incremental), os textos limpos e o idioma
+    """
+    record = article.to_dict()
+    record['content_hash'] = generate_content_hash(article, PROCESSOR_VERSION)
+
+    if 'content' in article:
+        record['clean_content'] = text_processor.clean_text(article['content'] or '')
+    if 'abstract' in article:
+        record['clean_abstract'] = text_processor.clean_text(article['abstract'] or '')
+    record['clean_title'] = text_processor.clean_text(article.get('title') or '')
+    record['language'] = detect_language(language_text(record), record.get('language'))
+    return record
+
+def translate_records(records, text_processor, translation_cache=None, translation_budget=None):
+    """
+    Traduz de uma só vez os artigos não portugueses de um lote de registros.
+
+    Os textos originais completos (título, resumo e conteúdo) de todos os
+    artigos do lote vão em uma única chamada a translate_documents, que
+    deduplica os trechos e os traduz em paralelo; os resultados são limpos
+    e gravados nas colunas translated_*.
+
+    Args:
+        records: Registros preparados com prepare_article (alterados no lugar)
+        text_processor: Instância de TextProcessor
+        translation_cache: Cache persistente de traduções (opcional)
+        translation_budget: Orçamento de caracteres de tradução da execução (opcional)
+    """
+    targets = [
+        (record, field) for record in records if record.get('language') != 'pt'
+        for field in ('title', 'abstract', 'content') if record.get(field)
+    ]
+    if not targets:
+        return records
+
+    # O tradutor (requests e dotenv) só é importado quando há o que traduzir
+    from .translator import translate_documents
+
+    try:
+        translated = translate_documents(
+            [record[field] for record, field in targets], target_lang='pt',
+            cache=translation_cache, budget=translation_budget
+        )
+    except Exception as e:
+        logger.error(f"Erro ao traduzir lote de {len(records)} artigos: {str(e)}")
+        return records
+
+    for (record, field), text in zip(targets, translated):
+        if text is not None:
+            record[f'translated_{field}'] = text_processor.clean_text(text)
+    return records
+
+def record_text(record):
+    """
+    Texto de um registro usado para palavras-chave e categorias, escolhido
+    por select_text (a mesma regra do processamento em lote).
+    """
+    return select_text(record, record)
+
+def annotate_records(records, text_processor, category_dict=None, batch_categorize=False):
+    """
+    Extrai as palavras-chave e categoriza um lote de registros.
+
+    Args:
+        records: Registros preparados (e traduzidos) (alterados no lugar)
+        text_processor: Instância de TextProcessor
+        category_dict: Dicionário de categorias e termos relacionados
+        batch_categorize: Categorizar o lote de uma vez com categorize_batch
+    """
+    texts = [record_text(record) for record in records]
+    for record, text in zip(records, texts):
+        record['keywords'] = text_processor.extract_keywords(text)
+
+    if batch_categorize:
+        categories = categorize_batch(
+            texts, keywords=[record['keywords'] for record in records],
+            category_dict=category_dict or FM_CATEGORIES
+        )
+    else:
+        categories = [
+            categorize_article(text=text, keywords=record['keywords'], category_dict=category_dict or FM_CATEGORIES)
+            for record, text in zip(records, texts)
+        ]
+    for record, record_categories in zip(records, categories):
+        record['categories'] = record_categories
+    return records
+
+def process_article(article, text_processor, category_dict=None, translate_non_pt=False,
+                    translation_cache=None, translation_budget=None):
+    """
+    Processa um único artigo em um passo: limpeza, tradução opcional, seleção
+    do texto, palavras-chave e categorização.
+
+    Como cada artigo é processado isoladamente, o texto usado para palavras-chave
+    e categorias depende apenas dos campos do próprio artigo (conteúdo, senão
+    resumo, senão título, dando preferência à versão traduzida).
+
+    Args:
+        article: Artigo coletado (Article)
+        text_processor: Instância de TextProcessor
+        category_dict: Dicionário de categorias e termos relacionados
+        translate_non_pt: Traduzir artigos que não estão em português
+        translation_cache: Cache persistente de traduções (opcional)
+        translation_budget: Orçamento de caracteres de tradução da execução (opcional)
+
+    Returns:
+        Dicionário com os dados originais e os campos processados
+    """
+    records = [prepare_article(article, text_processor)]
+    if translate_non_pt:
+        translate_records(records, text_processor, translation_cache, translation_budget)
+    return annotate_records(records, text_processor, category_dict)[0]
+
+def assign_batch_topics(records, topic_model):
+    """Atribui um tópico a cada artigo processado de um lote do pipeline em streaming"""
+    topics = topic_model.assign([topic_text(record) for record in records], [record.get('id') for record in records])
+    for record, topic in zip(records, topics):
+        record['topic'] = topic
+    return records
+
+class StreamWriter:
+    """Grava artigos processados de forma incremental em Parquet e, opcionalmente, em CSV e JSON"""
+
+    def __init__(self, parquet_path, csv_path=None, json_path=None, columns=None):
+        import pyarrow.parquet as pq
+
+        self.columns = columns or STREAM_COLUMNS
+        self.count = 0
+        self._schema = stream_schema(self.columns)
+        self._parquet = pq.ParquetWriter(parquet_path, self._schema)
+
+        self._csv_file = self._json_file = None
+        if csv_path:
+            self._csv_file = open(csv_path, 'w', encoding='utf-8', newline='')
+            self._csv = csv.DictWriter(self._csv_file, fieldnames=self.columns, extrasaction='ignore')
+            self._csv.writeheader()
+        if json_path:
+            self._json_file = open(json_path, 'w', encoding='utf-8')
+            self._json_file.write('[')
+
+    def write_batch(self, records):
+        """Grava um lote de registros (um row group por data de coleta no Parquet)"""
+        import pyarrow as pa
+
+        rows = [{col: record.get(col) for col in self.columns} for record in records]
+        for group in collection_date_groups([row.get('collected_at') for row in rows]):
+            self._parquet.write_table(pa.Table.from_pylist([rows[i] for i in group], schema=self._schema))
+
+        for row in rows:
+            if self._csv_file:
+                self._csv.writerow(row)
+            if self._json_file:
+                separator = ',\n' if self.count else '\n'
+                self._json_file.write(separator + json.dumps(row, ensure_ascii=False, indent=4))
+            self.count += 1
+
+        if self._csv_file:
+            self._csv_file.flush()
+        if self._json_file:
+            self._json_file.flush()
+
+    def close(self):
+        self._parquet.close()
+        if self._csv_file:
+            self._csv_file.close()
+        if self._json_file:
+            self._json_file.write('\n]' if self.count else ']')
+            self._json_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def process_stream(articles, output_dir='data/processed', category_dict=None,
+                   translate_non_pt=False, batch_size=500, translation_cache=None, translation_budget=None,
+                   export_csv=False, export_json=False, aggregates=None, topic_model=None,
+                   search_index=None, corpus_writer=None, batch_categorize=False, keep_intermediate=False):
+    """
+    Processa artigos a partir de um iterável (por exemplo, um gerador) e
+    grava os resultados em lotes, mantendo em memória no máximo um lote.
+
+    Cada artigo é limpo e tem o idioma detectado ao ser lido; ao completar
+    um lote, os artigos não portugueses são traduzidos de uma só vez e o
+    lote recebe palavras-chave, categorias e tópicos antes de ser gravado.
+
+    Args:
+        articles: Iterável de artigos coletados (Article)
+        output_dir: Diretório dos arquivos de saída
+        category_dict: Dicionário de categorias e termos relacionados
+        translate_non_pt: Traduzir artigos que não estão em português
+        batch_size: Número de artigos por gravação (e por chamada de tradução)
+        translation_cache: Cache persistente de traduções (opcional)
+        translation_budget: Orçamento de caracteres de tradução da execução (opcional)
+        export_csv: Gravar também em CSV
+        export_json: Gravar também em JSON
+        aggregates: Agregados mensais (TrendAggregates) atualizados a cada lote (opcional)
+        topic_model: Modelo de tópicos (TopicModel) atualizado e aplicado a cada lote (opcional)
+        search_index: Índice de busca (SearchIndex) atualizado a cada lote (opcional)
+        corpus_writer: Corpus de textos limpos (CorpusWriter) estendido a cada lote (opcional)
+        batch_categorize: Categorizar cada lote com categorize_batch
+        keep_intermediate: Manter na saída as colunas de texto limpo (clean_*)
+
+    Returns:
+        Número de artigos processados
+    """
+    text_processor = TextProcessor()
+    parquet_path = os.path.join(output_dir, 'articles_processed.parquet')
+    csv_path = os.path.join(output_dir, 'articles_processed.csv') if export_csv else None
+    json_path = os.path.join(output_dir, 'articles_processed.json') if export_json else None
+    columns = [
+        column for column in STREAM_COLUMNS
+        if (keep_intermediate or column not in INTERMEDIATE_COLUMNS) and (topic_model is not None or column != 'topic')
+    ]
+
+    def flush(batch):
+        if translate_non_pt:
+            translate_records(batch, text_processor, translation_cache, translation_budget)
+        annotate_records(batch, text_processor, category_dict, batch_categorize)
+        if topic_model is not None:
+            assign_batch_topics(batch, topic_model)
+        writer.write_batch(batch)
+        if aggregates is not None:
+            aggregates.update(batch)
+        if search_index is not None:
+            search_index.update(batch)
+        if corpus_writer is not None:
+            corpus_writer.write_batch(batch)
+
+    batch = []
+    with StreamWriter(parquet_path, csv_path, json_path, columns) as writer:
+        for article in articles:
+            batch.append(prepare_article(article, text_processor))
+            if len(batch) >= batch_size:
+                flush(batch)
+                logger.info(f"Processados {writer.count} artigos")
+                batch = []
+        if batch:
+            flush(batch)
+
+    saved = ', '.join(path for path in (parquet_path, csv_path, json_path) if path)
+    logger.info(f"Dados processados salvos em {saved}")
+    return writer.count
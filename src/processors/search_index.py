@@ -0,0 +1,437 @@
+import os
+import re
+import math
+import sqlite3
+import hashlib
+import logging
+from collections import Counter, defaultdict
+import numpy as np
+from .text_processor import TextProcessor
+from src.utils.helpers import ensure_dir, extract_date
+
+logger = logging.getLogger(__name__)
+
+# Local padrão do índice de busca
+DEFAULT_INDEX_PATH = 'data/processed/search_index.sqlite'
+
+# Parâmetros do BM25
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Número de postings acumulados em memória que força a gravação antes do fim da execução
+FLUSH_POSTINGS = 1000000
+
+# Fração de documentos desativados acima da qual o índice é compactado ao gravar
+COMPACT_FRACTION = 0.25
+
+# Número de termos lidos por consulta na compactação
+COMPACT_BATCH_TERMS = 1000
+
+# Campos indexados de cada artigo (os traduzidos permitem buscar em português artigos em outros idiomas)
+INDEXED_FIELDS = ['title', 'abstract', 'content', 'translated_title', 'translated_abstract', 'translated_content']
+
+# Data ISO 8601 (AAAA-MM-DD)
+ISO_DATE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+def date_key(record):
+    """
+    Data de publicação de um artigo como inteiro AAAAMMDD, para os filtros de data.
+
+    Artigos só com o ano (Google Scholar) usam 1º de janeiro desse ano.
+
+    Returns:
+        int: Data do artigo, ou 0 se desconhecida
+    """
+    value = record.get('date')
+    if isinstance(value, str) and value:
+        match = ISO_DATE.match(value)
+        if match:
+            return int(''.join(match.groups()))
+        parsed = extract_date(value)
+        if parsed:
+            return int(parsed.strftime('%Y%m%d'))
+
+    year = publication_year(record)
+    return year * 10000 + 101 if year else 0
+
+def publication_year(record):
+    """Ano de publicação informado pela fonte (campo 'year'), ou None"""
+    year = record.get('year')
+    if isinstance(year, float) and year.is_integer():
+        year = int(year)
+    year = str(year).strip() if isinstance(year, (int, str)) else ''
+    return int(year) if year.isdigit() and len(year) == 4 else None
+
+def date_bound(value, upper=False):
+    """
+    Converte um limite de data (AAAA, AAAA-MM ou AAAA-MM-DD) para inteiro AAAAMMDD.
+
+    Args:
+        value: Data informada no filtro
+        upper: Completar como limite superior (fim do ano ou do mês)
+
+    Returns:
+        int: Limite da data
+    """
+    digits = value.replace('-', '')
+    if not digits.isdigit() or len(digits) not in (4, 6, 8):
+        raise ValueError(f"Data inválida: {value} (use AAAA, AAAA-MM ou AAAA-MM-DD)")
+    if len(digits) == 4:
+        digits += '1231' if upper else '0101'
+    elif len(digits) == 6:
+        digits += '31' if upper else '01'
+    return int(digits)
+
+def encode_array(values, delta=False):
+    """
+    Codifica inteiros não negativos no menor tipo sem sinal que os comporta.
+
+    Args:
+        values: Sequência de inteiros (crescente, se delta=True)
+        delta: Gravar as diferenças entre valores consecutivos
+
+    Returns:
+        tuple: (tipo numpy, bytes)
+    """
+    values = np.asarray(values, dtype=np.int64)
+    if delta:
+        values = np.diff(values, prepend=0)
+    peak = int(values.max()) if len(values) else 0
+    for dtype in ('<u1', '<u2', '<u4'):
+        if peak <= np.iinfo(dtype).max:
+            break
+    else:
+        dtype = '<u8'
+    return dtype, values.astype(dtype).tobytes()
+
+def decode_array(dtype, data, delta=False):
+    """Decodifica um array gravado com encode_array"""
+    values = np.frombuffer(data, dtype=dtype).astype(np.int64)
+    return np.cumsum(values) if delta else values
+
+class SearchIndex:
+    """
+    Índice invertido persistente com ranqueamento BM25.
+
+    Cada termo (tokens de TextProcessor.preprocess_text) tem uma lista de
+    postings com os números dos documentos, gravados como diferenças
+    consecutivas no menor tipo inteiro possível, e as frequências do termo
+    em cada documento. Comprimento, fonte e data de cada documento ficam em
+    arrays compactos, então a pontuação e os filtros são vetorizados.
+
+    Documentos novos recebem números crescentes, então a atualização apenas
+    estende as listas dos termos presentes neles. Um artigo alterado é
+    reindexado com um novo número e o antigo é desativado (comprimento 0);
+    artigos inalterados são ignorados.
+
+    Os postings novos e os arrays ficam em memória entre chamadas de update
+    (por exemplo, os lotes do modo --stream) e são gravados uma vez por
+    execução, em flush ou close, ou antes se passarem de FLUSH_POSTINGS. Ao
+    gravar, se a fração de documentos desativados passar de
+    COMPACT_FRACTION, o índice é compactado (compact).
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH, text_processor=None):
+        self.path = path
+        self.text_processor = text_processor or TextProcessor()
+        ensure_dir(os.path.dirname(path) or '.')
+        self._conn = sqlite3.connect(path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS documents ('
+            ' doc INTEGER PRIMARY KEY, article_id TEXT UNIQUE NOT NULL, fingerprint TEXT NOT NULL,'
+            ' title TEXT, url TEXT, source TEXT, date TEXT)'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS postings ('
+            ' term TEXT PRIMARY KEY, docs_dtype TEXT NOT NULL, docs BLOB NOT NULL,'
+            ' tfs_dtype TEXT NOT NULL, tfs BLOB NOT NULL)'
+        )
+        self._conn.execute('CREATE TABLE IF NOT EXISTS sources (code INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS arrays (name TEXT PRIMARY KEY, dtype TEXT NOT NULL, data BLOB NOT NULL)'
+        )
+        self._conn.commit()
+
+        self.lengths = self._load_array('lengths')
+        self.source_codes = self._load_array('sources')
+        self.dates = self._load_array('dates')
+        self.sources = dict(self._conn.execute('SELECT name, code FROM sources'))
+
+        # Postings e arrays ainda não gravados
+        self._pending = defaultdict(list)
+        self._pending_count = 0
+        self._dirty = False
+
+    def _load_array(self, name):
+        row = self._conn.execute('SELECT dtype, data FROM arrays WHERE name = ?', (name,)).fetchone()
+        return decode_array(*row) if row else np.zeros(0, dtype=np.int64)
+
+    def _save_array(self, name, values):
+        dtype, data = encode_array(values)
+        self._conn.execute('INSERT OR REPLACE INTO arrays (name, dtype, data) VALUES (?, ?, ?)', (name, dtype, data))
+
+    @property
+    def n_documents(self):
+        """Número de documentos ativos"""
+        return int(np.count_nonzero(self.lengths))
+
+    def index_text(self, record):
+        """Texto indexado de um artigo: título, resumo e conteúdo, originais e traduzidos"""
+        return '\n'.join(
+            record[field] for field in INDEXED_FIELDS
+            if isinstance(record.get(field), str) and record[field]
+        )
+
+    def _source_code(self, source):
+        source = source if isinstance(source, str) else ''
+        if source not in self.sources:
+            self.sources[source] = len(self.sources)
+            self._conn.execute('INSERT INTO sources (code, name) VALUES (?, ?)', (self.sources[source], source))
+        return self.sources[source]
+
+    def update(self, records):
+        """
+        Indexa artigos novos ou alterados.
+
+        Args:
+            records: Iterável de dicionários de artigos (com 'id')
+
+        Returns:
+            int: Número de artigos indexados
+        """
+        lengths, source_codes, dates = [], [], []
+        first_doc = len(self.lengths)
+        indexed = 0
+
+        for record in records:
+            article_id = record.get('id')
+            if not article_id:
+                continue
+
+            text = self.index_text(record)
+            fingerprint = hashlib.sha1(text.encode('utf-8')).hexdigest()
+            row = self._conn.execute(
+                'SELECT doc, fingerprint FROM documents WHERE article_id = ?', (article_id,)
+            ).fetchone()
+            if row and row[1] == fingerprint:
+                continue
+            if row:
+                # Desativar a versão anterior do artigo
+                if row[0] < first_doc:
+                    self.lengths[row[0]] = 0
+                else:
+                    lengths[row[0] - first_doc] = 0
+                self._conn.execute('DELETE FROM documents WHERE doc = ?', (row[0],))
+                self._dirty = True
+
+            tokens = self.text_processor.preprocess_text(text)
+            if not tokens:
+                continue
+
+            doc = first_doc + len(lengths)
+            for term, tf in Counter(tokens).items():
+                self._pending[term].append((doc, tf))
+                self._pending_count += 1
+            lengths.append(len(tokens))
+            source_codes.append(self._source_code(record.get('source')))
+            dates.append(date_key(record))
+
+            # Data exibida nos resultados (o ano, para artigos sem data completa)
+            date = record.get('date')
+            if not isinstance(date, str) or not date:
+                year = publication_year(record)
+                date = str(year) if year else None
+            self._conn.execute(
+                'INSERT INTO documents (doc, article_id, fingerprint, title, url, source, date) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (doc, article_id, fingerprint, record.get('title'), record.get('url'),
+                 record.get('source'), date)
+            )
+            indexed += 1
+
+        if lengths:
+            self.lengths = np.concatenate([self.lengths, np.array(lengths, dtype=np.int64)])
+            self.source_codes = np.concatenate([self.source_codes, np.array(source_codes, dtype=np.int64)])
+            self.dates = np.concatenate([self.dates, np.array(dates, dtype=np.int64)])
+            self._dirty = True
+        if self._pending_count >= FLUSH_POSTINGS:
+            self.flush()
+
+        logger.info(f"Índice de busca: {indexed} artigos indexados ({self.n_documents} no total)")
+        return indexed
+
+    def flush(self):
+        """
+        Grava os postings e arrays acumulados, compactando o índice se houver
+        documentos desativados demais.
+        """
+        # Estender as listas dos termos afetados (os novos documentos têm números maiores)
+        for term, postings in self._pending.items():
+            docs = [doc for doc, _ in postings]
+            tfs = [tf for _, tf in postings]
+            row = self._conn.execute(
+                'SELECT docs_dtype, docs, tfs_dtype, tfs FROM postings WHERE term = ?', (term,)
+            ).fetchone()
+            if row:
+                docs = np.concatenate([decode_array(row[0], row[1], delta=True), docs])
+                tfs = np.concatenate([decode_array(row[2], row[3]), tfs])
+            self._conn.execute(
+                'INSERT OR REPLACE INTO postings (term, docs_dtype, docs, tfs_dtype, tfs) VALUES (?, ?, ?, ?, ?)',
+                (term, *encode_array(docs, delta=True), *encode_array(tfs))
+            )
+
+        self._pending = defaultdict(list)
+        self._pending_count = 0
+
+        if self._dirty:
+            self._save_array('lengths', self.lengths)
+            self._save_array('sources', self.source_codes)
+            self._save_array('dates', self.dates)
+            self._dirty = False
+        self._conn.commit()
+
+        inactive = len(self.lengths) - self.n_documents
+        if inactive and inactive > COMPACT_FRACTION * len(self.lengths):
+            self.compact()
+
+    def compact(self):
+        """
+        Remove do índice os documentos desativados, renumerando os ativos na
+        mesma ordem e reescrevendo postings, arrays e documentos.
+
+        Returns:
+            int: Número de documentos removidos
+        """
+        if self._pending_count:
+            self.flush()
+        live = self.lengths > 0
+        removed = int(len(live) - np.count_nonzero(live))
+        if not removed:
+            return 0
+
+        # Novo número de cada documento ativo (a ordem é mantida)
+        renumber = np.cumsum(live) - 1
+
+        last_term = ''
+        while True:
+            rows = self._conn.execute(
+                'SELECT term, docs_dtype, docs, tfs_dtype, tfs FROM postings WHERE term > ? ORDER BY term LIMIT ?',
+                (last_term, COMPACT_BATCH_TERMS)
+            ).fetchall()
+            if not rows:
+                break
+            for term, docs_dtype, docs, tfs_dtype, tfs in rows:
+                docs = decode_array(docs_dtype, docs, delta=True)
+                tfs = decode_array(tfs_dtype, tfs)
+                active = live[docs]
+                if active.all():
+                    if renumber[docs[-1]] == docs[-1]:
+                        continue
+                elif not active.any():
+                    self._conn.execute('DELETE FROM postings WHERE term = ?', (term,))
+                    continue
+                self._conn.execute(
+                    'UPDATE postings SET docs_dtype = ?, docs = ?, tfs_dtype = ?, tfs = ? WHERE term = ?',
+                    (*encode_array(renumber[docs[active]], delta=True), *encode_array(tfs[active]), term)
+                )
+            last_term = rows[-1][0]
+
+        # Documentos em ordem crescente: o novo número nunca é de outro documento ainda não movido
+        moves = [(int(renumber[doc]), int(doc)) for doc in np.flatnonzero(live) if renumber[doc] != doc]
+        self._conn.executemany('UPDATE documents SET doc = ? WHERE doc = ?', moves)
+
+        self.lengths = self.lengths[live]
+        self.source_codes = self.source_codes[live]
+        self.dates = self.dates[live]
+        self._save_array('lengths', self.lengths)
+        self._save_array('sources', self.source_codes)
+        self._save_array('dates', self.dates)
+        self._conn.commit()
+        logger.info(f"Índice de busca compactado: {removed} documentos desativados removidos")
+        return removed
+
+    def postings(self, term):
+        """
+        Lista de postings de um termo.
+
+        Returns:
+            tuple: (números dos documentos, frequências do termo), arrays vazios se o termo não existir
+        """
+        row = self._conn.execute(
+            'SELECT docs_dtype, docs, tfs_dtype, tfs FROM postings WHERE term = ?', (term,)
+        ).fetchone()
+        if row is None:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        return decode_array(row[0], row[1], delta=True), decode_array(row[2], row[3])
+
+    def search(self, query, limit=10, sources=None, since=None, until=None):
+        """
+        Busca artigos ranqueados por BM25.
+
+        Args:
+            query: Texto da consulta (pré-processado como os artigos)
+            limit: Número máximo de resultados
+            sources: Fontes aceitas (None para todas)
+            since, until: Datas mínima e máxima (AAAA, AAAA-MM ou AAAA-MM-DD, inclusivas); artigos sem data
+                ficam de fora quando alguma delas é informada
+
+        Returns:
+            list: Dicionários com 'score', 'id', 'title', 'url', 'source' e 'date', do mais ao menos relevante
+        """
+        if self._pending_count or self._dirty:
+            self.flush()
+        live = self.lengths > 0
+        n_documents = int(np.count_nonzero(live))
+        terms = set(self.text_processor.preprocess_text(query))
+        if not terms or n_documents == 0:
+            return []
+
+        average_length = self.lengths[live].mean()
+        norms = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths / average_length)
+
+        scores = np.zeros(len(self.lengths), dtype=np.float64)
+        for term in terms:
+            docs, tfs = self.postings(term)
+            active = live[docs]
+            docs, tfs = docs[active], tfs[active]
+            if len(docs) == 0:
+                continue
+            idf = math.log(1 + (n_documents - len(docs) + 0.5) / (len(docs) + 0.5))
+            scores[docs] += idf * tfs * (BM25_K1 + 1) / (tfs + norms[docs])
+
+        mask = live & (scores > 0)
+        if sources:
+            codes = [self.sources[source] for source in sources if source in self.sources]
+            mask &= np.isin(self.source_codes, codes)
+        if since:
+            mask &= self.dates >= date_bound(since)
+        if until:
+            mask &= (self.dates > 0) & (self.dates <= date_bound(until, upper=True))
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        # Maior pontuação primeiro; no empate, o documento indexado primeiro
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+
+        results = []
+        for doc in candidates.tolist():
+            article_id, title, url, source, date = self._conn.execute(
+                'SELECT article_id, title, url, source, date FROM documents WHERE doc = ?', (doc,)
+            ).fetchone()
+            results.append({
+                'score': float(scores[doc]), 'id': article_id, 'title': title,
+                'url': url, 'source': source, 'date': date
+            })
+        return results
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,163 @@
+import os
+import logging
+from src.utils.helpers import ensure_dir
+
+logger = logging.getLogger(__name__)
+
+# Colunas gravadas como listas nativas do Parquet
+LIST_COLUMNS = ['keywords', 'categories']
+
+# Colunas de baixa cardinalidade gravadas com codificação de dicionário
+DICTIONARY_COLUMNS = ['source', 'language']
+
+# Colunas de baixa cardinalidade mantidas como 'category' em memória
+CATEGORY_COLUMNS = DICTIONARY_COLUMNS
+
+# Tipo das colunas de texto em memória
+STRING_DTYPE = 'string[pyarrow]'
+
+# Colunas intermediárias, descartadas depois de consumidas pelas palavras-chave
+# e pela categorização
+INTERMEDIATE_COLUMNS = ['clean_content', 'clean_abstract', 'clean_title']
+
+def collection_date_groups(collected_at):
+    """
+    Agrupa as linhas pela data (dia) de coleta.
+
+    Args:
+        collected_at: Sequência de datas de coleta em ISO 8601 (ou None)
+
+    Returns:
+        list: Índices das linhas de cada dia, em ordem de data (sem data por último),
+        preservando a ordem original dentro de cada dia
+    """
+    groups = {}
+    for i, value in enumerate(collected_at):
+        day = value[:10] if isinstance(value, str) else None
+        groups.setdefault(day, []).append(i)
+    return [groups[day] for day in sorted(groups, key=lambda day: (day is None, day or ''))]
+
+def normalize_table(table):
+    """Aplica os tipos do formato processado (listas de texto e dicionários) a uma tabela Arrow"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    for name in LIST_COLUMNS:
+        if name in table.column_names and table.schema.field(name).type != pa.list_(pa.string()):
+            i = table.schema.get_field_index(name)
+            table = table.set_column(i, name, table.column(i).cast(pa.list_(pa.string())))
+
+    for name in DICTIONARY_COLUMNS:
+        if name in table.column_names and not pa.types.is_dictionary(table.schema.field(name).type):
+            i = table.schema.get_field_index(name)
+            column = table.column(i)
+            if not pa.types.is_string(column.type):
+                column = column.cast(pa.string())
+            table = table.set_column(i, name, pc.dictionary_encode(column))
+    return table
+
+def write_processed(df, path):
+    """
+    Grava os artigos processados em Parquet.
+
+    As colunas de palavras-chave e categorias são listas nativas, fonte e idioma
+    usam codificação de dicionário e os artigos de cada data de coleta formam
+    um row group (os grupos são gravados em ordem de data).
+
+    Args:
+        df: DataFrame de artigos processados
+        path: Caminho do arquivo .parquet
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    ensure_dir(os.path.dirname(path) or '.')
+    table = normalize_table(pa.Table.from_pandas(df, preserve_index=False))
+
+    if 'collected_at' in df.columns:
+        groups = collection_date_groups(df['collected_at'].tolist())
+    else:
+        groups = [list(range(len(df)))]
+
+    with pq.ParquetWriter(path, table.schema) as writer:
+        for rows in groups:
+            writer.write_table(table.take(rows))
+
+def read_processed(path, columns=None):
+    """
+    Lê os artigos processados de um arquivo Parquet.
+
+    Args:
+        path: Caminho do arquivo .parquet
+        columns: Colunas a carregar (as ausentes no arquivo são ignoradas); None para todas
+
+    Returns:
+        DataFrame com palavras-chave e categorias como listas Python
+    """
+    import pyarrow.parquet as pq
+
+    if columns is not None:
+        available = set(pq.read_schema(path).names)
+        columns = [col for col in columns if col in available]
+
+    table = pq.read_table(path, columns=columns)
+    df = table.to_pandas()
+    for name in LIST_COLUMNS:
+        if name in df.columns:
+            df[name] = [values or [] for values in table.column(name).to_pylist()]
+    return df
+
+def stream_schema(columns):
+    """Esquema Arrow fixo da saída em streaming (texto, listas e dicionários)"""
+    import pyarrow as pa
+
+    fields = []
+    for name in columns:
+        if name in LIST_COLUMNS:
+            fields.append(pa.field(name, pa.list_(pa.string())))
+        elif name in DICTIONARY_COLUMNS:
+            fields.append(pa.field(name, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            fields.append(pa.field(name, pa.string()))
+    return pa.schema(fields)
+
+def optimize_frame(df, drop_columns=()):
+    """
+    Aplica o esquema otimizado de memória ao DataFrame de artigos.
+
+    Colunas de texto passam a string[pyarrow], fonte e idioma a 'category' e as
+    colunas em drop_columns (por exemplo, as intermediárias já consumidas) são
+    descartadas. Palavras-chave e categorias continuam como listas.
+
+    Args:
+        df: DataFrame de artigos
+        drop_columns: Colunas a descartar
+
+    Returns:
+        DataFrame com o esquema otimizado
+    """
+    import pandas as pd
+
+    df = df.drop(columns=[col for col in drop_columns if col in df.columns])
+    for column in df.columns:
+        if column in LIST_COLUMNS:
+            continue
+        if column in CATEGORY_COLUMNS:
+            df[column] = df[column].astype('category')
+        elif pd.api.types.infer_dtype(df[column], skipna=True) in ('string', 'empty'):
+            df[column] = df[column].astype(STRING_DTYPE)
+    return df
+
+def memory_report(df):
+    """
+    Uso de memória de cada coluna do DataFrame.
+
+    Returns:
+        str: Tabela com tipo e memória (profunda) de cada coluna e o total
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    lines = [f"{'Coluna':<24} {'Tipo':<24} {'Memória (MiB)':>14}"]
+    for column, size in usage.items():
+        lines.append(f"{column:<24} {str(df[column].dtype):<24} {size / 1024 ** 2:14.3f}")
+    lines.append(f"{'Total':<24} {'':<24} {usage.sum() / 1024 ** 2:14.3f}")
+    return '\n'.join(lines)
@@ -1,4 +1,5 @@
 import re
+import threading
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
@@ -6,19 +7,58 @@ from nltk.stem import RSLPStemmer
 import string
 import unidecode
 
+# Texto já normalizado por clean_text: apenas letras minúsculas ASCII e espaços
+CLEAN_TEXT_PATTERN = re.compile(r'[a-z ]*')
+
+# Palavras que o tokenizador Treebank do NLTK divide mesmo sem pontuação
+# (contrações do inglês, ex.: "cannot" -> "can", "not")
+SPLIT_CONTRACTIONS = frozenset(['cannot', 'gimme', 'gonna', 'gotta', 'lemme', 'wanna'])
+
+# Recursos do NLTK: caminho em nltk.data -> pacote para download
+NLTK_RESOURCES = {
+    'tokenizers/punkt': 'punkt',
+    'corpora/stopwords': 'stopwords',
+    'stemmers/rslp': 'rslp',
+}
+
+_nltk_lock = threading.Lock()
+_nltk_ready = set()
+_stop_words = None
+_stemmer = None
+
+def ensure_nltk_resource(path):
+    """Verifica (e baixa, se necessário) um recurso do NLTK uma única vez por processo"""
+    if path in _nltk_ready:
+        return
+    with _nltk_lock:
+        if path not in _nltk_ready:
+            try:
+                nltk.data.find(path)
+            except LookupError:
+                nltk.download(NLTK_RESOURCES[path])
+            _nltk_ready.add(path)
+
+def get_stop_words():
+    """Stopwords em português, carregadas uma única vez por processo"""
+    global _stop_words
+    if _stop_words is None:
+        ensure_nltk_resource('corpora/stopwords')
+        _stop_words = set(stopwords.words('portuguese'))
+    return _stop_words
+
+def get_stemmer():
+    """Stemmer RSLP, criado uma única vez por processo"""
+    global _stemmer
+    if _stemmer is None:
+        ensure_nltk_resource('stemmers/rslp')
+        _stemmer = RSLPStemmer()
+    return _stemmer
+
 class TextProcessor:
     def __init__(self):
-        # Baixar recursos do NLTK se necessário
-        try:
-            nltk.data.find('tokenizers/punkt')
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('punkt')
-            nltk.download('stopwords')
-            nltk.download('rslp')
-        
-        self.stop_words = set(stopwords.words('portuguese'))
-        self.stemmer = RSLPStemmer()
+        # Recursos do NLTK carregados sob demanda e compartilhados no processo
+        self.stop_words = get_stop_words()
+        self.stemmer = get_stemmer()
     
     def clean_text(self, text):
         """Limpa e normaliza o texto"""
@@ -49,7 +89,18 @@ class TextProcessor:
         return text
     
     def tokenize(self, text):
-        """Tokeniza o texto em palavras"""
+        """
+        Tokeniza o texto em palavras.
+
+        Texto já normalizado por clean_text (letras minúsculas e espaços simples)
+        é dividido nos espaços, com o mesmo resultado de word_tokenize; os demais
+        textos passam pelo tokenizador do NLTK.
+        """
+        if CLEAN_TEXT_PATTERN.fullmatch(text):
+            tokens = text.split()
+            if SPLIT_CONTRACTIONS.isdisjoint(tokens):
+                return tokens
+        ensure_nltk_resource('tokenizers/punkt')
         return word_tokenize(text, language='portuguese')
     
     def remove_stopwords(self, tokens):
@@ -0,0 +1,188 @@
+import os
+import logging
+import numpy as np
+from scipy import sparse
+from .text_processor import TextProcessor
+from .document_stats import DocumentFrequencies
+from src.utils.helpers import ensure_dir
+
+logger = logging.getLogger(__name__)
+
+# Número padrão de tópicos
+N_TOPICS = 12
+
+# Dimensão do espaço de termos (hashing): limita a memória independentemente do vocabulário
+N_FEATURES = 2 ** 18
+
+# Número de artigos por mini-lote do k-means
+TOPIC_BATCH_SIZE = 1000
+
+# Número de termos no rótulo de cada tópico
+TOPIC_LABEL_TERMS = 3
+
+class TopicModel:
+    """
+    Descoberta de tópicos com k-means em mini-lotes sobre TF-IDF.
+
+    Os termos (com o mesmo pré-processamento do TfidfKeywordExtractor) são
+    mapeados por hashing para um espaço de dimensão fixa, então nem o
+    vocabulário nem as matrizes crescem com o corpus. As frequências de
+    documentos (IDF) e os centros do MiniBatchKMeans são atualizados lote a
+    lote com partial_fit e persistidos entre execuções; cada tópico é
+    rotulado pelos termos de maior peso no seu centro.
+
+    O IDF é mantido por artigo (DocumentFrequencies): reprocessar os mesmos
+    artigos não o altera e um artigo editado substitui a versão anterior.
+    Só artigos vistos pela primeira vez ajustam os centros, então reexecuções
+    não deslocam os tópicos e execuções idênticas produzem os mesmos rótulos.
+    """
+
+    def __init__(self, n_topics=N_TOPICS, n_features=N_FEATURES, text_processor=None):
+        from sklearn.cluster import MiniBatchKMeans
+
+        self.text_processor = text_processor or TextProcessor()
+        self.n_features = n_features
+        self.kmeans = MiniBatchKMeans(n_clusters=n_topics, random_state=0, n_init=3)
+        self.statistics = DocumentFrequencies(n_features)
+        # Índice de cada termo no espaço de hashing -> primeiro termo visto (para os rótulos)
+        self.terms = {}
+
+    @property
+    def n_topics(self):
+        return self.kmeans.n_clusters
+
+    @property
+    def n_documents(self):
+        return self.statistics.n_documents
+
+    @property
+    def fitted(self):
+        """Indica se os centros já foram inicializados"""
+        return hasattr(self.kmeans, 'cluster_centers_')
+
+    def analyze(self, text):
+        """Tokens usados no cálculo do TF-IDF"""
+        if not text or not isinstance(text, str):
+            return []
+        return [token for token in self.text_processor.preprocess_text(text) if len(token) > 2]
+
+    def count_matrix(self, texts):
+        """
+        Monta a matriz esparsa documento x termo (hashing) com as frequências dos termos.
+
+        Returns:
+            scipy.sparse.csr_matrix: Matriz de contagens
+        """
+        from sklearn.utils import murmurhash3_32
+
+        indptr, indices = [0], []
+        for text in texts:
+            for token in self.analyze(text):
+                term_id = abs(murmurhash3_32(token, seed=0)) % self.n_features
+                self.terms.setdefault(term_id, token)
+                indices.append(term_id)
+            indptr.append(len(indices))
+
+        counts = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float64), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(texts), self.n_features)
+        )
+        counts.sum_duplicates()
+        return counts
+
+    def tfidf(self, counts):
+        """TF-IDF suavizado com normalização L2 por documento"""
+        from sklearn.preprocessing import normalize
+
+        idf = np.log((1 + self.n_documents) / (1 + self.statistics.document_frequency)) + 1
+        return normalize(counts @ sparse.diags(idf), norm='l2', copy=False)
+
+    def assign(self, texts, ids=None, batch_size=TOPIC_BATCH_SIZE):
+        """
+        Atualiza o modelo com os textos novos, em mini-lotes, e atribui um tópico a cada texto.
+
+        Em cada lote, os textos novos ou alterados atualizam o IDF e os
+        artigos vistos pela primeira vez ajustam os centros (partial_fit)
+        antes de o lote inteiro ser classificado, então a memória usada
+        depende apenas do tamanho do lote.
+
+        Args:
+            texts: Lista de textos
+            ids: Id do artigo de cada texto (opcional; sem ids, cada texto distinto é um artigo)
+            batch_size: Número de textos por mini-lote
+
+        Returns:
+            list: Rótulo do tópico de cada texto (None para textos sem termos
+            ou enquanto o modelo não tiver documentos suficientes)
+        """
+        topics = []
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            counts = self.count_matrix(batch)
+            new_rows = self.statistics.update(batch, counts, ids[start:start + batch_size] if ids is not None else None)
+
+            # Ajustar os centros apenas com os artigos novos que têm termos
+            new_counts = counts[new_rows]
+            new_counts = new_counts[np.flatnonzero(new_counts.getnnz(axis=1))]
+            if new_counts.shape[0] and (self.fitted or new_counts.shape[0] >= self.n_topics):
+                self.kmeans.partial_fit(self.tfidf(new_counts))
+
+            rows = np.flatnonzero(counts.getnnz(axis=1))
+            batch_topics = [None] * counts.shape[0]
+            if self.fitted and len(rows):
+                labels = self.labels()
+                for row, cluster in zip(rows, self.kmeans.predict(self.tfidf(counts[rows]))):
+                    batch_topics[row] = labels[cluster]
+            topics.extend(batch_topics)
+        return topics
+
+    def labels(self):
+        """
+        Rótulo de cada tópico: os termos de maior peso no seu centro.
+
+        Returns:
+            list: Rótulo de cada tópico, na ordem dos centros
+        """
+        labels = []
+        for center in self.kmeans.cluster_centers_:
+            top = np.argsort(-center, kind='stable')[:TOPIC_LABEL_TERMS]
+            labels.append(', '.join(self.terms.get(int(i), '?') for i in top if center[i] > 0))
+        return labels
+
+    def save(self, path):
+        """Persiste o modelo (k-means, IDF por artigo e termos dos rótulos) com joblib"""
+        import joblib
+
+        ensure_dir(os.path.dirname(path) or '.')
+        joblib.dump({
+            'kmeans': self.kmeans,
+            'n_features': self.n_features,
+            'terms': self.terms,
+            **self.statistics.state()
+        }, path, compress=3)
+
+    @classmethod
+    def load(cls, path, n_topics=N_TOPICS, text_processor=None):
+        """Carrega um modelo salvo, ou cria um novo se o arquivo não existir ou tiver outro número de tópicos"""
+        import joblib
+
+        model = cls(n_topics, text_processor=text_processor)
+        if os.path.exists(path):
+            data = joblib.load(path)
+            if data['kmeans'].n_clusters != n_topics:
+                logger.warning(
+                    f"Modelo de tópicos em {path} tem {data['kmeans'].n_clusters} tópicos, "
+                    f"e não {n_topics}; um novo modelo será treinado"
+                )
+                return model
+            model.kmeans = data['kmeans']
+            model.n_features = data['n_features']
+            model.terms = data['terms']
+            if 'document_keys' in data:
+                model.statistics = DocumentFrequencies.from_state(data)
+            else:
+                # Formato anterior, sem os termos de cada artigo: o IDF é recalculado
+                logger.warning(f"Modelo de tópicos em {path} no formato anterior; o IDF será recalculado")
+                model.statistics = DocumentFrequencies(model.n_features)
+            logger.info(f"Modelo de tópicos carregado de {path} ({model.n_documents} documentos)")
+        return model
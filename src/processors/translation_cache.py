@@ -0,0 +1,143 @@
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+from src.utils.helpers import ensure_dir
+
+logger = logging.getLogger(__name__)
+
+# Local padrão do cache de traduções
+DEFAULT_CACHE_PATH = 'data/cache/translations.sqlite'
+
+# Tamanho máximo (texto original + tradução, em bytes) antes da remoção por LRU
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Fração do limite mantida após uma remoção (evita remover a cada inserção)
+EVICTION_TARGET = 0.9
+
+# Número de acessos acumulados antes de gravar os horários de último uso
+TOUCH_FLUSH_SIZE = 500
+
+class TranslationCache:
+    """
+    Cache persistente de traduções em SQLite.
+
+    As entradas são indexadas por (hash do texto, idioma de origem, idioma de
+    destino, backend) e removidas pelo uso menos recente quando o tamanho total
+    passa de max_bytes.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._touched = {}
+
+        ensure_dir(os.path.dirname(path) or '.')
+        self._conn = sqlite3.connect(path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS translations ('
+            ' key TEXT PRIMARY KEY,'
+            ' translation TEXT NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' last_used REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used)')
+        self._conn.commit()
+        self.total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM translations').fetchone()[0]
+
+    @staticmethod
+    def make_key(text, source_lang, target_lang, backend):
+        """Chave do cache para um texto"""
+        text_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return f"{text_hash}:{source_lang}:{target_lang}:{backend}"
+
+    def get(self, text, source_lang, target_lang, backend):
+        """
+        Busca uma tradução no cache.
+
+        Returns:
+            str: Texto traduzido, ou None se não estiver no cache
+        """
+        key = self.make_key(text, source_lang, target_lang, backend)
+        row = self._conn.execute('SELECT translation FROM translations WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._touched[key] = time.time()
+        if len(self._touched) >= TOUCH_FLUSH_SIZE:
+            self._flush_touched()
+        return row[0]
+
+    def set(self, text, source_lang, target_lang, backend, translation):
+        """Armazena uma tradução no cache"""
+        self.set_many([(text, source_lang, target_lang, backend, translation)])
+
+    def set_many(self, entries):
+        """
+        Armazena várias traduções no cache em uma única transação.
+
+        Args:
+            entries: Iterável de tuplas (texto, idioma de origem, idioma de destino, backend, tradução)
+        """
+        now = time.time()
+        for text, source_lang, target_lang, backend, translation in entries:
+            key = self.make_key(text, source_lang, target_lang, backend)
+            size = len(text.encode('utf-8')) + len(translation.encode('utf-8'))
+
+            previous = self._conn.execute('SELECT size FROM translations WHERE key = ?', (key,)).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO translations (key, translation, size, last_used) VALUES (?, ?, ?, ?)',
+                (key, translation, size, now)
+            )
+            self.total_bytes += size - (previous[0] if previous else 0)
+        self._conn.commit()
+
+        if self.total_bytes > self.max_bytes:
+            self._evict()
+
+    def _flush_touched(self):
+        """Grava os horários de último uso acumulados"""
+        if self._touched:
+            self._conn.executemany(
+                'UPDATE translations SET last_used = ? WHERE key = ?',
+                [(last_used, key) for key, last_used in self._touched.items()]
+            )
+            self._conn.commit()
+            self._touched = {}
+
+    def _evict(self):
+        """Remove as entradas usadas há mais tempo até atingir o tamanho alvo"""
+        self._flush_touched()
+        target = self.max_bytes * EVICTION_TARGET
+
+        cursor = self._conn.execute('SELECT key, size FROM translations ORDER BY last_used')
+        to_delete = []
+        for key, size in cursor:
+            if self.total_bytes <= target:
+                break
+            to_delete.append((key,))
+            self.total_bytes -= size
+        cursor.close()
+
+        self._conn.executemany('DELETE FROM translations WHERE key = ?', to_delete)
+        removed = len(to_delete)
+        self._conn.commit()
+        logger.info(f"Cache de traduções: {removed} entradas removidas ({self.total_bytes} bytes)")
+
+    def close(self):
+        """Grava pendências e fecha o banco"""
+        self._flush_touched()
+        self._conn.close()
+        logger.info(f"Cache de traduções: {self.hits} acertos, {self.misses} faltas")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
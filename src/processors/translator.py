@@ -1,6 +1,10 @@
-import requests
+import re
 import os
+import time
 import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Carregar variáveis de ambiente
@@ -8,68 +12,513 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-def translate_text(text, source_lang='auto', target_lang='pt'):
+OFFICIAL_URL = "https://translation.googleapis.com/language/translate/v2"
+UNOFFICIAL_URL = "https://translate.googleapis.com/translate_a/single"
+
+# Limites por requisição da API oficial (Translation v2): até 128 textos
+# ('q') por chamada; o total de caracteres é mantido bem abaixo do limite
+MAX_BATCH_SEGMENTS = 128
+MAX_BATCH_CHARS = 30000
+
+# Número padrão de requisições simultâneas em translate_batch
+DEFAULT_CONCURRENCY = 4
+
+# Tamanho máximo de cada trecho de um texto longo (o endpoint não oficial usa GET)
+MAX_CHUNK_CHARS = 2000
+
+# Limite entre frases: espaço após pontuação final
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?;:])\s+')
+
+# Orçamento padrão de caracteres enviados para tradução por execução
+DEFAULT_TRANSLATION_BUDGET = 1000000
+
+# Timeouts (conexão, leitura) em segundos de cada requisição
+REQUEST_TIMEOUT = (3.05, 15)
+
+# Circuit breaker: falhas seguidas para abrir e espera antes de nova tentativa
+FAILURE_THRESHOLD = 3
+RESET_TIMEOUT = 60
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """Sessão HTTP compartilhada, com pool de conexões para requisições simultâneas"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            # requests só é importado na primeira requisição
+            import requests
+            from requests.adapters import HTTPAdapter
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=DEFAULT_CONCURRENCY, pool_maxsize=DEFAULT_CONCURRENCY * 2)
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+        return _session
+
+class BackendUnavailable(Exception):
+    """Backend de tradução com o circuito aberto"""
+
+class CircuitBreaker:
+    """
+    Circuit breaker de um backend de tradução.
+
+    Abre após failure_threshold falhas seguidas; enquanto aberto, as chamadas
+    são recusadas de imediato. Depois de reset_timeout segundos, uma única
+    chamada de teste é liberada (meio aberto): sucesso fecha o circuito,
+    falha o reabre.
+    """
+
+    CLOSED = 'fechado'
+    OPEN = 'aberto'
+    HALF_OPEN = 'meio aberto'
+
+    def __init__(self, name, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Indica se uma chamada pode ser feita agora"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Backend de tradução '{self.name}' restabelecido")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(
+                        f"Backend de tradução '{self.name}' indisponível; "
+                        f"novas tentativas em {self.reset_timeout}s"
+                    )
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._probing = False
+
+class TranslationStats:
+    """Resumo das traduções de uma execução"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.translated = Counter()
+            self.failures = Counter()
+            self.short_circuited = Counter()
+            self.skipped = 0
+
+    def add(self, counter_name, backend, count=1):
+        with self._lock:
+            getattr(self, counter_name)[backend] += count
+
+    def add_skipped(self, count=1):
+        with self._lock:
+            self.skipped += count
+
+    def summary(self):
+        """Texto com o resumo da execução"""
+        parts = [f"{sum(self.translated.values())} textos traduzidos"]
+        for backend, count in self.translated.items():
+            parts.append(f"{count} via {backend}")
+        if self.failures:
+            parts.append("falhas: " + ", ".join(f"{b}={c}" for b, c in self.failures.items()))
+        if self.short_circuited:
+            parts.append("recusados com circuito aberto: " + ", ".join(
+                f"{b}={c}" for b, c in self.short_circuited.items()
+            ))
+        parts.append(f"{self.skipped} textos mantidos sem tradução")
+        return "; ".join(parts)
+
+# Estatísticas da execução corrente
+translation_stats = TranslationStats()
+
+class TranslationBackend:
+    """Backend de tradução com timeout explícito e circuit breaker próprio"""
+
+    name = None
+
+    def __init__(self, timeout=REQUEST_TIMEOUT):
+        self.timeout = timeout
+        self.breaker = CircuitBreaker(self.name)
+
+    def translate(self, texts, source_lang, target_lang):
+        """
+        Traduz os textos, respeitando o circuit breaker.
+
+        Raises:
+            BackendUnavailable: Se o circuito estiver aberto
+        """
+        if not self.breaker.allow():
+            translation_stats.add('short_circuited', self.name, len(texts))
+            raise BackendUnavailable(self.name)
+
+        try:
+            translations = self._request(texts, source_lang, target_lang)
+        except Exception:
+            self.breaker.record_failure()
+            translation_stats.add('failures', self.name)
+            raise
+
+        self.breaker.record_success()
+        translation_stats.add('translated', self.name, len(texts))
+        return translations
+
+    def _request(self, texts, source_lang, target_lang):
+        raise NotImplementedError
+
+class OfficialBackend(TranslationBackend):
+    """API oficial (Translation v2), com vários textos por requisição"""
+
+    name = 'official'
+
+    def _request(self, texts, source_lang, target_lang):
+        data = [('q', text) for text in texts]
+        data += [('target', target_lang), ('key', os.getenv('GOOGLE_TRANSLATE_API_KEY'))]
+        if source_lang != 'auto':
+            data.append(('source', source_lang))
+
+        response = get_session().post(OFFICIAL_URL, data=data, timeout=self.timeout)
+        response.raise_for_status()
+
+        result = response.json()
+        return [translation['translatedText'] for translation in result['data']['translations']]
+
+class UnofficialBackend(TranslationBackend):
+    """Endpoint não oficial (sem API key), um texto por requisição"""
+
+    name = 'unofficial'
+
+    def _request(self, texts, source_lang, target_lang):
+        translations = []
+        for text in texts:
+            params = {
+                'client': 'gtx',
+                'sl': source_lang,
+                'tl': target_lang,
+                'dt': 't',
+                'q': text
+            }
+
+            response = get_session().get(UNOFFICIAL_URL, params=params, timeout=self.timeout)
+            response.raise_for_status()
+
+            # Extrair texto traduzido da resposta
+            result = response.json()
+            translations.append(''.join([sentence[0] for sentence in result[0] if sentence[0]]))
+        return translations
+
+official_backend = OfficialBackend()
+unofficial_backend = UnofficialBackend()
+
+def get_backends():
+    """Backends na ordem de preferência (a API oficial exige chave)"""
+    if os.getenv('GOOGLE_TRANSLATE_API_KEY'):
+        return [official_backend, unofficial_backend]
+    return [unofficial_backend]
+
+def log_translation_summary(reset=True):
+    """Registra o resumo das traduções da execução"""
+    logger.info(f"Resumo das traduções: {translation_stats.summary()}")
+    if reset:
+        translation_stats.reset()
+
+def _lookup_cache(cache, text, source_lang, target_lang, backends):
+    """Busca a tradução no cache na ordem de preferência dos backends"""
+    for backend in backends:
+        cached = cache.get(text, source_lang, target_lang, backend.name)
+        if cached is not None:
+            return cached
+    return None
+
+def translate_text(text, source_lang='auto', target_lang='pt', cache=None):
     """
     Traduz texto usando a API do Google Translate.
-    
+
     Args:
         text (str): Texto a ser traduzido
         source_lang (str): Idioma de origem (padrão: auto-detecção)
         target_lang (str): Idioma de destino (padrão: português)
-        
+        cache (TranslationCache): Cache persistente consultado antes de qualquer requisição
+
     Returns:
         str: Texto traduzido
     """
     if not text:
         return ""
-    
-    # Verificar se há uma chave de API configurada
-    api_key = os.getenv('GOOGLE_TRANSLATE_API_KEY')
-    
-    if api_key:
-        # Usar a API oficial do Google Translate (requer chave)
+
+    backends = get_backends()
+
+    # Consultar o cache na ordem de preferência dos backends
+    if cache is not None:
+        cached = _lookup_cache(cache, text, source_lang, target_lang, backends)
+        if cached is not None:
+            return cached
+
+    # API oficial (se houver chave) e, como alternativa, o endpoint não oficial
+    for backend in backends:
         try:
-            url = "https://translation.googleapis.com/language/translate/v2"
-            params = {
-                'q': text,
-                'target': target_lang,
-                'key': api_key
-            }
-            
-            if source_lang != 'auto':
-                params['source'] = source_lang
-                
-            response = requests.post(url, params=params)
-            response.raise_for_status()
-            
-            result = response.json()
-            translated_text = result['data']['translations'][0]['translatedText']
-            return translated_text
-            
+            translated_text = backend.translate([text], source_lang, target_lang)[0]
+        except BackendUnavailable:
+            continue
         except Exception as e:
-            logger.error(f"Erro ao traduzir texto usando API oficial: {str(e)}")
-            # Fallback para método alternativo
-    
-    # Método alternativo (sem API key) - menos confiável e com limites de uso
-    try:
-        # URL para API não oficial
-        url = "https://translate.googleapis.com/translate_a/single"
-        params = {
-            'client': 'gtx',
-            'sl': source_lang,
-            'tl': target_lang,
-            'dt': 't',
-            'q': text
-        }
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        # Extrair texto traduzido da resposta
-        result = response.json()
-        translated_text = ''.join([sentence[0] for sentence in result[0] if sentence[0]])
+            logger.error(f"Erro ao traduzir texto usando backend '{backend.name}': {str(e)}")
+            continue
+
+        if cache is not None:
+            cache.set(text, source_lang, target_lang, backend.name, translated_text)
         return translated_text
-        
-    except Exception as e:
-        logger.error(f"Erro ao traduzir texto usando método alternativo: {str(e)}")
-        return text  # Retornar texto original em caso de erro
\ No newline at end of file
+
+    translation_stats.add_skipped()
+    return text  # Retornar texto original em caso de erro
+
+
+def _pack_batches(texts):
+    """Agrupa textos em lotes dentro dos limites de uma requisição"""
+    batches = []
+    current, current_chars = [], 0
+    for text in texts:
+        if current and (len(current) >= MAX_BATCH_SEGMENTS or current_chars + len(text) > MAX_BATCH_CHARS):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(text)
+        current_chars += len(text)
+    if current:
+        batches.append(current)
+    return batches
+
+def _lookup_all(texts, cache, source_lang, target_lang, backends):
+    """
+    Separa os textos únicos (na ordem de entrada) entre encontrados no cache e pendentes.
+
+    Returns:
+        tuple: (dicionário texto -> tradução do cache, lista de textos pendentes)
+    """
+    translations, pending = {}, []
+    for text in dict.fromkeys(text for text in texts if text):
+        cached = _lookup_cache(cache, text, source_lang, target_lang, backends) if cache is not None else None
+        if cached is not None:
+            translations[text] = cached
+        else:
+            pending.append(text)
+    return translations, pending
+
+def _translate_uncached(pending, source_lang, target_lang, cache, backends, max_workers):
+    """
+    Traduz textos ausentes do cache com requisições em lote e simultâneas,
+    passando ao próximo backend os textos que falharem.
+
+    Returns:
+        dict: Texto -> tradução (textos que falharam em todos os backends ficam de fora)
+    """
+    new_translations = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for backend in backends:
+            if not pending:
+                break
+
+            # A API oficial recebe vários textos por requisição
+            if isinstance(backend, OfficialBackend):
+                batches = _pack_batches(pending)
+            else:
+                batches = [[text] for text in pending]
+
+            futures = [executor.submit(backend.translate, batch, source_lang, target_lang) for batch in batches]
+            failed = []
+            for batch, future in zip(batches, futures):
+                try:
+                    for text, translated_text in zip(batch, future.result()):
+                        new_translations[text] = (backend.name, translated_text)
+                except BackendUnavailable:
+                    failed.extend(batch)
+                except Exception as e:
+                    logger.error(
+                        f"Erro ao traduzir lote de {len(batch)} textos usando backend '{backend.name}': {str(e)}"
+                    )
+                    failed.extend(batch)
+            pending = failed
+
+    translation_stats.add_skipped(len(pending))
+
+    # Gravar as traduções novas no cache em uma única transação
+    if cache is not None:
+        cache.set_many(
+            (text, source_lang, target_lang, backend_name, translated_text)
+            for text, (backend_name, translated_text) in new_translations.items()
+        )
+    return {text: translated_text for text, (_, translated_text) in new_translations.items()}
+
+def translate_batch(texts, source_lang='auto', target_lang='pt', cache=None, max_workers=DEFAULT_CONCURRENCY):
+    """
+    Traduz uma lista de textos com requisições em lote e simultâneas.
+
+    Com a API oficial, os textos são agrupados em requisições de até
+    MAX_BATCH_SEGMENTS textos / MAX_BATCH_CHARS caracteres; sem chave (ou para
+    lotes que falharem), cada texto usa o endpoint não oficial. Textos
+    repetidos são traduzidos uma única vez. Backends com o circuito aberto são
+    pulados sem nenhuma requisição.
+
+    Args:
+        texts (list): Textos a serem traduzidos
+        source_lang (str): Idioma de origem (padrão: auto-detecção)
+        target_lang (str): Idioma de destino (padrão: português)
+        cache (TranslationCache): Cache persistente consultado antes de qualquer requisição
+        max_workers (int): Número de requisições simultâneas
+
+    Returns:
+        list: Textos traduzidos, na mesma ordem da entrada
+    """
+    backends = get_backends()
+    translations, pending = _lookup_all(texts, cache, source_lang, target_lang, backends)
+    translations.update(_translate_uncached(pending, source_lang, target_lang, cache, backends, max_workers))
+
+    # Textos vazios ficam vazios; falhas mantêm o texto original
+    return [translations.get(text, text) if text else "" for text in texts]
+
+class TranslationBudget:
+    """Limite de caracteres enviados para tradução em uma execução (None: sem limite)"""
+
+    def __init__(self, max_chars=DEFAULT_TRANSLATION_BUDGET):
+        self.max_chars = max_chars
+        self.used = 0
+        self.rejected = 0
+
+    def reserve(self, chars):
+        """Reserva caracteres do orçamento; retorna False se não couberem"""
+        if self.max_chars is not None and self.used + chars > self.max_chars:
+            self.rejected += 1
+            return False
+        self.used += chars
+        return True
+
+def _split_long(sentence, max_chars):
+    """Divide uma frase longa demais entre palavras (ou, em último caso, no meio da palavra)"""
+    pieces, current = [], ''
+    for word in sentence.split():
+        while len(word) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ''
+            pieces.append(word[:max_chars])
+            word = word[max_chars:]
+        if current and len(current) + 1 + len(word) > max_chars:
+            pieces.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    if current:
+        pieces.append(current)
+    return pieces
+
+def split_into_chunks(text, max_chars=MAX_CHUNK_CHARS):
+    """
+    Divide um texto em trechos de até max_chars caracteres nos limites de frase.
+
+    Frases consecutivas são agrupadas no mesmo trecho; frases maiores que o
+    limite são divididas entre palavras.
+
+    Args:
+        text (str): Texto a ser dividido
+        max_chars (int): Tamanho máximo de cada trecho
+
+    Returns:
+        list: Trechos do texto, na ordem original
+    """
+    chunks, current = [], ''
+    for sentence in SENTENCE_BOUNDARY.split(text.strip()):
+        pieces = [sentence] if len(sentence) <= max_chars else _split_long(sentence, max_chars)
+        for piece in pieces:
+            if current and len(current) + 1 + len(piece) > max_chars:
+                chunks.append(current)
+                current = piece
+            else:
+                current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+def translate_documents(texts, source_lang='auto', target_lang='pt', cache=None,
+                        max_workers=DEFAULT_CONCURRENCY, budget=None):
+    """
+    Traduz textos completos, divididos em trechos nos limites de frase.
+
+    Os trechos de todos os documentos são deduplicados e consultados no cache;
+    os restantes são traduzidos em lote e em paralelo (como em translate_batch)
+    e os documentos são remontados na ordem original. Os documentos são
+    aceitos em ordem enquanto os caracteres ainda não traduzidos couberem no
+    orçamento; os demais não são enviados. Um documento com algum trecho
+    que falhou em todos os backends não é remontado (o texto misturaria
+    idiomas), e quem o usa recorre ao campo original.
+
+    Args:
+        texts (list): Textos a serem traduzidos
+        source_lang (str): Idioma de origem (padrão: auto-detecção)
+        target_lang (str): Idioma de destino (padrão: português)
+        cache (TranslationCache): Cache persistente consultado antes de qualquer requisição
+        max_workers (int): Número de requisições simultâneas
+        budget (TranslationBudget): Orçamento de caracteres da execução (opcional)
+
+    Returns:
+        list: Textos traduzidos na ordem da entrada; None para documentos fora
+        do orçamento ou com trechos não traduzidos
+    """
+    backends = get_backends()
+    doc_chunks = [split_into_chunks(text) if isinstance(text, str) else [] for text in texts]
+    translations, pending = _lookup_all(
+        [chunk for chunks in doc_chunks for chunk in chunks], cache, source_lang, target_lang, backends
+    )
+
+    # Selecionar, em ordem, os documentos cujos trechos novos cabem no orçamento
+    pending = set(pending)
+    selected = {}
+    accepted = []
+    for chunks in doc_chunks:
+        missing = [chunk for chunk in dict.fromkeys(chunks) if chunk in pending and chunk not in selected]
+        ok = budget is None or budget.reserve(sum(len(chunk) for chunk in missing))
+        if ok:
+            selected.update(dict.fromkeys(missing))
+        accepted.append(ok)
+
+    # Avisar apenas na primeira vez em que o orçamento se esgota
+    rejected = accepted.count(False)
+    if rejected and budget.rejected == rejected:
+        logger.warning(
+            f"Orçamento de tradução atingido ({budget.used}/{budget.max_chars} caracteres usados); "
+            f"os textos restantes não serão traduzidos"
+        )
+
+    translations.update(_translate_uncached(list(selected), source_lang, target_lang, cache, backends, max_workers))
+
+    results, incomplete = [], 0
+    for chunks, ok in zip(doc_chunks, accepted):
+        if ok and all(chunk in translations for chunk in chunks):
+            results.append(' '.join(translations[chunk] for chunk in chunks))
+        else:
+            incomplete += ok
+            results.append(None)
+    if incomplete:
+        logger.warning(f"{incomplete} documentos com trechos não traduzidos mantêm apenas o texto original")
+    return results
@@ -0,0 +1,12 @@
+# src/reports/__init__.py
+
+from .html_renderer import HtmlReportWriter, Link, Template
+from .indexes import build_category_index, recent_articles_by_category
+
+__all__ = [
+    'HtmlReportWriter',
+    'Link',
+    'Template',
+    'build_category_index',
+    'recent_articles_by_category'
+]
@@ -0,0 +1,164 @@
+import os
+import json
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Versão dos gráficos; alterá-la invalida o cache de gráficos
+CHART_VERSION = '1'
+
+# Número máximo de palavras na nuvem de palavras-chave
+WORDCLOUD_MAX_WORDS = 200
+
+# Arquivo com a chave de cache de cada gráfico gerado
+CHART_CACHE_PATH = 'data/processed/chart_cache.json'
+
+def _new_figure(figsize):
+    """Cria uma figura com o backend Agg, sem o estado global do pyplot"""
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+    return Figure(figsize=figsize)
+
+def render_bar_chart(path, labels, values, title, xlabel, ylabel, figsize=(10, 6), rotation=90, ha='center'):
+    """
+    Gera um gráfico de barras e o salva em path.
+
+    Args:
+        path: Caminho da imagem
+        labels: Rótulos das barras
+        values: Valores das barras
+        title, xlabel, ylabel: Textos do gráfico
+        figsize: Tamanho da figura
+        rotation, ha: Rotação e alinhamento dos rótulos do eixo x
+    """
+    import matplotlib.style
+
+    with matplotlib.style.context('ggplot'):
+        fig = _new_figure(figsize)
+        ax = fig.subplots()
+        ax.bar(labels, values)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.tick_params(axis='x', labelrotation=rotation)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment(ha)
+        fig.tight_layout()
+        fig.savefig(path)
+
+def render_wordcloud(path, frequencies, figsize=(10, 5)):
+    """
+    Gera a nuvem de palavras a partir das frequências já contadas e a salva em path.
+
+    Args:
+        path: Caminho da imagem
+        frequencies: Dicionário palavra -> frequência
+        figsize: Tamanho da figura
+    """
+    import matplotlib.style
+    from wordcloud import WordCloud
+
+    wordcloud = WordCloud(
+        width=800, height=400, background_color='white', max_words=WORDCLOUD_MAX_WORDS
+    ).generate_from_frequencies(frequencies)
+    with matplotlib.style.context('ggplot'):
+        fig = _new_figure(figsize)
+        ax = fig.subplots()
+        ax.imshow(wordcloud, interpolation='bilinear')
+        ax.axis('off')
+        fig.savefig(path)
+
+def render_line_chart(path, x, series, title, xlabel, ylabel, figsize=(12, 6), rotation=45):
+    """
+    Gera um gráfico de linhas (uma linha por série) e o salva em path.
+
+    Args:
+        path: Caminho da imagem
+        x: Valores do eixo x, comuns a todas as séries
+        series: Dicionário nome -> valores (um por valor de x)
+        title, xlabel, ylabel: Textos do gráfico
+        figsize: Tamanho da figura
+        rotation: Rotação dos rótulos do eixo x
+    """
+    import matplotlib.style
+
+    with matplotlib.style.context('ggplot'):
+        fig = _new_figure(figsize)
+        ax = fig.subplots()
+        for name, values in series.items():
+            ax.plot(x, values, marker='o', label=name)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.tick_params(axis='x', labelrotation=rotation)
+        ax.legend(loc='upper left', fontsize='small')
+        fig.tight_layout()
+        fig.savefig(path)
+
+# Funções de renderização disponíveis, por nome (os processos recebem apenas o nome)
+RENDERERS = {
+    'bar': render_bar_chart,
+    'wordcloud': render_wordcloud,
+    'line': render_line_chart,
+}
+
+def chart_key(kind, params):
+    """Chave de cache: hash do tipo do gráfico, dos dados de entrada e da versão"""
+    payload = json.dumps([CHART_VERSION, kind, params], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _render(kind, path, params):
+    RENDERERS[kind](path, **params)
+    return path
+
+def _load_cache(cache_path):
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+def render_charts(charts, workers=1, cache_path=CHART_CACHE_PATH):
+    """
+    Gera os gráficos em paralelo, reaproveitando os que não mudaram.
+
+    Cada gráfico é identificado pelo hash dos seus dados de entrada; se a
+    imagem já existe e a chave é a mesma da última geração, ela é reutilizada.
+
+    Args:
+        charts: Lista de tuplas (tipo, caminho da imagem, parâmetros)
+        workers: Número de processos (1 para gerar no próprio processo)
+        cache_path: Arquivo com as chaves dos gráficos gerados
+
+    Returns:
+        list: Caminhos das imagens, na ordem de charts
+    """
+    cache = _load_cache(cache_path)
+
+    pending = []
+    for kind, path, params in charts:
+        key = chart_key(kind, params)
+        if cache.get(path) == key and os.path.exists(path):
+            logger.info(f"Gráfico reaproveitado do cache: {path}")
+        else:
+            pending.append((kind, path, params, key))
+
+    if pending:
+        if workers > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+                futures = [executor.submit(_render, kind, path, params) for kind, path, params, _ in pending]
+                for future in futures:
+                    future.result()
+        else:
+            for kind, path, params, _ in pending:
+                _render(kind, path, params)
+
+        for _, path, _, key in pending:
+            cache[path] = key
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=4)
+        logger.info(f"{len(pending)} gráficos gerados, {len(charts) - len(pending)} reaproveitados")
+
+    return [path for _, path, _ in charts]
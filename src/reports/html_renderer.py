@@ -0,0 +1,168 @@
+import html
+from string import Formatter
+
+class Template:
+    """
+    Template HTML pré-compilado.
+
+    O texto é dividido uma única vez em trechos literais e campos
+    ({nome}); na renderização, os valores dos campos são escapados com
+    html.escape (inclusive aspas, para uso em atributos), exceto os passados
+    em `safe`, que já são HTML.
+    """
+
+    def __init__(self, text):
+        self.parts = [
+            (literal, field)
+            for literal, field, _, _ in Formatter().parse(text)
+        ]
+
+    def render(self, safe=None, **values):
+        """Renderiza o template com os valores escapados"""
+        safe = safe or {}
+        chunks = []
+        for literal, field in self.parts:
+            chunks.append(literal)
+            if field is None:
+                continue
+            if field in safe:
+                chunks.append(str(safe[field]))
+            else:
+                chunks.append(html.escape(str(values[field]), quote=True))
+        return ''.join(chunks)
+
+PAGE_START = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; }}
+        h1, h2, h3 {{ color: #2c3e50; }}
+        .container {{ max-width: 1200px; margin: 0 auto; }}
+        .section {{ margin-bottom: 40px; }}
+        .chart {{ margin: 20px 0; }}
+        table {{ border-collapse: collapse; width: 100%; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #f2f2f2; }}
+        tr:nth-child(even) {{ background-color: #f9f9f9; }}
+        .alert {{ background-color: #f8d7da; color: #721c24; padding: 10px; border-radius: 5px; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>{title}</h1>
+        <p>Relatório gerado em {generated_at}</p>
+""")
+
+PAGE_END = Template("""    </div>
+</body>
+</html>
+""")
+
+SECTION_START = Template("""        <div class="section">
+            <h2>{title}</h2>
+""")
+
+SECTION_END = Template("""        </div>
+""")
+
+HEADING = Template("""            <h3>{text}</h3>
+""")
+
+PARAGRAPH = Template("""            <p>{text}</p>
+""")
+
+TABLE_START = Template("""            <table>
+                <tr>{header_cells}</tr>
+""")
+
+HEADER_CELL = Template("<th>{text}</th>")
+
+ROW = Template("""                <tr>{cells}</tr>
+""")
+
+CELL = Template("<td>{text}</td>")
+
+LINK_CELL = Template('<td><a href="{url}" target="_blank">{text}</a></td>')
+
+TABLE_END = Template("""            </table>
+""")
+
+IMAGE = Template("""            <div class="chart">
+                <img src="{src}" alt="{alt}" style="max-width: 100%;">
+            </div>
+""")
+
+ALERT = Template("""            <div class="alert">
+                <p>{text}</p>
+            </div>
+""")
+
+class Link:
+    """Célula de tabela com link"""
+
+    __slots__ = ('text', 'url')
+
+    def __init__(self, text, url):
+        self.text = text
+        self.url = url
+
+class HtmlReportWriter:
+    """
+    Escreve o relatório HTML seção a seção em um arquivo aberto.
+
+    Cada chamada grava imediatamente o trecho renderizado, então a memória
+    usada não depende do tamanho do relatório; tabelas são emitidas linha a
+    linha com row().
+    """
+
+    def __init__(self, f):
+        self.f = f
+
+    def start_page(self, title, generated_at):
+        self.f.write(PAGE_START.render(title=title, generated_at=generated_at))
+
+    def end_page(self):
+        self.f.write(PAGE_END.render())
+
+    def start_section(self, title):
+        self.f.write(SECTION_START.render(title=title))
+
+    def end_section(self):
+        self.f.write(SECTION_END.render())
+
+    def heading(self, text):
+        self.f.write(HEADING.render(text=text))
+
+    def paragraph(self, text):
+        self.f.write(PARAGRAPH.render(text=text))
+
+    def start_table(self, headers):
+        header_cells = ''.join(HEADER_CELL.render(text=header) for header in headers)
+        self.f.write(TABLE_START.render(safe={'header_cells': header_cells}))
+
+    def row(self, cells):
+        """Grava uma linha da tabela (valores Link viram células com link)"""
+        rendered = ''.join(
+            LINK_CELL.render(text=cell.text, url=cell.url) if isinstance(cell, Link) else CELL.render(text=cell)
+            for cell in cells
+        )
+        self.f.write(ROW.render(safe={'cells': rendered}))
+
+    def end_table(self):
+        self.f.write(TABLE_END.render())
+
+    def table(self, headers, rows):
+        """Grava uma tabela completa a partir de um iterável de linhas"""
+        self.start_table(headers)
+        for cells in rows:
+            self.row(cells)
+        self.end_table()
+
+    def image(self, src, alt):
+        self.f.write(IMAGE.render(src=src, alt=alt))
+
+    def alert(self, text):
+        self.f.write(ALERT.render(text=text))
@@ -0,0 +1,56 @@
+def parse_dates(values):
+    """
+    Converte datas em texto (ISO 8601, como gravadas pelos scrapers) para datetime.
+
+    Datas ausentes ou em formato não reconhecido viram NaT.
+    """
+    import pandas as pd
+    return pd.to_datetime(values, errors='coerce', format='ISO8601', utc=True)
+
+def build_category_index(df, n=5, columns=('title', 'url', 'source', 'date')):
+    """
+    Monta o índice dos artigos mais recentes de cada categoria.
+
+    As listas de categorias são expandidas uma única vez (uma linha por par
+    artigo-categoria), ordenadas uma única vez pela data convertida e
+    agrupadas por categoria, mantendo os n primeiros de cada grupo. Artigos
+    sem data válida ficam depois dos datados.
+
+    Args:
+        df: DataFrame de artigos com a coluna 'categories' (listas)
+        n: Número de artigos por categoria
+        columns: Colunas dos artigos incluídas no índice
+
+    Returns:
+        DataFrame com a coluna 'category', as colunas pedidas e 'parsed_date'
+    """
+    import pandas as pd
+
+    columns = [col for col in columns if col in df.columns]
+    exploded = df[columns + ['categories']].explode('categories').rename(columns={'categories': 'category'})
+    exploded = exploded[exploded['category'].notna()]
+
+    if 'date' in exploded.columns:
+        parsed_dates = parse_dates(exploded['date'])
+    else:
+        parsed_dates = pd.Series(pd.NaT, index=exploded.index, dtype='datetime64[ns, UTC]')
+
+    exploded = exploded.assign(parsed_date=parsed_dates).sort_values(
+        'parsed_date', ascending=False, kind='stable', na_position='last'
+    )
+    return exploded.groupby('category', sort=False).head(n)
+
+def recent_articles_by_category(df, n=5, columns=('title', 'url', 'source', 'date')):
+    """
+    Artigos mais recentes de cada categoria.
+
+    Args:
+        df: DataFrame de artigos com a coluna 'categories' (listas)
+        n: Número de artigos por categoria
+        columns: Colunas dos artigos incluídas
+
+    Returns:
+        dict: Categoria -> DataFrame com até n artigos, do mais recente ao mais antigo
+    """
+    index = build_category_index(df, n, columns)
+    return {category: group for category, group in index.groupby('category', sort=False)}
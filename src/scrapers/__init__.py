@@ -1,6 +1,16 @@
-from .abrafac import AbrafacScraper
-from .infrafm import InfraFMScraper
-from .google_scholar import GoogleScholarScraper
-from .ifma import IfmaScraper
+# Os scrapers são importados sob demanda: o do Google Scholar depende de
+# Selenium e webdriver-manager, que não devem ser carregados nas demais fontes
+_SCRAPERS = {
+    'AbrafacScraper': '.abrafac',
+    'InfraFMScraper': '.infrafm',
+    'GoogleScholarScraper': '.google_scholar',
+    'IfmaScraper': '.ifma',
+}
 
-__all__ = ['AbrafacScraper', 'InfraFMScraper', 'GoogleScholarScraper', 'IfmaScraper']
\ No newline at end of file
+def __getattr__(name):
+    if name in _SCRAPERS:
+        from importlib import import_module
+        return getattr(import_module(_SCRAPERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ['AbrafacScraper', 'InfraFMScraper', 'GoogleScholarScraper', 'IfmaScraper']
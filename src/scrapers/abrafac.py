@@ -3,6 +3,7 @@ import logging
 import time
 from bs4 import BeautifulSoup
 from datetime import datetime
+from src.utils.article import Article
 from src.utils.helpers import clean_text, save_article, extract_date
 
 logger = logging.getLogger(__name__)
@@ -119,17 +120,17 @@ class AbrafacScraper:
             for cat in category_tags:
                 categories.append(cat.text.strip())
             
-            # Criar dicionário com os dados do artigo
-            article_data = {
-                'title': title,
-                'url': article_url,
-                'date': date.isoformat() if hasattr(date, 'isoformat') else str(date),
-                'author': author,
-                'content': content,
-                'categories': categories,
-                'source': 'ABRAFAC',
-                'language': 'pt'
-            }
+            # Criar o registro do artigo
+            article_data = Article(
+                title=title,
+                url=article_url,
+                date=date.isoformat() if hasattr(date, 'isoformat') else str(date),
+                author=author,
+                content=content,
+                categories=categories,
+                source='ABRAFAC',
+                language='pt'
+            )
             
             return article_data
             
@@ -12,6 +12,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+from src.utils.article import Article
 from src.utils.helpers import clean_text, save_article
 
 logger = logging.getLogger(__name__)
@@ -137,15 +138,15 @@ class GoogleScholarScraper:
                         if year_match:
                             year = year_match.group(0)
                     
-                    article_data = {
-                        'title': title,
-                        'url': url,
-                        'authors': authors_text,
-                        'abstract': abstract,
-                        'year': year,
-                        'source': 'Google Scholar',
-                        'language': language
-                    }
+                    article_data = Article(
+                        title=title,
+                        url=url,
+                        authors=authors_text,
+                        abstract=abstract,
+                        year=year,
+                        source='Google Scholar',
+                        language=language
+                    )
                     
                     all_articles.append(article_data)
                 
@@ -1,21 +1,29 @@
 # src/utils/__init__.py
 
+from .article import Article
 from .helpers import (
     setup_logging,
     ensure_dir,
     clean_text,
     generate_article_id,
+    generate_content_hash,
+    text_fingerprint,
     save_article,
     load_articles,
+    iter_articles,
     extract_date
 )
 
 __all__ = [
+    'Article',
     'setup_logging',
     'ensure_dir',
     'clean_text',
     'generate_article_id',
+    'generate_content_hash',
+    'text_fingerprint',
     'save_article',
     'load_articles',
+    'iter_articles',
     'extract_date'
 ]
\ No newline at end of file
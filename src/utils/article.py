@@ -0,0 +1,131 @@
+import sys
+import json
+
+# Campos de um artigo, na ordem em que são gravados; a ordem das chaves de
+# cada fonte (HTML: date/author/content/categories; Google Scholar:
+# authors/abstract/year) é uma subsequência desta, então os arquivos JSON
+# mantêm o mesmo formato
+ARTICLE_FIELDS = (
+    'title', 'url', 'date', 'author', 'authors', 'abstract', 'year', 'content', 'categories',
+    'source', 'language', 'id', 'collected_at'
+)
+
+# Campos de baixa cardinalidade, internados para que artigos iguais compartilhem a mesma string
+INTERNED_FIELDS = frozenset({'author', 'source', 'language'})
+
+# Campos que todo artigo coletado deve ter
+REQUIRED_FIELDS = ('title', 'url', 'source')
+
+_FIELD_SET = frozenset(ARTICLE_FIELDS)
+
+class Article:
+    """
+    Registro compacto de um artigo coletado.
+
+    Os campos conhecidos ficam em __slots__ (sem um dicionário por objeto) e
+    os de baixa cardinalidade (fonte, idioma, autor e as categorias do site)
+    são internados. Campos ausentes ficam sem valor e não aparecem em
+    to_dict(), então fontes com esquemas diferentes convivem no mesmo tipo;
+    chaves desconhecidas são preservadas em `extra`.
+
+    Para leitura, o artigo se comporta como um dicionário (get, [], in,
+    keys), o que mantém compatível o código que recebia dicionários.
+    """
+
+    __slots__ = ARTICLE_FIELDS + ('extra',)
+
+    def __init__(self, **fields):
+        self.extra = None
+        for name, value in fields.items():
+            self._set(name, value)
+
+    def _set(self, name, value):
+        if name in INTERNED_FIELDS and isinstance(value, str):
+            value = sys.intern(value)
+        elif name == 'categories' and isinstance(value, list):
+            value = [sys.intern(item) if isinstance(item, str) else item for item in value]
+
+        if name in _FIELD_SET:
+            setattr(self, name, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[name] = value
+
+    @classmethod
+    def from_dict(cls, data):
+        """Cria um artigo a partir de um dicionário (por exemplo, lido de JSON)"""
+        article = cls.__new__(cls)
+        article.extra = None
+        for name, value in data.items():
+            article._set(name, value)
+        return article
+
+    @classmethod
+    def from_json(cls, text):
+        """Cria um artigo a partir do texto JSON de um arquivo de data/raw"""
+        return cls.from_dict(json.loads(text))
+
+    def to_dict(self):
+        """Dicionário com os campos presentes, na ordem de ARTICLE_FIELDS (e os extras ao final)"""
+        data = {}
+        for name in ARTICLE_FIELDS:
+            try:
+                data[name] = getattr(self, name)
+            except AttributeError:
+                continue
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def to_json(self, indent=4):
+        """Texto JSON do artigo, no formato dos arquivos de data/raw"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    def missing_fields(self, fields=REQUIRED_FIELDS):
+        """Campos obrigatórios ausentes ou vazios"""
+        return [name for name in fields if not getattr(self, name, None)]
+
+    # Interface de leitura de dicionário
+
+    def keys(self):
+        return list(self.to_dict())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __contains__(self, name):
+        if name in _FIELD_SET:
+            return hasattr(self, name)
+        return bool(self.extra) and name in self.extra
+
+    def __getitem__(self, name):
+        if name in _FIELD_SET:
+            try:
+                return getattr(self, name)
+            except AttributeError:
+                raise KeyError(name) from None
+        if self.extra and name in self.extra:
+            return self.extra[name]
+        raise KeyError(name)
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __eq__(self, other):
+        if not isinstance(other, Article):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    # Como um dicionário, o artigo é mutável e comparado pelo conteúdo, então
+    # não tem hash: para conjuntos e chaves de dicionário, use o id do artigo
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Article(id={self.get('id')!r}, source={self.get('source')!r}, title={self.get('title')!r})"
@@ -5,6 +5,7 @@ import re
 import string
 from datetime import datetime
 import hashlib
+from .article import Article
 
 def setup_logging(log_level=logging.INFO):
     """
@@ -89,12 +90,41 @@ def generate_article_id(article_data):
     # Gerar hash MD5 do texto base
     return hashlib.md5(base.encode('utf-8')).hexdigest()
 
-def save_article(article_data, directory='data/raw'):
+def generate_content_hash(article_data, version=''):
     """
-    Salva dados de um artigo em um arquivo JSON.
+    Gera um hash do conteúdo de um artigo para detectar alterações.
     
     Args:
         article_data: Dicionário com dados do artigo
+        version: Versão do processamento (alterá-la invalida os hashes anteriores)
+        
+    Returns:
+        Hash SHA-256 de (conteúdo, título, resumo, versão)
+    """
+    fields = [article_data.get(key) or '' for key in ('content', 'title', 'abstract')]
+    base = json.dumps(fields + [version], ensure_ascii=False)
+    return hashlib.sha256(base.encode('utf-8')).hexdigest()
+
+def text_fingerprint(text):
+    """
+    Gera uma impressão digital compacta de um texto, para reconhecer
+    documentos já incorporados a estatísticas acumuladas entre execuções.
+    
+    Args:
+        text: Texto do documento
+        
+    Returns:
+        Inteiro sem sinal de 64 bits (BLAKE2b)
+    """
+    data = text.encode('utf-8') if isinstance(text, str) else b''
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+def save_article(article, directory='data/raw'):
+    """
+    Salva dados de um artigo em um arquivo JSON.
+    
+    Args:
+        article: Artigo coletado (Article); recebe o ID e a data de coleta
         directory: Diretório onde salvar o arquivo
         
     Returns:
@@ -103,37 +133,32 @@ def save_article(article_data, directory='data/raw'):
     # Garantir que o diretório exista
     ensure_dir(directory)
     
-    # Gerar ID para o artigo
-    article_id = generate_article_id(article_data)
-    
     # Adicionar ID e timestamp ao artigo
-    article_data['id'] = article_id
-    article_data['collected_at'] = datetime.now().isoformat()
+    article.id = generate_article_id(article)
+    article.collected_at = datetime.now().isoformat()
     
     # Definir caminho do arquivo
-    file_path = os.path.join(directory, f'article_{article_id}.json')
+    file_path = os.path.join(directory, f'article_{article.id}.json')
     
     # Salvar como JSON
     with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(article_data, f, ensure_ascii=False, indent=4)
+        f.write(article.to_json())
     
     return file_path
 
-def load_articles(directory='data/raw'):
+def iter_articles(directory='data/raw'):
     """
-    Carrega todos os artigos salvos em um diretório.
+    Percorre os artigos salvos em um diretório, carregando um arquivo por vez.
     
     Args:
         directory: Diretório contendo os arquivos JSON dos artigos
         
-    Returns:
-        Lista de dicionários com dados dos artigos
+    Yields:
+        Article com os dados de cada artigo
     """
-    articles = []
-    
     # Verificar se o diretório existe
     if not os.path.exists(directory):
-        return articles
+        return
     
     # Listar arquivos JSON no diretório
     for filename in os.listdir(directory):
@@ -141,12 +166,26 @@ def load_articles(directory='data/raw'):
             file_path = os.path.join(directory, filename)
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    article_data = json.load(f)
-                    articles.append(article_data)
+                    article = Article.from_json(f.read())
             except Exception as e:
                 logging.error(f"Erro ao carregar artigo {file_path}: {str(e)}")
+                continue
+            missing = article.missing_fields()
+            if missing:
+                logging.warning(f"Artigo {file_path} sem os campos {', '.join(missing)}")
+            yield article
+
+def load_articles(directory='data/raw'):
+    """
+    Carrega todos os artigos salvos em um diretório.
     
-    return articles
+    Args:
+        directory: Diretório contendo os arquivos JSON dos artigos
+        
+    Returns:
+        Lista de Article com os dados dos artigos
+    """
+    return list(iter_articles(directory))
 
 def extract_date(date_str):
     """
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class SplitProcessor:
+    """Pré-processamento mínimo (minúsculas e espaços), sem os recursos do NLTK"""
+
+    def preprocess_text(self, text):
+        return text.lower().split()
+
+@pytest.fixture
+def text_processor():
+    return SplitProcessor()
@@ -0,0 +1,104 @@
+import pytest
+
+from src.processors.aggregates import TrendAggregates
+from src.processors.bursts import BurstDetector, SMOOTHING, month_index
+
+def article(article_id, month, keywords):
+    return {'id': article_id, 'date': f'{month}-15', 'source': 'Fonte', 'categories': [], 'keywords': keywords}
+
+def expected_baselines(months):
+    """Média móvel exponencial por mês de calendário, avaliada no último mês fechado"""
+    closed = sorted(months)[:-1]
+    last = month_index(closed[-1])
+    rates = {}
+    for month in closed:
+        articles = months[month]
+        for keyword in {keyword for keywords in articles for keyword in keywords}:
+            share = sum(keyword in keywords for keywords in articles) / len(articles)
+            rates[keyword] = rates.get(keyword, 0.0) + SMOOTHING * (1 - SMOOTHING) ** (last - month_index(month)) * share
+    return rates
+
+@pytest.fixture
+def stores(tmp_path):
+    aggregates = TrendAggregates(str(tmp_path / 'aggregates.sqlite'))
+    bursts = BurstDetector(str(tmp_path / 'bursts.sqlite'))
+    yield aggregates, bursts
+    aggregates.close()
+    bursts.close()
+
+def test_decay_follows_calendar_months(stores):
+    aggregates, bursts = stores
+    aggregates.update([
+        article('1', '2020-01', ['a']), article('2', '2020-01', ['b']),
+        article('3', '2020-04', ['a']), article('4', '2020-06', ['b']),
+    ])
+
+    assert bursts.update(aggregates) == 2
+    assert bursts.months == 4
+    assert bursts.last_month == '2020-04'
+    assert bursts.baselines(['a', 'b']) == pytest.approx(expected_baselines({
+        '2020-01': [['a'], ['b']], '2020-04': [['a']], '2020-06': [['b']],
+    }))
+
+def test_repeated_update_is_a_no_op(stores):
+    aggregates, bursts = stores
+    aggregates.update([article('1', '2020-01', ['a']), article('2', '2020-02', ['a'])])
+    bursts.update(aggregates)
+    before = bursts.baselines(['a'])
+
+    aggregates.update([article('1', '2020-01', ['a']), article('2', '2020-02', ['a'])])
+    assert bursts.update(aggregates) == 0
+    assert bursts.baselines(['a']) == before
+
+def test_late_month_rebuilds_baselines(stores):
+    aggregates, bursts = stores
+    aggregates.update([
+        article('1', '2020-01', ['a']), article('2', '2020-03', ['b']), article('3', '2020-04', ['c']),
+    ])
+    bursts.update(aggregates)
+
+    aggregates.update([article('4', '2020-02', ['a'])])
+    assert bursts.update(aggregates) == 3
+    assert bursts.baselines(['a', 'b']) == pytest.approx(expected_baselines({
+        '2020-01': [['a']], '2020-02': [['a']], '2020-03': [['b']], '2020-04': [['c']],
+    }))
+
+def test_reprocessed_folded_month_rebuilds_baselines(stores):
+    aggregates, bursts = stores
+    aggregates.update([
+        article('1', '2020-01', ['a']), article('2', '2020-01', ['a']), article('3', '2020-02', ['c']),
+    ])
+    bursts.update(aggregates)
+
+    aggregates.update([article('2', '2020-01', ['b'])])
+    bursts.update(aggregates)
+    assert bursts.baselines(['a', 'b']) == pytest.approx(expected_baselines({
+        '2020-01': [['a'], ['b']], '2020-02': [['c']],
+    }))
+
+def test_month_by_month_updates_match_a_single_fold(stores, tmp_path):
+    aggregates, bursts = stores
+    history = {}
+    for i in range(60):
+        month = f'{2000 + i // 12}-{i % 12 + 1:02d}'
+        keywords = ['a'] if i % 2 else ['b']
+        history[month] = [keywords]
+        aggregates.update([article(str(i), month, keywords)])
+        bursts.update(aggregates)
+
+    # Mais meses que RENORMALIZE_MONTHS: os pesos foram renormalizados no caminho
+    assert bursts.months == 59
+    assert bursts.baselines(['a', 'b']) == pytest.approx(expected_baselines(history))
+
+    with BurstDetector(str(tmp_path / 'single.sqlite')) as single:
+        single.update(aggregates)
+        assert single.baselines(['a', 'b']) == pytest.approx(bursts.baselines(['a', 'b']))
+
+def test_emerging_keywords_exceed_their_baseline(stores):
+    aggregates, bursts = stores
+    records = [article(f'{m}-{i}', f'2020-0{m}', ['common']) for m in range(1, 4) for i in range(5)]
+    records += [article(f'new-{i}', '2020-04', ['common', 'new']) for i in range(5)]
+    aggregates.update(records)
+    bursts.update(aggregates)
+
+    assert [keyword for keyword, *_ in bursts.emerging(aggregates)] == ['new']
@@ -0,0 +1,50 @@
+from src.processors.corpus import CorpusWriter, TextCorpus
+
+def article(article_id, title, content=''):
+    return {'id': article_id, 'clean_title': title, 'clean_content': content}
+
+def test_append_points_ids_to_the_latest_version(tmp_path):
+    path = str(tmp_path / 'corpus')
+    with CorpusWriter(path) as writer:
+        writer.write_batch([article(str(i), f'titulo {i}') for i in range(8)])
+    with CorpusWriter(path, append=True) as writer:
+        assert writer.write_batch([article('3', 'titulo novo', 'conteudo')]) == [8]
+
+    with TextCorpus(path) as corpus:
+        assert len(corpus) == 9
+        assert corpus.text(corpus.position('3'), 'clean_title') == 'titulo novo'
+        assert corpus.text(corpus.position('4'), 'clean_title') == 'titulo 4'
+
+def test_append_compacts_superseded_versions(tmp_path):
+    path = str(tmp_path / 'corpus')
+    with CorpusWriter(path) as writer:
+        writer.write_batch([article(str(i), f'titulo {i}', f'conteudo {i}') for i in range(4)])
+    with CorpusWriter(path, append=True) as writer:
+        writer.write_batch([article('1', 'titulo 1 v2'), article('2', 'titulo 2 v2', 'conteudo 2 v2')])
+
+    # Duas versões substituídas em seis: compactado ao reabrir
+    with CorpusWriter(path, append=True) as writer:
+        assert len(writer.ids) == 4
+        positions = writer.write_batch([article('9', 'titulo 9')])
+    assert positions == [4]
+
+    with TextCorpus(path) as corpus:
+        assert list(corpus.ids) == ['0', '3', '1', '2', '9']
+        texts = {article_id: (corpus.text(corpus.position(article_id), 'clean_title'),
+                              corpus.text(corpus.position(article_id), 'clean_content'))
+                 for article_id in corpus.ids}
+    assert texts == {
+        '0': ('titulo 0', 'conteudo 0'), '3': ('titulo 3', 'conteudo 3'), '1': ('titulo 1 v2', ''),
+        '2': ('titulo 2 v2', 'conteudo 2 v2'), '9': ('titulo 9', ''),
+    }
+
+def test_non_append_run_rewrites_the_corpus(tmp_path):
+    path = str(tmp_path / 'corpus')
+    with CorpusWriter(path) as writer:
+        writer.write_batch([article('1', 'antigo')])
+    with CorpusWriter(path) as writer:
+        writer.write_batch([article('2', 'novo')])
+
+    with TextCorpus(path) as corpus:
+        assert list(corpus.ids) == ['2']
+        assert corpus.text(0, 'clean_title') == 'novo'
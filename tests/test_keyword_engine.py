@@ -0,0 +1,69 @@
+import numpy as np
+
+from src.processors.keyword_engine import TfidfKeywordExtractor
+
+TEXTS = ['alpha beta gamma', 'beta delta', 'gamma epsilon']
+IDS = ['a', 'b', 'c']
+
+def frequencies(extractor):
+    """Frequência de documentos de cada termo"""
+    return {term: int(extractor.document_frequency[i]) for term, i in extractor.vocabulary.items()}
+
+def test_repeated_run_does_not_change_statistics(text_processor):
+    extractor = TfidfKeywordExtractor(text_processor)
+    first = extractor.extract(TEXTS, ids=IDS)
+    before = frequencies(extractor)
+
+    assert extractor.extract(TEXTS, ids=IDS) == first
+    assert frequencies(extractor) == before
+    assert extractor.n_documents == 3
+
+def test_edited_article_replaces_previous_terms(text_processor):
+    extractor = TfidfKeywordExtractor(text_processor)
+    extractor.extract(TEXTS, ids=IDS)
+    extractor.extract(['alpha zeta'], ids=['a'])
+
+    assert extractor.n_documents == 3
+    assert frequencies(extractor) == {
+        'alpha': 1, 'beta': 1, 'gamma': 1, 'delta': 1, 'epsilon': 1, 'zeta': 1
+    }
+
+def test_statistics_match_a_fresh_fit_after_edits(text_processor):
+    incremental = TfidfKeywordExtractor(text_processor)
+    incremental.extract(TEXTS, ids=IDS)
+    incremental.extract(['beta zeta zeta', 'gamma epsilon'], ids=['b', 'c'])
+
+    fresh = TfidfKeywordExtractor(text_processor)
+    fresh.extract(['alpha beta gamma', 'beta zeta zeta', 'gamma epsilon'], ids=IDS)
+
+    assert incremental.n_documents == fresh.n_documents
+    assert {t: f for t, f in frequencies(incremental).items() if f} == frequencies(fresh)
+
+def test_without_ids_each_distinct_text_is_a_document(text_processor):
+    extractor = TfidfKeywordExtractor(text_processor)
+    extractor.extract(['alpha beta', 'alpha beta', 'gamma delta'])
+    extractor.extract(['alpha beta'])
+
+    assert extractor.n_documents == 2
+    assert frequencies(extractor)['alpha'] == 1
+
+def test_save_and_load_keep_per_article_statistics(tmp_path, text_processor):
+    path = str(tmp_path / 'keyword_idf.npz')
+    extractor = TfidfKeywordExtractor(text_processor)
+    extractor.extract(TEXTS, ids=IDS)
+    extractor.save(path)
+
+    loaded = TfidfKeywordExtractor.load(path, text_processor)
+    assert loaded.vocabulary == extractor.vocabulary
+    assert np.array_equal(loaded.document_frequency, extractor.document_frequency)
+
+    # A edição depois de recarregar ainda subtrai os termos da versão salva
+    loaded.extract(['alpha zeta'], ids=['a'])
+    assert frequencies(loaded)['gamma'] == 1
+    assert loaded.n_documents == 3
+
+def test_top_terms_prefer_rare_terms(text_processor):
+    extractor = TfidfKeywordExtractor(text_processor)
+    keywords = extractor.extract(['common rare', 'common other', 'common third'], top_n=1, ids=IDS)
+
+    assert keywords == [['rare'], ['other'], ['third']]
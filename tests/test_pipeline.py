@@ -0,0 +1,32 @@
+import pandas as pd
+
+from src.processors.pipeline import record_text, select_text, select_text_fields, select_text_series
+
+RECORDS = [
+    # Google Scholar: conteúdo vazio, só resumo
+    {'clean_title': 'titulo', 'clean_abstract': 'resumo', 'clean_content': ''},
+    # Tradução do conteúdo vazia, resumo traduzido
+    {'clean_title': 'titulo', 'clean_abstract': 'resumo', 'clean_content': '',
+     'translated_content': '', 'translated_abstract': 'resumo traduzido', 'translated_title': 'titulo traduzido'},
+    # Só o título traduzido
+    {'clean_title': 'titulo', 'clean_abstract': '', 'clean_content': '',
+     'translated_content': None, 'translated_abstract': None, 'translated_title': 'titulo traduzido'},
+    # Conteúdo disponível
+    {'clean_title': 'titulo', 'clean_abstract': 'resumo', 'clean_content': 'conteudo'},
+    # Nada além do título
+    {'clean_title': 'titulo', 'clean_abstract': None, 'clean_content': None},
+]
+
+EXPECTED = ['resumo', 'resumo traduzido', 'titulo traduzido', 'conteudo', 'titulo']
+
+def test_select_text_skips_empty_and_missing_fields():
+    df = pd.DataFrame(RECORDS)
+    assert [select_text(row, df.columns) for _, row in df.iterrows()] == EXPECTED
+
+def test_vectorized_selection_matches_select_text():
+    df = pd.DataFrame(RECORDS)
+    assert select_text_series(df).tolist() == EXPECTED
+    assert [df.at[i, column] for i, column in select_text_fields(df).items()] == EXPECTED
+
+def test_stream_records_use_the_batch_selection():
+    assert [record_text(record) for record in RECORDS] == EXPECTED
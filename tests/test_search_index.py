@@ -0,0 +1,99 @@
+import sqlite3
+
+import pytest
+
+from src.processors.search_index import SearchIndex
+
+def article(article_id, text, source='Fonte', date='2024-01-15'):
+    return {'id': article_id, 'title': text, 'url': f'https://exemplo.com/{article_id}', 'source': source, 'date': date}
+
+def ranking(index, query):
+    return [(result['id'], round(result['score'], 9)) for result in index.search(query, limit=50)]
+
+FINAL = {
+    'a': 'facility management energy',
+    'b': 'energy sensors hvac',
+    'c': 'cleaning contracts',
+    'd': 'energy cleaning robots',
+    'e': 'security staff',
+}
+
+@pytest.fixture
+def open_index(tmp_path, text_processor):
+    def open_index(name='index.sqlite'):
+        return SearchIndex(str(tmp_path / name), text_processor)
+    return open_index
+
+def test_batched_updates_match_a_single_update(open_index):
+    with open_index('batched.sqlite') as batched:
+        batched.update([article('a', FINAL['a']), article('b', FINAL['b'])])
+        batched.update([article('c', FINAL['c'])])
+        batched.update([article('d', FINAL['d']), article('e', FINAL['e'])])
+        incremental = ranking(batched, 'energy cleaning')
+
+    with open_index('single.sqlite') as single:
+        single.update([article(article_id, text) for article_id, text in FINAL.items()])
+        assert ranking(single, 'energy cleaning') == incremental
+
+def test_pending_postings_are_searchable_and_persisted_on_close(open_index):
+    index = open_index()
+    index.update([article(article_id, text) for article_id, text in FINAL.items()])
+    results = ranking(index, 'energy')
+    assert {article_id for article_id, _ in results} == {'a', 'b', 'd'}
+    index.close()
+
+    with open_index() as reopened:
+        assert ranking(reopened, 'energy') == results
+        assert reopened.n_documents == len(FINAL)
+
+def test_unchanged_articles_are_not_reindexed(open_index):
+    with open_index() as index:
+        assert index.update([article('a', FINAL['a'])]) == 1
+        assert index.update([article('a', FINAL['a'])]) == 0
+        assert len(index.lengths) == 1
+
+def test_edited_articles_match_a_fresh_index(open_index):
+    with open_index('edited.sqlite') as edited:
+        edited.update([article(article_id, 'old text energy') for article_id in FINAL])
+        edited.update([article(article_id, text) for article_id, text in FINAL.items()])
+        assert edited.n_documents == len(FINAL)
+        results = sorted(ranking(edited, 'energy cleaning text'))
+
+    with open_index('fresh.sqlite') as fresh:
+        fresh.update([article(article_id, text) for article_id, text in FINAL.items()])
+        assert sorted(ranking(fresh, 'energy cleaning text')) == results
+
+def test_compaction_renumbers_documents_and_keeps_results(open_index, tmp_path):
+    with open_index() as index:
+        index.update([article(article_id, text) for article_id, text in FINAL.items()])
+        index.flush()
+        # Um documento desativado em seis: abaixo do limite da compactação automática
+        index.update([article('a', 'energy audit')])
+        before = ranking(index, 'energy cleaning robots')
+
+        assert index.compact() == 1
+        assert len(index.lengths) == index.n_documents == len(FINAL)
+        assert ranking(index, 'energy cleaning robots') == before
+        docs, _ = index.postings('management')
+        assert len(docs) == 0
+
+    with sqlite3.connect(str(tmp_path / 'index.sqlite')) as conn:
+        docs = [row[0] for row in conn.execute('SELECT doc FROM documents ORDER BY doc')]
+    assert docs == list(range(len(FINAL)))
+
+def test_flush_compacts_when_too_many_documents_are_inactive(open_index):
+    with open_index() as index:
+        index.update([article(article_id, text) for article_id, text in FINAL.items()])
+        index.update([article(article_id, text + ' revised') for article_id, text in FINAL.items()])
+        index.flush()
+        assert len(index.lengths) == len(FINAL)
+
+def test_filters_by_source_and_date(open_index):
+    with open_index() as index:
+        index.update([
+            article('a', 'energy', source='A', date='2020-05-01'),
+            article('b', 'energy', source='B', date='2023-05-01'),
+        ])
+        assert [r['id'] for r in index.search('energy', sources=['B'])] == ['b']
+        assert [r['id'] for r in index.search('energy', since='2021')] == ['b']
+        assert [r['id'] for r in index.search('energy', until='2020-06')] == ['a']
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('sklearn')
+
+from src.processors.topics import TopicModel
+
+TEXTS = [
+    'energy lighting sensors', 'energy hvac sensors', 'lighting hvac energy',
+    'cleaning contracts staff', 'cleaning security staff', 'security contracts cleaning',
+]
+IDS = [str(i) for i in range(len(TEXTS))]
+
+def test_repeated_assign_keeps_model_and_labels(text_processor):
+    model = TopicModel(n_topics=2, text_processor=text_processor)
+    first = model.assign(TEXTS, IDS)
+    centers = model.kmeans.cluster_centers_.copy()
+    frequency = model.statistics.document_frequency.copy()
+
+    assert model.assign(TEXTS, IDS) == first
+    assert np.array_equal(model.kmeans.cluster_centers_, centers)
+    assert np.array_equal(model.statistics.document_frequency, frequency)
+    assert model.n_documents == len(TEXTS)
+
+def test_edited_article_updates_idf_without_refitting(text_processor):
+    model = TopicModel(n_topics=2, text_processor=text_processor)
+    model.assign(TEXTS, IDS)
+    centers = model.kmeans.cluster_centers_.copy()
+
+    model.assign(['energy sensors'], ['0'])
+
+    assert model.n_documents == len(TEXTS)
+    assert np.array_equal(model.kmeans.cluster_centers_, centers)
+
+    fresh = TopicModel(n_topics=2, text_processor=text_processor)
+    fresh.assign(['energy sensors'] + TEXTS[1:], IDS)
+    assert np.array_equal(model.statistics.document_frequency, fresh.statistics.document_frequency)
+
+def test_save_and_load_keep_statistics(tmp_path, text_processor):
+    path = str(tmp_path / 'topic_model.joblib')
+    model = TopicModel(n_topics=2, text_processor=text_processor)
+    topics = model.assign(TEXTS, IDS)
+    model.save(path)
+
+    loaded = TopicModel.load(path, n_topics=2, text_processor=text_processor)
+    assert loaded.n_documents == len(TEXTS)
+    assert loaded.assign(TEXTS, IDS) == topics
+
+def test_model_with_other_number_of_topics_is_replaced(tmp_path, text_processor):
+    path = str(tmp_path / 'topic_model.joblib')
+    model = TopicModel(n_topics=2, text_processor=text_processor)
+    model.assign(TEXTS, IDS)
+    model.save(path)
+
+    loaded = TopicModel.load(path, n_topics=3, text_processor=text_processor)
+    assert loaded.n_topics == 3
+    assert loaded.n_documents == 0
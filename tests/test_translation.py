@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip('requests')
+
+from src.processors import translator
+from src.processors.translation_cache import TranslationCache
+
+def test_set_many_stores_all_entries(tmp_path):
+    with TranslationCache(str(tmp_path / 'translations.sqlite')) as cache:
+        cache.set_many([(f'text {i}', 'en', 'pt', 'official', f'texto {i}') for i in range(3)])
+        assert [cache.get(f'text {i}', 'en', 'pt', 'official') for i in range(3)] == ['texto 0', 'texto 1', 'texto 2']
+        assert cache.total_bytes == sum(len(f'text {i}') + len(f'texto {i}') for i in range(3))
+
+def test_set_many_evicts_beyond_the_size_limit(tmp_path):
+    with TranslationCache(str(tmp_path / 'translations.sqlite'), max_bytes=40) as cache:
+        cache.set_many([(f'text {i}', 'en', 'pt', 'official', f'texto {i}') for i in range(6)])
+        assert cache.total_bytes <= 40
+
+def test_documents_with_failed_chunks_are_not_translated(monkeypatch):
+    monkeypatch.setattr(translator, '_lookup_all', lambda chunks, *args: ({}, list(dict.fromkeys(chunks))))
+    monkeypatch.setattr(
+        translator, '_translate_uncached',
+        lambda pending, *args: {chunk: chunk.upper() for chunk in pending if 'fail' not in chunk}
+    )
+
+    assert translator.translate_documents(['Hello there. Good day.', 'This will fail. Ok.']) == [
+        'HELLO THERE. GOOD DAY.', None
+    ]